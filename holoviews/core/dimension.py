@@ -228,9 +228,9 @@ class LabelledData(param.Parameterized):
         type and group or type, group, and label.
         """
         if isinstance(spec, type): return isinstance(self, spec)
-        specification = (self.__class__.__name__, self.group, self.label)
-        identifier_specification = tuple(valid_identifier(ident) for ident in specification)
         split_spec = tuple(spec.split('.')) if not isinstance(spec, tuple) else spec
+        specification = (self.__class__.__name__, self.group, self.label)[:len(split_spec)]
+        identifier_specification = tuple(valid_identifier(ident) for ident in specification)
         split_spec, nocompare = zip(*((None, True) if s == '*' or s is None else (s, False)
                                     for s in split_spec))
         if all(nocompare): return True
@@ -393,6 +393,7 @@ class Dimensioned(LabelledData):
         self._cached_index_names = [d.name for d in self.key_dimensions]
         self._cached_value_names = [d.name for d in self.value_dimensions]
         self._settings = None
+        self._ranges = {}
 
 
     def _valid_dimensions(self, dimensions):
@@ -527,18 +528,29 @@ class Dimensioned(LabelledData):
 
         If data_range is True, the data may be used to try and infer
         the appropriate range. Otherwise, (None,None) is returned to
-        indicate that no range is defined.
+        indicate that no range is defined. Ranges inferred from the
+        data are cached per dimension, as the data of an object is
+        not modified after construction.
         """
         dimension = self.get_dimension(dim)
         if dimension.range != (None, None):
             return dimension.range
         elif not data_range:
             return (None, None)
+        if dimension.name not in self._ranges:
+            self._ranges[dimension.name] = self._data_range(dimension)
+        return self._ranges[dimension.name]
+
+
+    def _data_range(self, dimension):
+        """
+        Computes the range of the values along the supplied Dimension.
+        """
         dim_vals = self.dimension_values(dimension.name)
         try:
             return np.min(dim_vals), np.max(dim_vals)
         except:
-            if dim in self.dimensions() and len(dim_vals):
+            if dimension in self.dimensions() and len(dim_vals):
                 if not self._sorted:
                     dim_vals = sorted(dim_vals)
                 return (dim_vals[0], dim_vals[-1])
@@ -546,6 +558,11 @@ class Dimensioned(LabelledData):
                 return (None, None)
 
 
+    def __setstate__(self, d):
+        d.setdefault('_ranges', {})
+        super(Dimensioned, self).__setstate__(d)
+
+
     def __repr__(self):
         return PrettyPrinter.pprint(self)
 
@@ -1,3 +1,7 @@
+from collections import deque
+from itertools import product
+from multiprocessing import Pool, cpu_count
+from multiprocessing.pool import ThreadPool
 from numbers import Number
 import numpy as np
 
@@ -58,7 +62,9 @@ class Element(ViewableElement, Composable, Overlayable):
         Class method to collapse a list of data matching the
         data format of the Element type. By implementing this
         method HoloMap can collapse multiple Elements of the
-        same type. The kwargs are passed to the collapse
+        same type. Array data may also be supplied stacked into
+        a single array along the first axis, as returned by
+        HoloMap.stack. The kwargs are passed to the collapse
         function. The collapse function must support the numpy
         style axis selection. Valid function include:
         np.mean, np.sum, np.product, np.std,
@@ -240,10 +246,89 @@ class HoloMap(UniformNdMapping):
     A HoloMap can hold any number of DataLayers indexed by a list of
     dimension values. It also has a number of properties, which can find
     the x- and y-dimension limits and labels.
+
+    A HoloMap may also be used to hold a stream of elements, which are
+    added using the append method. The number of elements retained
+    may be bounded by the max_length and window parameters, evicting
+    the oldest elements as new elements are inserted. Callbacks
+    registered using the subscribe method are notified whenever an
+    element is appended, e.g. allowing an existing plot to display
+    the newest element via its stream method.
     """
 
+    max_length = param.Integer(default=None, allow_None=True, bounds=(1, None), doc="""
+        The maximum number of elements held by the HoloMap. If set,
+        the oldest elements are evicted as new elements are added.""")
+
+    window = param.Number(default=None, allow_None=True, doc="""
+        The maximum span of the values along the first key dimension.
+        If set, elements with keys further than the window from the
+        most recent key are evicted as new elements are added.""")
+
     data_type = (ViewableElement, UniformNdMapping)
 
+    def __init__(self, initial_items=None, **params):
+        self._subscribers = []
+        super(HoloMap, self).__init__(initial_items, **params)
+
+
+    def _add_item(self, dim_vals, data, sort=True):
+        super(HoloMap, self)._add_item(dim_vals, data, sort)
+        if self.max_length is not None or self.window is not None:
+            self._evict()
+
+
+    def _evict(self):
+        "Evicts the oldest elements exceeding the max_length or window"
+        data = self.data
+        if self.max_length is not None:
+            while len(data) > self.max_length:
+                data.popitem(last=False)
+        if self.window is not None:
+            latest = next(reversed(data))[0]
+            while len(data) > 1 and latest - next(iter(data))[0] > self.window:
+                data.popitem(last=False)
+        self._key_arrays = {}
+
+
+    def append(self, key, element):
+        """
+        Appends an element with a key following the current last key,
+        which avoids any sorting of the keys. Any subscribers are
+        notified of the newly appended element.
+        """
+        if not isinstance(key, tuple): key = (key,)
+        if not self._in_order(key):
+            raise ValueError("Appended key %r does not follow the last "
+                             "key of the %s." % (key, type(self).__name__))
+        self._add_item(key, element, sort=False)
+        for subscriber in self._subscribers:
+            subscriber(key, element)
+
+
+    def subscribe(self, callback):
+        """
+        Registers a callback, which is called with the key and element
+        whenever an element is appended.
+        """
+        self._subscribers.append(callback)
+
+
+    def unsubscribe(self, callback):
+        "Removes a previously registered callback"
+        self._subscribers.remove(callback)
+
+
+    def __getstate__(self):
+        state = super(HoloMap, self).__getstate__()
+        state['_subscribers'] = []
+        return state
+
+
+    def __setstate__(self, d):
+        d.setdefault('_subscribers', [])
+        super(HoloMap, self).__setstate__(d)
+
     @property
     def xlabel(self):
         return self.last.xlabel
@@ -469,11 +554,66 @@ class HoloMap(UniformNdMapping):
             if isinstance(function, MapOperation):
                 collapsed[key] = function(group, **kwargs)
             else:
-                data = group.type.collapse_data([el.data for el in group], function, **kwargs)
-                collapsed[key] = group.last.clone(data)
+                data = group.stack() if group._stackable() else [el.data for el in group]
+                collapsed[key] = group.last.clone(group.type.collapse_data(data, function, **kwargs))
         return collapsed if self.ndims > 1 else collapsed.last
 
 
+    def _stackable(self):
+        """
+        Whether the Elements hold in-memory arrays of the same shape
+        and type. Memory mapped data is not stacked so that it does
+        not have to be loaded into memory at once.
+        """
+        frames = self.values()
+        if not frames or not isinstance(frames[0].data, np.ndarray):
+            return False
+        shape, dtype = frames[0].data.shape, frames[0].data.dtype
+        return all(isinstance(f.data, np.ndarray) and not isinstance(f.data, np.memmap)
+                   and f.data.shape == shape and f.data.dtype == dtype for f in frames)
+
+
+    def stack(self):
+        """
+        Returns the data of all the Elements as a single array with
+        the frames along the first axis. If the frames are evenly
+        spaced views into the same array, e.g. the slices of a three
+        dimensional array, a read-only view of that array is returned
+        without copying, otherwise the frames are copied into a new
+        array. The data of the Elements themselves is left untouched.
+        """
+        if not self._stackable():
+            raise ValueError("Only Elements holding in-memory arrays of "
+                             "the same shape and type may be stacked.")
+        arrays = [f.data for f in self.values()]
+        view = self._stacked_view(arrays)
+        return np.array(arrays) if view is None else view
+
+
+    @staticmethod
+    def _stacked_view(arrays):
+        """
+        Returns a view stacking the supplied arrays along a new first
+        axis if they are evenly spaced views into the same buffer,
+        otherwise returns None.
+        """
+        def root(arr):
+            while isinstance(arr.base, np.ndarray):
+                arr = arr.base
+            return arr.base if arr.base is not None else arr
+        first, base = arrays[0], root(arrays[0])
+        if any(a.strides != first.strides or root(a) is not base for a in arrays):
+            return None
+        addresses = [a.__array_interface__['data'][0] for a in arrays]
+        step = addresses[1] - addresses[0] if len(arrays) > 1 else 0
+        if any(b - a != step for a, b in zip(addresses, addresses[1:])):
+            return None
+        view = np.lib.stride_tricks.as_strided(first, (len(arrays),) + first.shape,
+                                               (step,) + first.strides)
+        view.flags.writeable = False
+        return view
+
+
     def sample(self, samples=[], bounds=None, **sample_values):
         """
         Sample each Element in the UniformNdMapping by passing either a list of
@@ -489,7 +629,7 @@ class HoloMap(UniformNdMapping):
         is the tuple (lower, upper) and the tuple (left, bottom,
         right, top) for 2D sampling.
         """
-        from ..element import Table, ItemTable
+        from ..element import Table, ItemTable, Raster
         dims = self.last.ndims
         if isinstance(samples, tuple) or np.isscalar(samples):
             if dims == 1:
@@ -513,11 +653,31 @@ class HoloMap(UniformNdMapping):
 
             samples = set(self.last.closest(linsamples))
 
-        sampled = self.clone([(k, view.sample(samples, **sample_values))
-                              for k, view in self.items()])
+        if samples and not sample_values and self._shared_raster(Raster):
+            # Compute the matrix indices once and apply them to every frame
+            samples = list(samples)
+            sampler = self.last._point_sampler(*zip(*samples))
+            sampled = self.clone([(k, view._sample_table(samples, sampler(view.data)))
+                                  for k, view in self.items()])
+        else:
+            sampled = self.clone([(k, view.sample(samples, **sample_values))
+                                  for k, view in self.items()])
         return sampled.table().reindex() if sampled.type in [ItemTable, Table] else sampled.table()
 
 
+    def _shared_raster(self, raster_type):
+        """
+        Whether all the Elements are of the supplied Raster type and
+        share the same data shape and extents.
+        """
+        if self.type is None or not issubclass(self.type, raster_type):
+            return False
+        frames = self.values()
+        shape, extents = frames[0].data.shape, frames[0].extents
+        return all(f.data.shape == shape and f.extents == extents
+                   for f in frames)
+
+
     def reduce(self, dimensions=None, function=None, **reduce_map):
         """
         Reduce each Element in the HoloMap using a function supplied
@@ -554,6 +714,251 @@ class HoloMap(UniformNdMapping):
 
 
 
+class DynamicItems(OrderedDict):
+    """
+    DynamicItems holds the keys of a DynamicMap, generating the
+    corresponding elements only when they are accessed. Generated
+    elements are retained in a least recently used cache bounded by
+    the cache_size of the DynamicMap.
+    """
+
+    def __init__(self, dmap, keys, callback=None):
+        self._dmap = dmap
+        self._cache = OrderedDict()
+        self.callback = dmap.callback if callback is None else callback
+        super(DynamicItems, self).__init__((k, None) for k in keys)
+
+
+    def __reduce__(self):
+        """
+        Only the keys and the callback are pickled, the cache is
+        dropped and the DynamicMap is reattached when it is unpickled.
+        """
+        return (self.__class__, (None, list(self.keys()), self.callback))
+
+
+    def __getitem__(self, key):
+        if not OrderedDict.__contains__(self, key):
+            raise KeyError(key)
+        if key in self._cache:
+            element = self._cache.pop(key)
+        else:
+            element = self.callback(*key)
+            self._cache[key] = element
+            try:
+                self._dmap._generated(key, element)
+            except:
+                self._cache.pop(key)
+                raise
+        self._cache[key] = element
+        while len(self._cache) > self._dmap.cache_size:
+            self._cache.popitem(last=False)
+        return element
+
+
+    def __setitem__(self, key, value):
+        OrderedDict.__setitem__(self, key, None)
+        if value is not None:
+            self._cache.pop(key, None)
+            self._cache[key] = value
+
+
+    def get(self, key, default=None):
+        return self[key] if key in self else default
+
+
+    def pop(self, key, default=None):
+        if key not in self:
+            return default
+        value = self[key]
+        OrderedDict.pop(self, key)
+        self._cache.pop(key, None)
+        return value
+
+
+    def values(self):
+        return [self[k] for k in self]
+
+
+    def items(self):
+        return [(k, self[k]) for k in self]
+
+
+    def cached_values(self):
+        "Returns the elements that are currently cached"
+        return list(self._cache.values())
+
+
+
+class DynamicMap(HoloMap):
+    """
+    A DynamicMap is a HoloMap whose elements are generated on demand
+    by a callback, which is called with the values of a key and
+    returns the corresponding element. Unless initial items are
+    supplied, the keys of a DynamicMap are the Cartesian product of
+    the values declared on its key dimensions.
+
+    Elements are only computed when they are accessed, e.g. when a
+    particular frame is selected or displayed, and the most recently
+    accessed elements are held in a cache of bounded size. Ranges,
+    extents and traversals of a DynamicMap only take into account
+    the elements that have been generated so far.
+
+    Initial items with a value of None only define a key, leaving
+    the corresponding element to be generated when accessed.
+    """
+
+    callback = param.Callable(default=None, doc="""
+        The callable used to generate an element given the values of
+        a key as positional arguments.""")
+
+    cache_size = param.Integer(default=100, bounds=(1, None), doc="""
+        The maximum number of generated elements held in memory.""")
+
+    def __init__(self, initial_items=None, **params):
+        super(DynamicMap, self).__init__(None, **params)
+        if self.callback is None:
+            raise ValueError("DynamicMap requires a callback to generate its elements.")
+
+        frames = []
+        if isinstance(initial_items, DynamicItems):
+            keys = list(initial_items.keys())
+            if initial_items.callback is self.callback:
+                frames = list(initial_items._cache.items())
+        elif initial_items is not None:
+            items = initial_items.items() if hasattr(initial_items, 'items') else initial_items
+            frames = [(k if isinstance(k, tuple) else (k,), v) for k, v in items]
+            keys = [k for k, _ in frames]
+        else:
+            values = [d.values for d in self.key_dimensions]
+            if not all(values):
+                raise ValueError("DynamicMap requires values to be declared "
+                                 "on all key dimensions.")
+            keys = product(*values)
+
+        self.data = DynamicItems(self, sorted(keys, key=self._sort_key))
+        for key, element in frames:
+            if element is not None:
+                self.data[key] = element
+                self._generated(key, element)
+
+
+    def __setstate__(self, d):
+        super(DynamicMap, self).__setstate__(d)
+        self.data._dmap = self
+
+
+    def _generated(self, key, element):
+        "Validates a newly generated element"
+        if self._type is None:
+            self._type = type(element)
+        self._item_check(key, element)
+
+
+    def _frames(self):
+        """
+        Returns the elements generated so far, generating the first
+        element if none are available.
+        """
+        frames = self.data.cached_values()
+        if not frames and len(self):
+            frames = [self.data[next(iter(self.data))]]
+        return frames
+
+
+    @property
+    def type(self):
+        if self._type is None and len(self):
+            self._frames()
+        return self._type
+
+
+    @property
+    def deep_dimensions(self):
+        return self._frames()[0].dimensions() if len(self) else []
+
+
+    def traverse(self, fn, specs=None, full_breadth=True):
+        """
+        Traverses the DynamicMap and the elements generated so far,
+        without generating any further elements.
+        """
+        accumulator = []
+        if specs is None or any(self.matches(spec) for spec in specs):
+            accumulator.append(fn(self))
+        for el in self._frames():
+            accumulator += el.traverse(fn, specs, full_breadth)
+            if not full_breadth: break
+        return accumulator
+
+
+    def map(self, map_fn, specs=None):
+        """
+        Returns a DynamicMap which applies the map function to each
+        element as it is generated.
+        """
+        if specs is None or any(self.matches(spec) for spec in specs):
+            return super(DynamicMap, self).map(map_fn, specs)
+        callback = lambda *key: self.data[key].map(map_fn, specs)
+        return self.clone(callback=callback)
+
+
+    def _data_range(self, dimension):
+        if dimension.name in self._cached_index_names:
+            return super(DynamicMap, self)._data_range(dimension)
+        ranges = [el.range(dimension.name) for el in self._frames()
+                  if dimension.name in el.dimensions(label=True)]
+        try:
+            lower, upper = zip(*ranges)
+            return np.min(lower), np.max(upper)
+        except:
+            return (None, None)
+
+
+    def range(self, dim, data_range=True):
+        # Ranges change as further elements are generated
+        self._ranges = {}
+        return super(DynamicMap, self).range(dim, data_range)
+
+
+    def _frame_lims(self, lim):
+        "Combines the limits of the elements generated so far"
+        frames = self._frames()
+        lims = getattr(frames[0], lim)
+        for frame in frames[1:]:
+            frame_lims = getattr(frame, lim)
+            lims = find_minmax(lims, frame_lims) if frame_lims and lims else lims
+        return lims
+
+
+    @property
+    def xlim(self):
+        return self._frame_lims('xlim')
+
+
+    @property
+    def ylim(self):
+        return self._frame_lims('ylim')
+
+
+    @property
+    def zlim(self):
+        if not issubclass(self.type, Element3D):
+            return (None, None)
+        return self._frame_lims('zlim')
+
+
+
+def _collate_item(args):
+    """
+    Processes the data of a single Collator item, used to dispatch
+    the items of a Collator to a pool of worker processes.
+    """
+    collator, params, data = args
+    return collator(**params)._process_data(data)
+
+
+
 class Collator(NdMapping):
     """
     Collator is an NdMapping type which can merge any number
@@ -579,6 +984,31 @@ class Collator(NdMapping):
          The progress bar instance used to report progress. Set to
          None to disable progress bars.""")
 
+    loader = param.Callable(default=None, doc="""
+         Optional callable applied to each value by _process_data,
+         e.g. to load a pickled Layout from a file path. When
+         collating with the 'processes' backend the loader must be
+         picklable.""")
+
+    backend = param.ObjectSelector(default=None,
+                                   objects=[None, 'threads', 'processes'], doc="""
+         The execution backend used to process the data of each item.
+         None processes the items serially, 'threads' processes them
+         on a thread pool, which is suitable for I/O bound loading,
+         while 'processes' distributes them across a pool of worker
+         processes, which is suitable for CPU bound decoding. In all
+         cases the items are merged in the order of the Collator.""")
+
+    processes = param.Integer(default=None, allow_None=True, bounds=(1, None), doc="""
+         The number of workers used by the 'threads' and 'processes'
+         backends, defaulting to the number of available CPUs.""")
+
+    max_pending = param.Integer(default=None, allow_None=True, bounds=(1, None), doc="""
+         The maximum number of items being processed or awaiting
+         merging at any one time when using a parallel backend,
+         bounding the memory used by items loaded ahead of the merge.
+         Defaults to twice the number of workers.""")
+
     _deep_indexable = False
 
     def __call__(self, path_filters=[], merge=True):
@@ -593,11 +1023,9 @@ class Collator(NdMapping):
         ndmapping = NdMapping(key_dimensions=self.key_dimensions)
 
         num_elements = len(self)
-        for idx, (key, data) in enumerate(self.data.items()):
-            if isinstance(data, AttrTree):
-                data = data.filter(path_filters)
-            data = self._process_data(data)
-
+        items = [(key, data.filter(path_filters) if isinstance(data, AttrTree) else data)
+                 for key, data in self.data.items()]
+        for idx, (key, data) in enumerate(self._processed_items(items)):
             if merge:
                 dim_keys = zip(self._cached_index_names, key)
                 varying_keys = [(d, k) for d, k in dim_keys
@@ -667,12 +1095,51 @@ class Collator(NdMapping):
         return new_item
 
 
+    def _processed_items(self, items):
+        """
+        Generator applying _process_data to the supplied (key, data)
+        items using the selected backend. Items are yielded in the
+        supplied order while at most max_pending items are processed
+        ahead of the item being yielded.
+        """
+        if self.backend is None or len(items) < 2:
+            for key, data in items:
+                yield key, self._process_data(data)
+            return
+
+        if self.backend == 'threads':
+            pool = ThreadPool(self.processes)
+            process = self._process_data
+            args = [data for _, data in items]
+        else:
+            pool = Pool(self.processes)
+            process = _collate_item
+            params = {k: v for k, v in self.get_param_values(onlychanged=True)
+                      if k not in ['name', 'constant_dimensions',
+                                   'backend', 'progress_bar']}
+            args = [(type(self), params, data) for _, data in items]
+
+        max_pending = self.max_pending or 2 * (self.processes or cpu_count())
+        pending = deque()
+        try:
+            for (key, _), arg in zip(items, args):
+                if len(pending) == max_pending:
+                    yield pending[0][0], pending.popleft()[1].get()
+                pending.append((key, pool.apply_async(process, (arg,))))
+            while pending:
+                yield pending[0][0], pending.popleft()[1].get()
+        finally:
+            pool.terminate()
+            pool.join()
+
+
     def _process_data(self, data):
         """"
         Subclassable to apply some processing to the data elements
-        before filtering and merging them.
+        before filtering and merging them. By default applies the
+        loader, if one is supplied.
         """
-        return data
+        return data if self.loader is None else self.loader(data)
 
 
 
@@ -0,0 +1,411 @@
+"""
+Archive implements an on-disk container format for HoloMaps and
+Layouts of HoloMaps, storing the data of each Element as a separate
+.npy file alongside a JSON description of the dimensions, keys,
+group, label and options of the stored objects.
+
+Unlike a pickle, an Archive does not need to be loaded at once.
+Frames may be read individually by key, their data may be memory
+mapped and new frames may be appended, e.g. while collecting data
+with a Collector.
+"""
+
+import json
+import os
+
+import numpy as np
+
+import param
+
+from .boundingregion import BoundingBox
+from .dimension import Dimension
+from .element import Element, HoloMap, DynamicMap
+from .layout import Layout
+from .ndmapping import OrderedDict
+from .options import Store, Options, OptionTree
+
+try:
+    basestring = basestring
+except NameError:
+    basestring = str
+
+
+class _Unencodable(Exception):
+    "Raised when a value cannot be represented in the JSON metadata"
+
+
+def _encode(value):
+    """
+    Encodes a parameter value as JSON serializable data, tagging
+    tuples, Dimensions, BoundingBoxes and builtin types so they may
+    be restored by _decode.
+    """
+    if value is None or isinstance(value, (bool, int, float, basestring)):
+        return value
+    elif isinstance(value, np.generic):
+        return value.item()
+    elif isinstance(value, type) and value.__name__ in _builtin_types:
+        return {'__type__': value.__name__}
+    elif isinstance(value, tuple):
+        return {'__tuple__': [_encode(v) for v in value]}
+    elif isinstance(value, list):
+        return [_encode(v) for v in value]
+    elif isinstance(value, dict):
+        return {str(k): _encode(v) for k, v in value.items()}
+    elif isinstance(value, Dimension):
+        return {'__dimension__': {k: _encode(v) for k, v in
+                                  value.get_param_values(onlychanged=True)}}
+    elif isinstance(value, BoundingBox):
+        return {'__bounds__': list(value.lbrt())}
+    raise _Unencodable(repr(value))
+
+
+def _decode(value):
+    "Restores a value encoded by _encode"
+    if isinstance(value, list):
+        return [_decode(v) for v in value]
+    elif not isinstance(value, dict):
+        return value
+    elif '__type__' in value:
+        return _builtin_types[value['__type__']]
+    elif '__tuple__' in value:
+        return tuple(_decode(v) for v in value['__tuple__'])
+    elif '__dimension__' in value:
+        return Dimension(**{str(k): _decode(v) for k, v in value['__dimension__'].items()})
+    elif '__bounds__' in value:
+        l, b, r, t = value['__bounds__']
+        return BoundingBox(points=((l, b), (r, t)))
+    return {k: _decode(v) for k, v in value.items()}
+
+
+_builtin_types = {t.__name__: t for t in [int, float, str, bool, complex]}
+
+
+
+class Archive(param.Parameterized):
+    """
+    An Archive is a directory holding any number of HoloMaps,
+    optionally organized into a Layout by their paths. Each HoloMap
+    is stored in a subdirectory containing a .npy file per frame and
+    a frames.jsonl file with one line of JSON metadata per frame,
+    which is only ever appended to. The archive as a whole is
+    described by an index.json file.
+
+    >>> archive = Archive.save(hmap, '/tmp/hmap')   # doctest: +SKIP
+    >>> archive.frame((0.5,))                       # doctest: +SKIP
+    >>> archive.load(lazy=True)                     # doctest: +SKIP
+
+    Only Elements holding their data in a NumPy array may be stored.
+    Parameters and options that cannot be represented as JSON are
+    omitted with a warning.
+    """
+
+    path = param.String(default=None, doc="""
+        The directory holding the archive.""")
+
+    mmap_mode = param.ObjectSelector(default='r', objects=[None, 'r', 'r+', 'c'], doc="""
+        The mode used to memory map the data of loaded frames, where
+        None loads the data into memory. See numpy.load for details.""")
+
+    format_version = 1
+
+    def __init__(self, path, **params):
+        super(Archive, self).__init__(path=path, **params)
+        self._frames = {}
+        self._option_ids = {}
+        if os.path.isfile(self._index_path):
+            with open(self._index_path) as f:
+                self._index = json.load(f, object_pairs_hook=OrderedDict)
+            if self._index.get('version') != self.format_version:
+                raise ValueError("Unsupported archive version %r"
+                                 % self._index.get('version'))
+        else:
+            if not os.path.isdir(path):
+                os.makedirs(path)
+            self._index = OrderedDict([('version', self.format_version),
+                                       ('type', None), ('maps', [])])
+            self._write_index()
+
+
+    @classmethod
+    def save(cls, obj, path, **params):
+        """
+        Saves the supplied HoloMap or Layout of HoloMaps to a new
+        Archive at the given path, returning the Archive.
+        """
+        if os.path.exists(os.path.join(path, 'index.json')):
+            raise IOError("An archive already exists at %r" % path)
+        archive = cls(path, **params)
+        archive.update(obj)
+        return archive
+
+
+    @property
+    def _index_path(self):
+        return os.path.join(self.path, 'index.json')
+
+
+    def _write_index(self):
+        with open(self._index_path, 'w') as f:
+            json.dump(self._index, f, indent=1)
+
+
+    def _encode_params(self, obj, param_type=None):
+        """
+        Encodes the changed parameters of the supplied object, which
+        are restricted to the parameters of param_type if supplied.
+        """
+        names = (param_type or type(obj)).params()
+        params = dict(obj.get_param_values(onlychanged=True),
+                      group=obj.group, label=obj.label)
+        encoded = {}
+        for name, value in params.items():
+            if name == 'name' or name not in names:
+                continue
+            try:
+                encoded[name] = _encode(value)
+            except _Unencodable:
+                self.warning("Parameter %r of %s cannot be archived and was "
+                             "omitted." % (name, type(obj).__name__))
+        return encoded
+
+
+    ###########
+    # Writing #
+    ###########
+
+    @classmethod
+    def archivable(cls, element):
+        "Returns whether the supplied element may be archived"
+        if not isinstance(element, Element) or not isinstance(element.data, np.ndarray):
+            return False
+        return not cls._frame_array(element).dtype.hasobject
+
+
+    @classmethod
+    def _frame_array(cls, element):
+        """
+        Returns the array archived for the supplied element. HeatMaps
+        cannot be rebuilt from their dense array and are archived as
+        a record array of their sparse (x, y, z) samples instead.
+        """
+        from ..element import HeatMap
+        if not isinstance(element, HeatMap):
+            return element.data
+        sparse = element._data
+        keys = list(sparse.keys())
+        values = [v[0] if isinstance(v, tuple) else v for v in sparse.values()]
+        names = [d.name for d in element.key_dimensions + element.value_dimensions[:1]]
+        return np.rec.fromarrays([np.array([k[0] for k in keys]),
+                                  np.array([k[1] for k in keys]),
+                                  np.array(values, dtype=float)], names=names)
+
+
+    def update(self, obj):
+        """
+        Appends all the frames of the supplied HoloMap or Layout of
+        HoloMaps to the archive.
+        """
+        if isinstance(obj, HoloMap):
+            items = [(None, obj)]
+        elif isinstance(obj, Layout):
+            items = list(obj.data.items())
+        else:
+            raise ValueError("Only HoloMaps and Layouts of HoloMaps may be archived.")
+        if self._index['type'] is None:
+            self._index['type'] = type(obj).__name__
+            self._write_index()
+        for path, hmap in items:
+            if not isinstance(hmap, HoloMap):
+                raise ValueError("Layouts may only be archived if all their "
+                                 "items are HoloMaps.")
+            for key, element in hmap.data.items():
+                self.append(key, element, path, hmap)
+
+
+    def append(self, key, element, path=None, hmap=None):
+        """
+        Appends a single frame to the HoloMap at the given Layout path
+        (or to the archived HoloMap if no path is supplied). The
+        HoloMap the frame belongs to must be supplied if it is not
+        yet in the archive, to define its dimensions.
+        """
+        if not self.archivable(element):
+            raise ValueError("Only Elements holding their data in a NumPy "
+                             "array without Python objects may be archived.")
+        entry = self._map_entry(path)
+        if entry is None:
+            if hmap is None:
+                raise KeyError("No HoloMap archived at path %r" % (path,))
+            entry = self._add_map(path, hmap)
+        key = key if isinstance(key, tuple) else (key,)
+        frames = self._load_frames(entry)
+        if key in frames:
+            raise KeyError("Frame %r already archived at path %r" % (key, path))
+
+        filename = '%06d.npy' % len(frames)
+        data = self._frame_array(element)
+        np.save(os.path.join(self.path, entry['directory'], filename), data)
+        record = OrderedDict([('key', _encode(key)),
+                              ('type', type(element).__name__),
+                              ('params', self._encode_params(element)),
+                              ('file', filename)])
+        if data is not element.data:
+            record['columns'] = list(data.dtype.names)
+        if element.id is not None:
+            record['options'] = self._encode_options(element)
+        with open(os.path.join(self.path, entry['directory'], 'frames.jsonl'), 'a') as f:
+            f.write(json.dumps(record) + '\n')
+        frames[key] = record
+
+
+    def _add_map(self, path, hmap):
+        # DynamicMaps are archived as the HoloMap of their frames
+        map_type = HoloMap if isinstance(hmap, DynamicMap) else type(hmap)
+        entry = OrderedDict([('path', list(path) if path else None),
+                             ('directory', 'map%04d' % len(self._index['maps'])),
+                             ('type', map_type.__name__),
+                             ('params', self._encode_params(hmap, map_type))])
+        os.makedirs(os.path.join(self.path, entry['directory']))
+        self._index['maps'].append(entry)
+        self._write_index()
+        return entry
+
+
+    def _encode_options(self, element):
+        options = {}
+        for group in Store.options.groups:
+            kwargs = Store.lookup_options(element, group).kwargs
+            for name, value in kwargs.items():
+                try:
+                    options.setdefault(group, {})[name] = _encode(value)
+                except _Unencodable:
+                    self.warning("Option %r of %s cannot be archived and was "
+                                 "omitted." % (name, type(element).__name__))
+        return options
+
+
+    ###########
+    # Reading #
+    ###########
+
+    def _map_entry(self, path):
+        path = list(path) if path else None
+        for entry in self._index['maps']:
+            if entry['path'] == path:
+                return entry
+        return None
+
+
+    def _load_frames(self, entry):
+        "Returns the (cached) frame records of a map by key"
+        directory = entry['directory']
+        if directory not in self._frames:
+            frames = OrderedDict()
+            filename = os.path.join(self.path, directory, 'frames.jsonl')
+            if os.path.isfile(filename):
+                with open(filename) as f:
+                    for line in f:
+                        if line.strip():
+                            record = json.loads(line)
+                            frames[_decode(record['key'])] = record
+            self._frames[directory] = frames
+        return self._frames[directory]
+
+
+    def paths(self):
+        """
+        Returns the Layout paths of the archived HoloMaps, which is
+        [None] for an archived HoloMap.
+        """
+        return [tuple(e['path']) if e['path'] else None for e in self._index['maps']]
+
+
+    def keys(self, path=None):
+        "Returns the keys of the HoloMap archived at the given path"
+        entry = self._map_entry(path)
+        if entry is None:
+            raise KeyError("No HoloMap archived at path %r" % (path,))
+        return list(self._load_frames(entry).keys())
+
+
+    def frame(self, key, path=None):
+        """
+        Loads a single frame of the HoloMap at the given path by key,
+        memory mapping its data according to the mmap_mode.
+        """
+        entry = self._map_entry(path)
+        if entry is None:
+            raise KeyError("No HoloMap archived at path %r" % (path,))
+        key = key if isinstance(key, tuple) else (key,)
+        record = self._load_frames(entry)[key]
+        element_type = param.concrete_descendents(Element)[record['type']]
+        data = np.load(os.path.join(self.path, entry['directory'], record['file']),
+                       mmap_mode=self.mmap_mode)
+        if 'columns' in record:
+            data = tuple(data[name] for name in record['columns'])
+        params = {str(k): _decode(v) for k, v in record['params'].items()}
+        element = element_type(data, **params)
+        if 'options' in record:
+            element.id = self._option_id(element, record['options'])
+        return element
+
+
+    def _option_id(self, element, options):
+        """
+        Returns the id of a custom OptionTree holding the supplied
+        options, creating it if the same options were not previously
+        loaded from this archive.
+        """
+        spec = json.dumps([type(element).__name__, element.group,
+                           element.label, options], sort_keys=True)
+        if spec not in self._option_ids:
+            tree = OptionTree(items=Store.options.data.items(),
+                              groups=Store.options.groups)
+            path = [type(element).__name__]
+            for component in [element.group, element.label]:
+                identifier = component.replace(' ', '_') if component else ''
+                if not (identifier and identifier[0].isupper() and identifier.isalnum()):
+                    break
+                path.append(identifier)
+            tree['.'.join(path)] = {group: Options(**{str(k): _decode(v)
+                                                      for k, v in kwargs.items()})
+                                    for group, kwargs in options.items()}
+            ids = list(Store.custom_options.keys())
+            custom_id = max(ids)+1 if ids else 0
+            Store.custom_options[custom_id] = tree
+            self._option_ids[spec] = custom_id
+        return self._option_ids[spec]
+
+
+    def load_map(self, path=None, lazy=False):
+        """
+        Loads the HoloMap at the given path. If lazy, a DynamicMap is
+        returned which only loads frames from the archive as they are
+        accessed.
+        """
+        entry = self._map_entry(path)
+        if entry is None:
+            raise KeyError("No HoloMap archived at path %r" % (path,))
+        params = {str(k): _decode(v) for k, v in entry['params'].items()}
+        keys = self.keys(path)
+        if lazy:
+            return DynamicMap([(k, None) for k in keys],
+                              callback=lambda *key: self.frame(key, path), **params)
+        map_type = dict(param.concrete_descendents(HoloMap), HoloMap=HoloMap)[entry['type']]
+        return map_type([(k, self.frame(k, path)) for k in keys], **params)
+
+
+    def load(self, lazy=False):
+        """
+        Loads the archived HoloMap or Layout of HoloMaps. If lazy,
+        each HoloMap is loaded as a DynamicMap that only loads frames
+        from the archive as they are accessed.
+        """
+        paths = self.paths()
+        if self._index['type'] != 'Layout':
+            return self.load_map(None, lazy)
+        layout = Layout()
+        for path in paths:
+            layout.set_path(path, self.load_map(path, lazy))
+        return layout
@@ -4,7 +4,6 @@ map types. The former class only allows indexing whereas the latter
 also enables slicing over multiple dimension ranges.
 """
 
-from operator import itemgetter
 try:
     from cyordereddict import OrderedDict
 except:
@@ -121,14 +120,33 @@ class MultiDimensionalMapping(Dimensioned):
 
 
         # Updates nested data structures rather than simply overriding them.
-        if ((dim_vals in self.data)
-            and isinstance(self.data[dim_vals], (NdMapping, OrderedDict))):
-            self.data[dim_vals].update(data)
+        self._ranges = {}
+        if ((dim_vals in self._data)
+            and isinstance(self._data[dim_vals], (NdMapping, OrderedDict))):
+            self._data[dim_vals].update(data)
+        elif dim_vals in self._data:
+            self._data[dim_vals] = data
         else:
-            self.data[dim_vals] = data
+            # Keys appended in order keep the data sorted, any other
+            # insertion defers sorting until the data is next accessed
+            if sort and not self._sort_pending:
+                self._sort_pending = not self._in_order(dim_vals)
+            self._data[dim_vals] = data
+            self._key_arrays = {}
 
-        if sort:
-            self._resort()
+
+    def _in_order(self, key):
+        """
+        Returns whether the supplied key sorts after the current last
+        key, i.e. whether appending it preserves the sort order.
+        """
+        if not self._data:
+            return True
+        last_key = next(reversed(self._data))
+        try:
+            return self._sort_key(last_key) < self._sort_key(key)
+        except TypeError:
+            return False
 
 
     def _apply_key_type(self, keys):
@@ -184,18 +202,93 @@ class MultiDimensionalMapping(Dimensioned):
         return data
 
 
+    def _sort_key(self, key):
+        """
+        Returns the key used to sort the supplied data key, mapping
+        the values of categorical Dimensions to their position in the
+        declared Dimension values.
+        """
+        if not self._cached_categorical:
+            return key
+        dimensions = self.key_dimensions
+        return tuple(dimensions[i].values.index(k) if dimensions[i].values else k
+                     for i, k in enumerate(key))
+
+
     def _resort(self):
         """
         Sorts data by key using usual Python tuple sorting semantics
         or sorts in categorical order for any categorical Dimensions.
         """
         sortkws = {}
-        dimensions = self.key_dimensions
         if self._cached_categorical:
-            sortkws['key'] = lambda x: tuple(dimensions[i].values.index(x[0][i])
-                                             if dimensions[i].values else x[0][i]
-                                             for i in range(self.ndims))
-        self.data = OrderedDict(sorted(self.data.items(), **sortkws))
+            sortkws['key'] = lambda x: self._sort_key(x[0])
+        self._data = OrderedDict(sorted(self._data.items(), **sortkws))
+        self._sort_pending = False
+        self._key_arrays = {}
+
+
+    @property
+    def data(self):
+        """
+        The OrderedDict of items held by the mapping, sorted by key.
+        Sorting is deferred until the data is accessed so that
+        repeated insertions only sort the keys once.
+        """
+        if self._sort_pending:
+            self._resort()
+        return self._data
+
+
+    @data.setter
+    def data(self, data):
+        self._data = data
+        self._sort_pending = False
+        self._key_arrays = {}
+        self._ranges = {}
+
+
+    def _key_array(self, index):
+        """
+        Returns the values of the key dimension at the supplied index
+        as a NumPy array in key order. The arrays are cached until the
+        keys of the mapping change. Non-numeric keys are held in
+        object arrays, retaining the usual Python comparison semantics.
+        """
+        keys = self.data.keys()
+        values = self._key_arrays.get(index)
+        if values is None or len(values) != len(self._data):
+            key_values = [k[index] for k in keys]
+            values = np.array(key_values)
+            if values.dtype.kind not in 'biuf' or values.ndim != 1:
+                values = np.empty(len(key_values), dtype=object)
+                for i, v in enumerate(key_values):
+                    values[i] = v
+            self._key_arrays[index] = values
+        return values
+
+
+    def _group_indices(self, indices):
+        """
+        Groups the items by the values of the key dimensions at the
+        supplied indices, returning an array of item indices for each
+        group. Groups are returned in the order they first occur.
+        """
+        codes = np.zeros(len(self), dtype=np.int64)
+        for idx in indices:
+            values = self._key_array(idx)
+            try:
+                uniques, inverse = np.unique(values, return_inverse=True)
+            except TypeError:
+                lookup = {}
+                inverse = np.array([lookup.setdefault(v, len(lookup)) for v in values])
+                uniques = lookup
+            codes = codes * len(uniques) + inverse.ravel()
+            codes = np.unique(codes, return_inverse=True)[1].ravel()
+        order = np.argsort(codes, kind='mergesort')
+        splits = np.flatnonzero(np.diff(codes[order])) + 1
+        groups = np.split(order, splits) if len(order) else []
+        return sorted(groups, key=lambda g: g[0])
 
 
     def groupby(self, dimensions, container_type=None, group_type=None, **kwargs):
@@ -214,10 +307,17 @@ class MultiDimensionalMapping(Dimensioned):
                          for dim in dimensions))
         inames, idims = zip(*((dim.name, dim) for dim in self.key_dimensions
                               if not dim.name in dimensions))
-        selects = unique_iterator(itemgetter(*inds)(key) if len(inds) > 1 else (key[inds[0]],)
-                                  for key in self.data.keys())
-        groups = [(sel, group_type(self.select(**dict(zip(dimensions, sel))).reindex(inames), **kwargs))
-                  for sel in selects]
+        indices = [self.get_dimension_index(name) for name in inames]
+        items = list(self.data.items())
+        groups = []
+        for group_inds in self._group_indices(inds):
+            group_items = [items[i] for i in group_inds]
+            sel = tuple(group_items[0][0][i] for i in inds)
+            reindexed = [(tuple(k[i] for i in indices), v) for k, v in group_items]
+            constant_dimensions = dict(zip(dims, sel))
+            group = self.clone(reindexed, key_dimensions=list(idims),
+                               constant_dimensions=constant_dimensions)
+            groups.append((sel, group_type(group, **kwargs)))
         return container_type(groups, key_dimensions=dims)
 
 
@@ -285,8 +385,8 @@ class MultiDimensionalMapping(Dimensioned):
         each value uniquely.
         """
         if not len(dimension_labels):
-            dimension_labels = [d for d in self._cached_index_names
-                                if not len(set(self.dimension_values(d))) == 1]
+            dimension_labels = [d for i, d in enumerate(self._cached_index_names)
+                                if not self._constant_key(i)]
 
         indices = [self.get_dimension_index(el) for el in dimension_labels]
 
@@ -307,16 +407,30 @@ class MultiDimensionalMapping(Dimensioned):
                           constant_dimensions=constant_dimensions)
 
 
+    def _constant_key(self, index):
+        """
+        Returns whether the key dimension at the supplied index takes
+        a single value across all keys.
+        """
+        values = self._key_array(index)
+        if values.dtype.kind == 'O':
+            return len(set(values)) == 1
+        return len(values) > 0 and bool((values == values[0]).all())
+
+
     @property
     def last(self):
         "Returns the item highest data item along the map dimensions."
-        return list(self.data.values())[-1] if len(self) else None
+        return self.data[next(reversed(self.data))] if len(self) else None
 
 
     @property
     def last_key(self):
         "Returns the last key value."
-        return list(self.keys())[-1] if len(self) else None
+        if not len(self):
+            return None
+        last_key = next(reversed(self.data))
+        return last_key[0] if self.ndims == 1 else last_key
 
 
     @property
@@ -380,8 +494,7 @@ class MultiDimensionalMapping(Dimensioned):
                 raise KeyError("Cannot update with NdMapping that has"
                                " a different set of key dimensions.")
         for key, data in other.items():
-            self._add_item(key, data, sort=False)
-        self._resort()
+            self._add_item(key, data)
 
 
     def keys(self):
@@ -415,6 +528,8 @@ class MultiDimensionalMapping(Dimensioned):
     def pop(self, key, default=None):
         "Standard pop semantics for all mapping types"
         if not isinstance(key, tuple): key = (key,)
+        self._key_arrays = {}
+        self._ranges = {}
         return self.data.pop(key, default)
 
 
@@ -434,6 +549,18 @@ class MultiDimensionalMapping(Dimensioned):
         self._add_item(key, value)
 
 
+    def __setstate__(self, d):
+        """
+        Restores the mapping data from pickles created before sorting
+        of the data was deferred.
+        """
+        if 'data' in d:
+            d['_data'] = d.pop('data')
+        d.setdefault('_sort_pending', True)
+        d.setdefault('_key_arrays', {})
+        super(MultiDimensionalMapping, self).__setstate__(d)
+
+
     def __str__(self):
         return repr(self)
 
@@ -449,7 +576,7 @@ class MultiDimensionalMapping(Dimensioned):
             return key in self.keys()
 
     def __len__(self):
-        return len(self.data)
+        return len(self._data)
 
 
 
@@ -484,11 +611,10 @@ class NdMapping(MultiDimensionalMapping):
         if all(not isinstance(el, (slice, list)) for el in map_slice):
             return self._dataslice(self.data[map_slice], data_slice)
         else:
-            conditions = self._generate_conditions(map_slice)
-            items = self.data.items()
-            for cidx, condition in enumerate(conditions):
-                items = [(k, v) for k, v in items if condition(k[cidx])]
-            items = [(k, self._dataslice(v, data_slice)) for k, v in items]
+            keys = list(self.data.keys())
+            mask = self._generate_mask(map_slice)
+            items = [(keys[i], self._dataslice(self.data[keys[i]], data_slice))
+                     for i in np.flatnonzero(mask)]
             if self.ndims == 1:
                 items = [(k[0], v) for (k, v) in items]
             if len(items) == 0:
@@ -500,21 +626,17 @@ class NdMapping(MultiDimensionalMapping):
         """
         Expands slices containing steps into a list.
         """
-        keys = list(self.data.keys())
         expanded = []
         for idx, ind in enumerate(indices):
             if isinstance(ind, slice) and ind.step is not None:
-                dim_ind = slice(ind.start, ind.stop)
-                if dim_ind == slice(None):
-                    condition = self._all_condition()
-                elif dim_ind.start is None:
-                    condition = self._upto_condition(dim_ind)
-                elif dim_ind.stop is None:
-                    condition = self._from_condition(dim_ind)
-                else:
-                    condition = self._range_condition(dim_ind)
-                dim_vals = unique_iterator(k[idx] for k in keys)
-                expanded.append([k for k in dim_vals if condition(k)][::int(ind.step)])
+                values = self._key_array(idx)
+                values = values[self._dimension_mask(values, slice(ind.start, ind.stop))]
+                try:
+                    _, first = np.unique(values, return_index=True)
+                    dim_vals = values[np.sort(first)].tolist()
+                except TypeError:
+                    dim_vals = list(unique_iterator(values))
+                expanded.append(dim_vals[::int(ind.step)])
             else:
                 expanded.append(ind)
         return tuple(expanded)
@@ -528,6 +650,48 @@ class NdMapping(MultiDimensionalMapping):
         return indices
 
 
+    def _generate_mask(self, map_slice):
+        """
+        Generates a boolean mask over the keys, selecting the items
+        within the supplied slice.
+        """
+        mask = np.ones(len(self), dtype=bool)
+        for idx, dim in enumerate(map_slice):
+            if dim is Ellipsis or (isinstance(dim, slice) and dim == slice(None)):
+                continue
+            mask &= self._dimension_mask(self._key_array(idx), dim)
+        return mask
+
+
+    def _dimension_mask(self, values, dim):
+        """
+        Evaluates the condition corresponding to the supplied index
+        (a value, list of values or slice) on an array of key values
+        along a single dimension, returning a boolean mask. Any steps
+        on the slice are expected to have been expanded already.
+        """
+        if isinstance(dim, slice):
+            mask = np.ones(len(values), dtype=bool)
+            if dim.start is not None:
+                mask &= (values > dim.start) if dim.stop is None else (values >= dim.start)
+            if dim.stop is not None:
+                mask &= values < dim.stop
+            return mask
+        elif isinstance(dim, list):
+            list_values = np.array(dim)
+            if values.dtype.kind != 'O' and list_values.dtype.kind in 'biuf':
+                return np.in1d(values, list_values)
+            condition = self._values_condition(dim)
+        elif dim is Ellipsis:
+            return np.ones(len(values), dtype=bool)
+        elif dim is None or np.isscalar(dim):
+            return np.asarray(values == dim, dtype=bool)
+        else:
+            condition = self._value_condition(dim)
+        return np.fromiter((condition(v) for v in values), dtype=bool,
+                           count=len(values))
+
+
     def _generate_conditions(self, map_slice):
         """
         Generates filter conditions used for slicing the data structure.
@@ -613,6 +777,31 @@ class UniformNdMapping(NdMapping):
         super(UniformNdMapping, self).__init__(initial_items, **params)
 
 
+    def _data_range(self, dimension):
+        """
+        Aggregates the ranges of the contained items along dimensions
+        other than the key dimensions, making use of any ranges the
+        items have already cached.
+        """
+        if dimension.name in self._cached_index_names or not len(self):
+            return super(UniformNdMapping, self)._data_range(dimension)
+        ranges = [v.range(dimension.name) for v in self
+                  if dimension.name in v.dimensions(label=True)]
+        try:
+            lower, upper = zip(*ranges)
+            return np.min(lower), np.max(upper)
+        except:
+            return super(UniformNdMapping, self)._data_range(dimension)
+
+
+    def range(self, dim, data_range=True):
+        # Nested maps may be updated in place, their ranges
+        # are therefore cached on the nested maps themselves
+        if self.type is not None and issubclass(self.type, NdMapping):
+            self._ranges = {}
+        return super(UniformNdMapping, self).range(dim, data_range)
+
+
     def relabel(self, label=None, group=None):
         """
         Relabels the UniformNdMapping and all it's Elements
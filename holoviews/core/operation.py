@@ -3,6 +3,9 @@ Operations manipulate Elements, HoloMaps and Layouts, typically for
 the purposes of analysis or visualization.
 """
 
+from multiprocessing import Pool
+from multiprocessing.pool import ThreadPool
+
 import numpy as np
 
 import param
@@ -67,6 +70,16 @@ class Operation(param.ParameterizedFunction):
 
 
 
+def _process_item(args):
+    """
+    Applies an ElementOperation to a single (key, element) pair, used
+    to dispatch the items of a HoloMap to a pool of worker processes.
+    """
+    operation, key, element, params = args
+    return operation.instance().process_element(element, key, **params)
+
+
+
 class ElementOperation(Operation):
     """
     An ElementOperation process an Element or HoloMap at the level of
@@ -86,6 +99,20 @@ class ElementOperation(Operation):
        first component is a Normalization.ranges list and the second
        component is Normalization.keys. """)
 
+    backend = param.ObjectSelector(default=None,
+                                   objects=[None, 'threads', 'processes'], doc="""
+       The execution backend used to process the elements of a
+       HoloMap. By default the elements are processed sequentially,
+       'threads' processes them on a thread pool, which is suitable
+       for operations dominated by NumPy calls that release the GIL,
+       while 'processes' distributes them across a pool of worker
+       processes. In all cases the keys of the output HoloMap retain
+       the ordering of the input.""")
+
+    processes = param.Integer(default=None, allow_None=True, bounds=(1, None), doc="""
+       The number of workers used by the 'threads' and 'processes'
+       backends, defaulting to the number of available CPUs.""")
+
 
     def _process(self, view, key=None):
         """
@@ -118,8 +145,7 @@ class ElementOperation(Operation):
             for pos, cell in element.items():
                 processed[pos] = self(cell, **params)
         elif isinstance(element, HoloMap):
-            mapped_items = [(k, self._process(el, key=k))
-                            for k, el in element.items()]
+            mapped_items = self._map_items(element.items(), params)
             refval = mapped_items[0][1]
             processed = element.clone(mapped_items,
                                       group=refval.group,
@@ -129,6 +155,32 @@ class ElementOperation(Operation):
         return processed
 
 
+    def _map_items(self, items, params):
+        """
+        Processes a list of (key, element) items using the selected
+        backend, returning the processed items in the input order.
+        """
+        if self.p.backend is None or len(items) < 2:
+            return [(k, self._process(el, key=k)) for k, el in items]
+
+        if self.p.backend == 'threads':
+            pool = ThreadPool(self.p.processes)
+            process = lambda item: self._process(item[1], key=item[0])
+            args = items
+        else:
+            pool = Pool(self.p.processes)
+            process = _process_item
+            params = dict(self.get_param_values(onlychanged=True),
+                          **dict(params, backend=None))
+            args = [(type(self), k, el, params) for k, el in items]
+        try:
+            processed = pool.map(process, args)
+        finally:
+            pool.close()
+            pool.join()
+        return [(k, el) for (k, _), el in zip(items, processed)]
+
+
 
 class MapOperation(param.ParameterizedFunction):
     """
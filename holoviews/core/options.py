@@ -213,6 +213,7 @@ class OptionTree(AttrTree):
             raise ValueError('Please supply groups dictionary')
         self.__dict__['groups'] = groups
         self.__dict__['_instantiated'] = False
+        self.__dict__['_closest_cache'] = {}
         AttrTree.__init__(self, items, identifier, parent)
         self.__dict__['_instantiated'] = True
 
@@ -292,12 +293,24 @@ class OptionTree(AttrTree):
         else:
             raise ValueError('OptionTree only accepts a dictionary of Options.')
         super(OptionTree, self).__setattr__(identifier, new_node)
+        self._clear_cache()
 
         if isinstance(val, OptionTree):
             for subtree in val:
                 self[identifier].__setattr__(subtree.identifier, subtree)
 
 
+    def _clear_cache(self):
+        """
+        Clears the resolved options cached by the current node and its
+        parents, which are invalidated whenever the tree is modified.
+        """
+        node = self
+        while node is not None:
+            node.__dict__['_closest_cache'].clear()
+            node = node.parent
+
+
     def find(self, path, mode='node'):
         """
         Find the closest node or path to an the arbitrary path that is
@@ -326,9 +339,15 @@ class OptionTree(AttrTree):
 
         In addition, closest supports custom options by checking the
         object
+
+        The resolved Options are cached by type, group, label and
+        options group until the tree is next modified.
         """
         components = (obj.__class__.__name__, obj.group, obj.label)
-        return self.find(components).options(group)
+        key = components + (group,)
+        if key not in self._closest_cache:
+            self._closest_cache[key] = self.find(components).options(group)
+        return self._closest_cache[key]
 
 
     def options(self, group):
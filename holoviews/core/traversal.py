@@ -37,9 +37,9 @@ def unique_dimkeys(obj, default_dim='Frame'):
     Returns the list of dimensions followed by the list of unique
     keys.
     """
-    from .ndmapping import NdMapping
+    from .element import HoloMap
     key_dims = obj.traverse(lambda x: (tuple(x.key_dimensions),
-                                       list(x.data.keys())), ('HoloMap',))
+                                       list(x.data.keys())), [HoloMap])
     if not key_dims:
         return [Dimension(default_dim)], [(0,)]
     dim_groups, keys = zip(*sorted(key_dims, key=lambda x: -len(x[0])))
@@ -54,35 +54,75 @@ def unique_dimkeys(obj, default_dim='Frame'):
         all_dims = [default_dim]
 
     ndims = len(all_dims)
-    unique_keys = []
-    for group, keys in key_dims:
-        dim_idxs = [all_dims.index(dim) for dim in group]
-        for key in keys:
-            padded_key = create_ndkey(ndims, dim_idxs, key)
-            matches = [item for item in unique_keys
-                       if padded_key == tuple(k if k is None else i
-                                              for i, k in zip(item, padded_key))]
-            if not matches:
-                unique_keys.append(padded_key)
-
-    sorted_keys = NdMapping({key: None for key in unique_keys},
-                            key_dimensions=all_dims).data.keys()
+    unique_keys = _unique_keys(ndims, [([all_dims.index(dim) for dim in group], keys)
+                                       for group, keys in key_dims])
+
     if subset:
-        return all_dims, list(sorted_keys)
+        return all_dims, _sort_keys(unique_keys, all_dims)
     else:
         return all_dims, [(i,) for i in range(len(unique_keys))]
 
 
+def _unique_keys(ndims, indexed_keys):
+    """
+    Computes the union of the keys of a number of groups, where each
+    group supplies the indices of its dimensions into the ndims
+    dimensions and a list of keys. Keys are padded with None along
+    missing dimensions and a key is only added if no previously
+    added key matches it along all of its dimensions.
+
+    Matches are looked up in a hashed set of the projections of the
+    unique keys onto the dimensions of each group, making the union
+    linear in the total number of keys.
+    """
+    getters = {tuple(dim_idxs): itemgetter(*dim_idxs) for dim_idxs, _ in indexed_keys}
+    projections = {pattern: set() for pattern in getters}
+    unique_keys = []
+    for dim_idxs, keys in indexed_keys:
+        getter = getters[tuple(dim_idxs)]
+        projected = projections[tuple(dim_idxs)]
+        for key in keys:
+            padded_key = create_ndkey(ndims, dim_idxs, key)
+            if getter(padded_key) in projected:
+                continue
+            unique_keys.append(padded_key)
+            for pattern, keyset in projections.items():
+                keyset.add(getters[pattern](padded_key))
+    return unique_keys
+
+
+def _sort_keys(keys, dimensions):
+    """
+    Sorts keys along the supplied dimensions, applying the dimension
+    types and sorting any categorical dimensions in the order of the
+    declared dimension values.
+    """
+    dim_types = [d.type if isinstance(d, Dimension) else None for d in dimensions]
+    if any(dim_types):
+        keys = [tuple(v if t is None or v is None else t(v)
+                      for t, v in zip(dim_types, key)) for key in keys]
+    values = [d.values if isinstance(d, Dimension) else None for d in dimensions]
+    if not any(values):
+        try:
+            return sorted(keys)
+        except TypeError:
+            pass
+    # Keys padded with None sort first along the missing dimension
+    sort_key = lambda key: tuple((k is not None, vals.index(k) if vals and k is not None else k)
+                                 for vals, k in zip(values, key))
+    return sorted(keys, key=sort_key)
+
+
 def bijective(keys):
     ndims = len(keys[0])
     if ndims <= 1:
         return True
     for idx in range(ndims):
         getter = itemgetter(*(i for i in range(ndims) if i != idx))
-        store = []
+        store = set()
         for key in keys:
             subkey = getter(key)
             if subkey in store:
                 return False
-            store.append(subkey)
+            store.add(subkey)
     return True
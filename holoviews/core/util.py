@@ -1,3 +1,5 @@
+import tempfile
+
 import numpy as np
 
 def find_minmax(lims, olims):
@@ -54,3 +56,162 @@ def unique_iterator(seq):
         if item not in seen:
             seen.add(item)
             yield item
+
+
+def min_distance(xs, ys):
+    """
+    Returns the minimum euclidean distance between any two of the
+    supplied points or infinity if fewer than two points are given.
+
+    Points lying on a (possibly irregularly spaced) rectangular grid
+    are handled directly from the unique coordinates along each
+    axis. Otherwise the points are swept in order of their projection
+    onto an oblique axis, comparing each point only with the points
+    following it whose projected separation is less than the closest
+    distance found so far. The cost therefore depends on the local
+    density of the points rather than on their overall extent.
+    """
+    xs, ys = np.asarray(xs, dtype=float), np.asarray(ys, dtype=float)
+    npoints = len(xs)
+    if npoints < 2:
+        return np.inf
+
+    order = np.lexsort((ys, xs))
+    xs, ys = xs[order], ys[order]
+    if np.any((np.diff(xs) == 0) & (np.diff(ys) == 0)):
+        return 0.0
+
+    xvals, yvals = np.unique(xs), np.unique(ys)
+    if len(xvals) * len(yvals) == npoints:
+        return min(np.diff(xvals).min() if len(xvals) > 1 else np.inf,
+                   np.diff(yvals).min() if len(yvals) > 1 else np.inf)
+
+    # Projected separations are a lower bound on the distances and an
+    # oblique axis avoids the ties common along the coordinate axes
+    angle = 0.5
+    projected = xs * np.cos(angle) + ys * np.sin(angle)
+    order = np.argsort(projected, kind='mergesort')
+    projected, xs, ys = projected[order], xs[order], ys[order]
+    min_dist = np.inf
+    active = np.arange(npoints-1)
+    offset = 1
+    while len(active):
+        active = active[active + offset < npoints]
+        active = active[projected[active+offset] - projected[active] < min_dist]
+        if len(active):
+            others = active + offset
+            dists = np.hypot(xs[others] - xs[active], ys[others] - ys[active])
+            min_dist = min(min_dist, dists.min())
+        offset += 1
+    return min_dist
+
+
+def _color_output(channels, out):
+    """
+    Broadcasts the supplied color channels against each other and
+    returns them along with an output array of shape (..., 3). The
+    output has the floating point type of the inputs (float64 for
+    integer inputs) unless an out array is supplied.
+    """
+    channels = np.broadcast_arrays(*[np.asarray(c) for c in channels])
+    dtype = np.result_type(*channels)
+    if not np.issubdtype(dtype, np.floating):
+        dtype = np.float64
+    channels = [c.astype(dtype, copy=False) for c in channels]
+    if out is None:
+        out = np.empty(channels[0].shape + (3,), dtype=dtype)
+    elif out.shape[:-1] != channels[0].shape or out.shape[-1] < 3:
+        raise ValueError("Output array must have shape %s" %
+                         (channels[0].shape + (3,),))
+    else:
+        channels = [c.copy() if np.may_share_memory(c, out) else c
+                    for c in channels]
+    return channels, out
+
+
+def hsv_to_rgb(h, s, v, out=None):
+    """
+    Array equivalent of colorsys.hsv_to_rgb, converting arrays of
+    hue, saturation and value in the range 0.0-1.0 to a tuple of red,
+    green and blue arrays. The channels are written to the first
+    three planes of the last axis of out, if supplied, which may be
+    the array holding the input channels.
+    """
+    (h, s, v), out = _color_output((h, s, v), out)
+    h6 = h * 6.0
+    i = np.trunc(h6)
+    f = h6 - i
+    i = i.astype(int) % 6
+    p = v * (1.0 - s)
+    q = v * (1.0 - s * f)
+    t = v * (1.0 - s * (1.0 - f))
+    for channel, choices in enumerate([(v, q, p, p, t, v),
+                                       (t, v, v, q, p, p),
+                                       (p, p, t, v, v, q)]):
+        out[..., channel] = np.choose(i, choices)
+    return out[..., 0], out[..., 1], out[..., 2]
+
+
+def rgb_to_hsv(r, g, b, out=None):
+    """
+    Array equivalent of colorsys.rgb_to_hsv, converting arrays of
+    red, green and blue values in the range 0.0-1.0 to a tuple of
+    hue, saturation and value arrays. The channels are written to the
+    first three planes of the last axis of out, if supplied, which
+    may be the array holding the input channels.
+    """
+    (r, g, b), out = _color_output((r, g, b), out)
+    maxc = np.maximum(np.maximum(r, g), b)
+    minc = np.minimum(np.minimum(r, g), b)
+    rangec = maxc - minc
+    grey = rangec == 0
+    with np.errstate(divide='ignore', invalid='ignore'):
+        divisor = np.where(grey, 1, rangec)
+        rc, gc, bc = [(maxc - c) / divisor for c in (r, g, b)]
+        h = np.where(r == maxc, bc - gc,
+                     np.where(g == maxc, 2.0 + rc - bc, 4.0 + gc - rc))
+        out[..., 0] = np.where(grey, 0, (h / 6.0) % 1.0)
+        out[..., 1] = np.where(grey, 0, rangec / np.where(grey, 1, maxc))
+    out[..., 2] = maxc
+    return out[..., 0], out[..., 1], out[..., 2]
+
+
+def array_chunks(data, chunk_bytes=2**26, itemsize=None):
+    """
+    Yields slices along the first axis of the supplied array, each
+    covering roughly chunk_bytes of data. Allows arrays that are not
+    held in memory (e.g. an np.memmap or HDF5 dataset) to be processed
+    without loading all of the data at once.
+
+    The itemsize is the number of bytes computed per element of the
+    data when processing a chunk, e.g. 32 when each element is mapped
+    to four float64 channels. Chunks are sized by the larger of the
+    itemsize and that of the data, so that the arrays computed from
+    each chunk are also bounded by roughly chunk_bytes.
+    """
+    rows = data.shape[0] if len(data.shape) else 0
+    itemsize = max(np.dtype(data.dtype).itemsize, itemsize or 0)
+    row_bytes = int(np.prod(data.shape[1:])) * itemsize
+    step = max(chunk_bytes // max(row_bytes, 1), 1)
+    for start in range(0, rows, step):
+        yield slice(start, min(start+step, rows))
+
+
+def in_memory(data):
+    """
+    Whether the supplied array is held in memory, i.e. it is an
+    ndarray that is not memory mapped.
+    """
+    return isinstance(data, np.ndarray) and not isinstance(data, np.memmap)
+
+
+def empty_array(data, shape, dtype):
+    """
+    Returns an uninitialized array of the given shape and dtype to
+    hold the result of processing the supplied data. If the data is
+    not held in memory the result is memory mapped to a temporary
+    file so that it may likewise be larger than the available memory.
+    """
+    if in_memory(data) or not np.prod(shape):
+        return np.empty(shape, dtype=dtype)
+    return np.memmap(tempfile.TemporaryFile(), dtype=dtype, mode='w+', shape=shape)
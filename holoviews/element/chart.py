@@ -49,8 +49,8 @@ class Chart(Element2D):
         Should return the data and parameters of the new Chart.
         """
         if isinstance(ndmap, Table):
-            data = np.vstack([np.concatenate([key, vals])
-                              for key, vals in ndmap.data.items()])
+            data = np.column_stack([ndmap.dimension_values(d)
+                                    for d in ndmap.dimensions(label=True)])
             settings = dict(ndmap.get_param_values(onlychanged=True))
         else:
             data = np.concatenate([v.data for v in ndmap])
@@ -108,9 +108,9 @@ class Chart(Element2D):
     def collapse_data(cls, data, function, **kwargs):
         if not function:
             raise Exception("Must provide function to collapse %s data." % cls.__name__)
-        data = [arr[:, 1:] for arr in data]
-        collapsed = function(np.dstack(data), axis=-1, **kwargs)
-        return np.hstack([data[0][:, 0, np.newaxis], collapsed])
+        stack = np.asarray(data)
+        collapsed = function(stack[:, :, 1:], axis=0, **kwargs)
+        return np.hstack([stack[0, :, :1], collapsed])
 
 
     def sample(self, samples=[]):
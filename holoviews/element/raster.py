@@ -1,11 +1,11 @@
 from itertools import product
 import numpy as np
-import colorsys
 import param
 
 from ..core import OrderedDict, Dimension, NdMapping, Element2D
 from ..core.boundingregion import BoundingRegion, BoundingBox
 from ..core.sheetcoords import SheetCoordinateSystem, Slice
+from ..core.util import hsv_to_rgb, array_chunks
 from .chart import Curve
 from .tabular import Table
 
@@ -52,20 +52,112 @@ class Raster(Element2D):
             return self.clone(np.expand_dims(data, axis=slc_types.index(True)))
 
     def _coord2matrix(self, coord):
-        xd, yd = self.data.shape
-        l, b, r, t = self.extents
-        xvals = np.linspace(l, r, xd)
-        yvals = np.linspace(b, t, yd)
-        xidx = np.argmin(np.abs(xvals-coord[0]))
-        yidx = np.argmin(np.abs(yvals-coord[1]))
-        return (xidx, yidx)
+        xidx, yidx = self._coords2matrix(coord[0], coord[1])
+        return (int(xidx), int(yidx))
+
+
+    def _sample_axes(self):
+        """
+        Returns the coordinates of the samples along the first and
+        second array axes, cached until the shape or extents change.
+        """
+        xd, yd = self.data.shape[:2]
+        key = (xd, yd, tuple(self.extents))
+        cache = getattr(self, '_axes_cache', None)
+        if cache is None or cache[0] != key:
+            l, b, r, t = self.extents
+            cache = (key, np.linspace(l, r, xd), np.linspace(b, t, yd))
+            self._axes_cache = cache
+        return cache[1:]
+
+
+    def _coords2matrix(self, xs, ys):
+        """
+        Batched equivalent of _coord2matrix, returning arrays of
+        matrix indices for the supplied arrays of coordinates.
+        """
+        xvals, yvals = self._sample_axes()
+        return (self._closest_index(xvals, xs),
+                self._closest_index(yvals, ys))
+
+
+    def _coords2fractional(self, xs, ys):
+        """
+        Returns arrays of continuous matrix indices for the supplied
+        coordinates, clipped to the valid range of the array.
+        """
+        xvals, yvals = self._sample_axes()
+        return (np.interp(xs, xvals, np.arange(len(xvals))),
+                np.interp(ys, yvals, np.arange(len(yvals))))
+
+
+    @staticmethod
+    def _closest_index(vals, coords):
+        "Index of the closest of the increasing vals to each coordinate"
+        coords = np.asarray(coords, dtype=float)
+        if len(vals) == 1:
+            return np.zeros(coords.shape, dtype=int)
+        upper = np.clip(np.searchsorted(vals, coords), 1, len(vals)-1)
+        lower = upper - 1
+        closer = np.abs(coords-vals[lower]) <= np.abs(vals[upper]-coords)
+        return np.where(closer, lower, upper)
+
+
+    def _point_sampler(self, xs, ys, method='nearest'):
+        """
+        Returns a function that samples an array with the same shape
+        as the data of this Raster at the supplied coordinates. The
+        matrix indices (and interpolation weights) are computed once
+        so the function may be applied to many arrays sharing the
+        same shape and extents, e.g. the frames of a HoloMap.
+        """
+        xs, ys = np.asarray(xs, dtype=float), np.asarray(ys, dtype=float)
+        if method == 'nearest':
+            index = self._coords2matrix(xs, ys)
+            return lambda data: data[index]
+        elif method != 'bilinear':
+            raise ValueError("Sampling method must be either "
+                             "'nearest' or 'bilinear', not %r" % method)
+
+        corners, weights = [], []
+        for fidx, length in zip(self._coords2fractional(xs, ys), self.data.shape[:2]):
+            lower = np.clip(np.floor(fidx).astype(int), 0, max(length-2, 0))
+            corners.append((lower, np.minimum(lower+1, length-1)))
+            weights.append(fidx - lower)
+        (i0, i1), (j0, j1) = corners
+
+        def sampler(data):
+            wi, wj = [w.reshape(w.shape + (1,)*(data.ndim-2)) for w in weights]
+            return ((1-wi) * ((1-wj) * data[i0, j0] + wj * data[i0, j1]) +
+                    wi * ((1-wj) * data[i1, j0] + wj * data[i1, j1]))
+        return sampler
+
+
+    def sample_points(self, xs, ys, method='nearest'):
+        """
+        Returns the values of the Raster at the supplied arrays of x-
+        and y-coordinates, converting all the coordinates to matrix
+        indices at once and gathering the values with fancy indexing.
+        The method may be 'nearest' to return the value of the closest
+        sample or 'bilinear' to interpolate between the four closest
+        samples.
+        """
+        return self._point_sampler(xs, ys, method)(self.data)
+
+
+    def _sample_table(self, samples, values):
+        "Returns a Table of the sampled values indexed by the samples"
+        params = dict(self.get_param_values(onlychanged=True),
+                      key_dimensions=self.key_dimensions,
+                      value_dimensions=self.value_dimensions)
+        return Table(OrderedDict(zip(samples, values)), **params)
 
 
     @classmethod
     def collapse_data(cls, data_list, function, **kwargs):
         if not function:
             raise Exception("Must provide function to collapse %s data." % cls.__name__)
-        return function(np.dstack(data_list), axis=-1, **kwargs)
+        return function(np.asarray(data_list), axis=0, **kwargs)
 
 
     def sample(self, samples=[], **sample_values):
@@ -87,11 +179,9 @@ class Raster(Element2D):
                 samples = zip(*[c if isinstance(c, list) else [c] for didx, c in
                                sorted([(self.get_dimension_index(k), v) for k, v in
                                        sample_values.items()])])
-            table_data = OrderedDict()
-            for c in samples:
-                table_data[c] = self.data[self._coord2matrix(c)]
-            params['key_dimensions'] = self.key_dimensions
-            return Table(table_data, **params)
+            samples = list(samples)
+            xs, ys = zip(*samples) if samples else ([], [])
+            return self._sample_table(samples, self.sample_points(xs, ys))
         else:
             dimension, sample_coord = sample_values.items()[0]
             if isinstance(sample_coord, slice):
@@ -164,6 +254,27 @@ class Raster(Element2D):
             raise Exception("Dimension not found.")
 
 
+    def _data_range(self, dimension):
+        """
+        Computes the range of a value dimension one chunk of rows at a
+        time, so that data which is not held in memory (e.g. an
+        np.memmap) is never loaded all at once.
+        """
+        if dimension not in self.value_dimensions:
+            return super(Raster, self)._data_range(dimension)
+        depth = self.value_dimensions.index(dimension)
+        lower, upper = [], []
+        for rows in array_chunks(self.data):
+            chunk = np.asarray(self.data[rows])
+            if chunk.ndim == 3:
+                chunk = chunk[:, :, depth]
+            lower.append(np.min(chunk))
+            upper.append(np.max(chunk))
+        if not lower:
+            return (None, None)
+        return np.min(lower), np.max(upper)
+
+
     @property
     def depth(self):
         return 1 if len(self.data.shape) == 2 else self.data.shape[2]
@@ -192,8 +303,9 @@ class HeatMap(Raster):
     upsampling them to a dense representation, which can be visualized.
 
     A HeatMap can be initialized with any dict or NdMapping type with
-    two-dimensional keys. Once instantiated the dense representation is
-    available via the .data property.
+    two-dimensional keys or with a tuple of (x, y, z) arrays holding
+    the sparse samples in columnar form. Once instantiated the dense
+    representation is available via the .data property.
     """
 
     group = param.String(default='HeatMap')
@@ -202,7 +314,7 @@ class HeatMap(Raster):
         if 'extents' in params:
             raise KeyError("HeatMap only supports fixed extents of unit size.")
 
-        self._data, array, dimensions = self._process_data(data, params)
+        self._data, array, dimensions, self._dense_keys = self._process_data(data, params)
         super(HeatMap, self).__init__(array,
                                       extents=(0,0,1,1),
                                       **dict(params, **dimensions))
@@ -211,6 +323,10 @@ class HeatMap(Raster):
     def _process_data(self, data, params):
         dimensions = {group: params.get(group, getattr(self, group))
                       for group in self._dim_groups[:2]}
+        if isinstance(data, tuple):
+            names = [d.name if isinstance(d, Dimension) else d for d in
+                     dimensions['key_dimensions'] + dimensions['value_dimensions']]
+            data = Table(np.rec.fromarrays(data, names=names[:len(data)]), **dimensions)
         if isinstance(data, NdMapping):
             if 'key_dimensions' not in params:
                 dimensions['key_dimensions'] = data.key_dimensions
@@ -219,22 +335,39 @@ class HeatMap(Raster):
         elif isinstance(data, (dict, OrderedDict, type(None))):
             data = NdMapping(data, **dimensions)
         else:
-            raise TypeError('HeatMap only accepts dict or NdMapping types.')
+            raise TypeError('HeatMap only accepts dict, NdMapping or '
+                            'tuple of (x, y, z) array types.')
+
+        dim1_keys, dim1_inds = self._dense_axis(data, 0)
+        dim2_keys, dim2_inds = self._dense_axis(data, 1)
+        if isinstance(data, Table) and data._columns is not None:
+            values = data.dimension_values(data._cached_value_names[0])
+        else:
+            values = [v[0] if isinstance(v, tuple) else v for v in data.values()]
+            values = (np.array(values, dtype=float).reshape(len(values), -1)[:, 0]
+                      if len(values) else np.array([]))
 
-        keys = list(data.keys())
-        dim1_keys = NdMapping([(k[0], None) for k in keys],
-                              key_dimensions=[self.key_dimensions[0]]).keys()
-        dim2_keys = NdMapping([(k[1], None) for k in keys],
-                              key_dimensions=[self.key_dimensions[1]]).keys()
-        grid_keys = [((i1, d1), (i2, d2)) for i1, d1 in enumerate(dim1_keys)
-                     for i2, d2 in enumerate(dim2_keys)]
+        # Scatter the sparse samples into the dense array
+        array = np.full((len(dim2_keys), len(dim1_keys)), np.NaN)
+        array[len(dim2_keys)-dim2_inds-1, dim1_inds] = values
 
-        array = np.zeros((len(dim2_keys), len(dim1_keys)))
-        for (i1, d1), (i2, d2) in grid_keys:
-            val = data.get((d1, d2), np.NaN)
-            array[len(dim2_keys)-i2-1, i1] = val[0] if isinstance(val, tuple) else val
+        return data, array, dimensions, (dim1_keys, dim2_keys)
 
-        return data, array, dimensions
+
+    def _dense_axis(self, data, index):
+        """
+        Returns the sorted unique keys along the key dimension at the
+        supplied index and the index of each item's key into them.
+        Categorical dimensions are sorted by the declared values.
+        """
+        values = data._key_array(index)
+        dim = data.key_dimensions[index]
+        if dim.values:
+            codes = np.array([dim.values.index(v) for v in values], dtype=int)
+            uniques, inds = np.unique(codes, return_inverse=True)
+            return [dim.values[c] for c in uniques], inds.ravel()
+        uniques, inds = np.unique(values, return_inverse=True)
+        return uniques.tolist(), inds.ravel()
 
 
     def __getitem__(self, coords):
@@ -244,13 +377,19 @@ class HeatMap(Raster):
         return self.clone(self._data.select(**dict(zip(self._data._cached_index_names, coords))))
 
 
+    def clone(self, data=None, shared_data=True, *args, **overrides):
+        if data is None and shared_data:
+            data = self._data
+        return super(HeatMap, self).clone(data, shared_data, *args, **overrides)
+
+
     def dense_keys(self):
-        keys = list(self._data.keys())
-        dim1_keys = NdMapping([(k[0], None) for k in keys],
-                              key_dimensions=[self.key_dimensions[0]]).keys()
-        dim2_keys = NdMapping([(k[1], None) for k in keys],
-                              key_dimensions=[self.key_dimensions[1]]).keys()
-        return dim1_keys, dim2_keys
+        return self._dense_keys
+
+
+    def _data_range(self, dimension):
+        # Ranges are computed from the sparse data, not the dense array
+        return super(Raster, self)._data_range(dimension)
 
 
     def dimension_values(self, dim):
@@ -341,8 +480,11 @@ class Image(SheetCoordinateSystem, Raster):
         """
         if isinstance(coords, tuple):
             return self.closest_cell_center(*coords)
-        else:
-            return [self.closest_cell_center(*el) for el in coords]
+        coords = list(coords)
+        if not coords:
+            return []
+        xs, ys = self.closest_cell_center(*np.array(coords, dtype=float).T)
+        return list(zip(xs, ys))
 
 
     def __getitem__(self, coords):
@@ -394,6 +536,19 @@ class Image(SheetCoordinateSystem, Raster):
         return self.sheet2matrixidx(*coord)
 
 
+    def _coords2matrix(self, xs, ys):
+        return self.sheet2matrixidx(np.asarray(xs, dtype=float),
+                                    np.asarray(ys, dtype=float))
+
+
+    def _coords2fractional(self, xs, ys):
+        rows, cols = self.data.shape[:2]
+        float_row, float_col = self.sheet2matrix(np.asarray(xs, dtype=float),
+                                                 np.asarray(ys, dtype=float))
+        return (np.clip(float_row-0.5, 0, rows-1),
+                np.clip(float_col-0.5, 0, cols-1))
+
+
     def dimension_values(self, dim):
         """
         The set of samples available along a particular dimension.
@@ -537,19 +692,20 @@ class HSV(RGB):
         If an alpha channel is supplied, the defined alpha_dimension
         is automatically appended to this list.""")
 
-    hsv_to_rgb = np.vectorize(colorsys.hsv_to_rgb)
+    hsv_to_rgb = staticmethod(hsv_to_rgb)
 
     @property
     def rgb(self):
         """
         Conversion from HSV to RGB.
         """
-        hsv = self.hsv_to_rgb(self.data[:,:,0],
-                              self.data[:,:,1],
-                              self.data[:,:,2])
+        rgb = np.empty(self.data.shape, dtype=np.result_type(self.data, np.float32))
+        self.hsv_to_rgb(self.data[:,:,0],
+                        self.data[:,:,1],
+                        self.data[:,:,2], out=rgb)
         if len(self.value_dimensions) == 4:
-            hsv += (self.data[:,:,3],)
+            rgb[:,:,3] = self.data[:,:,3]
 
-        return RGB(np.dstack(hsv), bounds=self.bounds,
+        return RGB(rgb, bounds=self.bounds,
                    group=self.group,
                    label=self.label)
@@ -152,6 +152,14 @@ class Table(Element, NdMapping):
     One feature of Tables is that they support an additional level of
     index over NdMappings: the last index may be a column name or a
     slice over the column names (using alphanumeric ordering).
+
+    Tables may also be constructed from a NumPy structured (record)
+    array with one field per key and value dimension, in which case
+    the data is held in columnar form rather than as one array per
+    row. Selecting, sampling, reducing and converting columnar Tables
+    operates directly on the columns, while the item-based data is
+    only generated on demand. Inserting items into a columnar Table
+    converts it to the item-based representation.
     """
 
     group = param.String(default='Table', doc="""
@@ -170,13 +178,185 @@ class Table(Element, NdMapping):
 
     def __init__(self, data=None, **params):
         self._style = None
+        self._columns = None
+        if isinstance(data, Table) and data._columns is not None:
+            params = dict(data.get_param_values(onlychanged=True), **params)
+            data = data._columns
+        if isinstance(data, np.ndarray) and data.dtype.names:
+            params = self._column_dimensions(data, params)
+            NdMapping.__init__(self, None, **dict(params,
+                                                  group=params.get('group',self.group)))
+            self._columns = self._sort_columns(self._rename_columns(data))
+            self._data = None
+            return
         NdMapping.__init__(self, data, **dict(params,
                                               group=params.get('group',self.group)))
         for k, v in self.data.items():
             self[k] = v # Unpacks any ItemTables
 
 
+    def _column_dimensions(self, columns, params):
+        """
+        Infers any key and value dimensions not explicitly supplied
+        from the field names of the structured array, treating the
+        last field as the value column by default.
+        """
+        names = list(columns.dtype.names)
+        params = dict(params)
+        if 'key_dimensions' not in params:
+            nvals = len(params.get('value_dimensions', [None]))
+            params['key_dimensions'] = names[:len(names)-nvals]
+        if 'value_dimensions' not in params:
+            params['value_dimensions'] = names[len(params['key_dimensions']):]
+        return params
+
+
+    def _rename_columns(self, columns):
+        """
+        Returns a view of the structured array with the fields named
+        after the key and value dimensions, which are matched to the
+        fields by position.
+        """
+        names = list(columns.dtype.names)
+        dim_names = self.dimensions(label=True)
+        if len(names) != len(dim_names):
+            raise ValueError("Structured array must supply one field per key "
+                             "and value dimension.")
+        if names == dim_names:
+            return columns
+        fields = columns.dtype.fields
+        dtype = np.dtype({'names': dim_names,
+                          'formats': [fields[n][0] for n in names],
+                          'offsets': [fields[n][1] for n in names],
+                          'itemsize': columns.dtype.itemsize})
+        return columns.view(dtype)
+
+
+    def _sort_columns(self, columns):
+        """
+        Sorts the rows of the columns by key, keeping only the last of
+        any rows with duplicate keys, matching the semantics of
+        inserting each row into the mapping in turn. Columns which
+        are already sorted are returned without copying.
+        """
+        if not self.ndims:
+            return columns[-1:]
+        elif len(columns) < 2:
+            return columns
+        keys = []
+        for dim in self.key_dimensions:
+            values = columns[dim.name]
+            if dim.values:
+                values = np.array([dim.values.index(v) for v in values])
+            keys.append(values)
+
+        # Check whether keys are strictly increasing
+        increasing = keys[-1][:-1] < keys[-1][1:]
+        for values in keys[-2::-1]:
+            increasing = ((values[:-1] < values[1:]) |
+                          ((values[:-1] == values[1:]) & increasing))
+        if increasing.all():
+            return columns
+
+        order = np.arange(len(columns))
+        for values in keys[::-1]:
+            order = order[np.argsort(values[order], kind='mergesort')]
+        duplicate = np.ones(len(order)-1, dtype=bool)
+        for values in keys:
+            duplicate &= values[order[:-1]] == values[order[1:]]
+        return columns[order[np.append(~duplicate, True)]]
+
+
+    def _drop_columns(self):
+        """
+        Converts a columnar Table to the item-based representation so
+        that it may be modified.
+        """
+        if self._columns is not None:
+            self._data = self.data
+            self._columns = None
+
+
+    def _column_keys(self):
+        "Returns the keys of a columnar Table as a list of tuples."
+        keys = [self._columns[d].tolist() for d in self._cached_index_names]
+        return list(zip(*keys)) if keys else [()] * len(self._columns)
+
+
+    def _value_array(self):
+        "Returns the value columns of a columnar Table as a 2D array."
+        return np.column_stack([self._columns[d] for d in self._cached_value_names])
+
+
+    @property
+    def data(self):
+        """
+        The OrderedDict of items held by the Table. For columnar
+        Tables the items are generated from the columns on first
+        access.
+        """
+        if self._columns is not None and self._data is None:
+            self._data = OrderedDict(zip(self._column_keys(),
+                                         self._value_array()))
+        return NdMapping.data.fget(self)
+
+
+    @data.setter
+    def data(self, data):
+        self._columns = None
+        NdMapping.data.fset(self, data)
+
+
+    def _key_array(self, index):
+        if self._columns is not None:
+            return self._columns[self._cached_index_names[index]]
+        return super(Table, self)._key_array(index)
+
+
+    def _add_item(self, dim_vals, data, sort=True):
+        self._drop_columns()
+        super(Table, self)._add_item(dim_vals, data, sort)
+
+
+    def clone(self, data=None, shared_data=True, *args, **overrides):
+        if data is None and shared_data and self._columns is not None:
+            data = self._columns
+        return super(Table, self).clone(data, shared_data, *args, **overrides)
+
+
+    def pop(self, key, default=None):
+        self._drop_columns()
+        return super(Table, self).pop(key, default)
+
+
+    def keys(self):
+        if self._columns is None:
+            return super(Table, self).keys()
+        elif self.ndims == 1:
+            return self._columns[self._cached_index_names[0]].tolist()
+        return self._column_keys()
+
+
+    def values(self):
+        if self._columns is None:
+            return super(Table, self).values()
+        return list(self._value_array())
+
+
+    def __len__(self):
+        if self._columns is None:
+            return super(Table, self).__len__()
+        return len(self._columns)
+
+
+    def __setstate__(self, d):
+        d.setdefault('_columns', None)
+        super(Table, self).__setstate__(d)
+
+
     def __setitem__(self, key, value):
+        self._drop_columns()
+        self._ranges = {}
         if isinstance(value, ItemTable):
             if value.value_dimensions != self.value_dimensions:
                 raise Exception("Input ItemTables dimensions must match value dimensions.")
@@ -216,6 +396,9 @@ class Table(Element, NdMapping):
         if isinstance(subtable, ItemTable):
             items = OrderedDict([(h,v) for (h,v) in subtable.data.items() if h in cols])
             return ItemTable(items, label=self.label)
+        elif subtable._columns is not None:
+            columns = subtable._columns[subtable._cached_index_names + cols]
+            return subtable.clone(columns, value_dimensions=value_dimensions)
 
         items = [(k, v[indices]) for (k,v) in subtable.items()]
         return subtable.clone(items, value_dimensions=value_dimensions)
@@ -227,7 +410,10 @@ class Table(Element, NdMapping):
         by column name (or a slice over column names)
         """
         ndmap_index = args[:self.ndims] if isinstance(args, tuple) else args
-        subtable = NdMapping.__getitem__(self, ndmap_index)
+        if self._columns is None:
+            subtable = NdMapping.__getitem__(self, ndmap_index)
+        else:
+            subtable = self._getitem_columns(ndmap_index)
 
         if len(self.value_dimensions) > 1 and not isinstance(subtable, Table):
             # If a value tuple, turn into an ItemTable
@@ -240,6 +426,26 @@ class Table(Element, NdMapping):
         return self._filter_table(subtable, args[-1])
 
 
+    def _getitem_columns(self, index):
+        """
+        Implements NdMapping indexing and slicing semantics on the
+        columns of a columnar Table.
+        """
+        if index in [Ellipsis, ()]:
+            return self
+        map_slice, _ = self._split_index(index)
+        map_slice = self._expand_slice(self._transform_indices(map_slice))
+        mask = self._generate_mask(map_slice)
+        if all(not isinstance(el, (slice, list)) for el in map_slice):
+            rows = np.flatnonzero(mask)
+            if not len(rows):
+                raise KeyError(map_slice)
+            return np.array(self._columns[rows[0]].tolist()[self.ndims:])
+        if not mask.any():
+            raise KeyError('No items within specified slice.')
+        return self.clone(self._columns[mask])
+
+
     def select(self, **selection):
         val_selection = selection.pop('value', None)
         selection = NdMapping.select(self, **selection)
@@ -251,7 +457,7 @@ class Table(Element, NdMapping):
 
     @property
     def rows(self):
-        return len(self.data) + 1
+        return len(self) + 1
 
     @property
     def cols(self):
@@ -271,6 +477,8 @@ class Table(Element, NdMapping):
             if col >= ndims:
                 return str(self.value_dimensions[col - ndims])
             return str(self.key_dimensions[col])
+        elif self._columns is not None:
+            return self._columns[self.dimensions(label=True)[col]][row-1]
         else:
             if col >= ndims:
                 row_values = self.values()[row-1]
@@ -292,12 +500,75 @@ class Table(Element, NdMapping):
         """
         Allows sampling of the Table with a list of samples.
         """
+        if self._columns is not None:
+            return self.clone(self._columns[self._sample_rows(samples)])
         sample_data = OrderedDict()
         for sample in samples:
             sample_data[sample] = self[sample]
         return Table(sample_data, **dict(self.get_param_values(onlychanged=True)))
 
 
+    def _sample_rows(self, samples):
+        """
+        Returns the row indices of the supplied samples on a columnar
+        Table, raising a KeyError for samples that are not found.
+        """
+        samples = [self._split_index(s)[0] for s in samples]
+        if self.ndims == 1 and self._key_array(0).dtype.kind in 'biuf':
+            keys = self._key_array(0)
+            sample_keys = np.array([s[0] for s in samples])
+            rows = np.clip(np.searchsorted(keys, sample_keys), 0, len(keys)-1)
+            missing = keys[rows] != sample_keys
+            if missing.any():
+                raise KeyError(samples[np.flatnonzero(missing)[0]])
+            return rows
+        rows = []
+        for sample in samples:
+            matches = np.flatnonzero(self._generate_mask(sample))
+            if not len(matches):
+                raise KeyError(sample)
+            rows.append(matches[0])
+        return np.array(rows, dtype=int)
+
+
+    def _value_columns(self):
+        """
+        Returns a list of arrays holding the values along each value
+        dimension.
+        """
+        if self._columns is not None:
+            return [self._columns[d] for d in self._cached_value_names]
+        values = np.array(self.values()).reshape(len(self), -1)
+        return [values[:, i] for i in range(values.shape[1])]
+
+
+    def _reduce_dimensions(self, dimensions, function):
+        """
+        Reduces the supplied key dimensions by applying the function
+        to the values of each group of rows sharing the same values
+        along the remaining key dimensions. Returns a columnar Table
+        or an ItemTable if no key dimensions remain.
+        """
+        indices = [i for i, d in enumerate(self._cached_index_names)
+                   if d not in dimensions]
+        value_columns = self._value_columns()
+        if not indices:
+            reduced = OrderedDict((vdim, function(values)) for vdim, values
+                                  in zip(self.value_dimensions, value_columns))
+            params = dict(group=self.group) if self.group != type(self).__name__ else {}
+            return ItemTable(reduced, label=self.label, **params)
+
+        groups = self._group_indices(indices)
+        first = np.array([g[0] for g in groups], dtype=int)
+        columns = [self._key_array(i)[first] for i in indices]
+        columns += [np.array([function(values[g]) for g in groups])
+                    for values in value_columns]
+        key_dimensions = [self.key_dimensions[i] for i in indices]
+        names = [d.name for d in key_dimensions] + self._cached_value_names
+        return self.clone(np.rec.fromarrays(columns, names=names),
+                          key_dimensions=key_dimensions)
+
+
     def reduce(self, dimensions=None, function=None, **reduce_map):
         """
         Allows collapsing the Table down by dimension by passing
@@ -310,25 +581,12 @@ class Table(Element, NdMapping):
                             "or as part of the kwargs not both.")
         elif dimensions:
             reduce_map = {d: function for d in dimensions}
-        dim_labels = self._cached_index_names
         reduced_table = self
         for reduce_fn, group in groupby(reduce_map.items(), lambda x: x[1]):
             dims = [dim for dim, _ in group]
-            split_dims = [self.get_dimension(d) for d in dim_labels if d in dims]
-            if len(split_dims) and reduced_table.ndims > 1:
-                split_map = reduced_table.groupby([dim], container_type=HoloMap, group_type=Table)
-                reduced_table = self.clone(shared_data=False, key_dimensions=split_dims)
-                for k, table in split_map.items():
-                    reduced = []
-                    for vdim in self.value_dimensions:
-                        valtable = table.select(value=vdim.name) if len(self.value_dimensions) > 1 else table
-                        reduced = reduce_fn(valtable.data.values())
-                    reduced_table[k] = reduced
-            else:
-                reduced = {vdim: reduce_fn(self.dimension_values(vdim.name))
-                           for vdim in self.value_dimensions}
-                params = dict(group=self.group) if self.value != type(self).__name__ else {}
-                reduced_table = ItemTable(reduced, label=self.label, **params)
+            reduced_table = reduced_table._reduce_dimensions(dims, reduce_fn)
+            if isinstance(reduced_table, ItemTable):
+                break
         return reduced_table
 
 
@@ -352,6 +610,26 @@ class Table(Element, NdMapping):
                              for key, group in zip(data[0].keys(), groups))
 
 
+    def groupby(self, dimensions, container_type=None, group_type=None, **kwargs):
+        if self._columns is None or self.ndims == 1:
+            return super(Table, self).groupby(dimensions, container_type,
+                                              group_type, **kwargs)
+        container_type = container_type if container_type else type(self)
+        group_type = group_type if group_type else type(self)
+        dims, inds = zip(*((self.get_dimension(dim), self.get_dimension_index(dim))
+                         for dim in dimensions))
+        idims = [dim for dim in self.key_dimensions if dim.name not in dimensions]
+        fields = [d.name for d in idims] + self._cached_value_names
+        groups = []
+        for group_inds in self._group_indices(inds):
+            key = self._columns[group_inds[0]].tolist()
+            sel = tuple(key[i] for i in inds)
+            group = self.clone(self._columns[group_inds][fields], key_dimensions=idims,
+                               constant_dimensions=dict(zip(dims, sel)))
+            groups.append((sel, group_type(group, **kwargs)))
+        return container_type(groups, key_dimensions=dims)
+
+
     def tablemap(self, dimensions):
         if len(dimensions) < self.ndims:
             return self.groupby(dimensions, container_type=HoloMap)
@@ -365,7 +643,9 @@ class Table(Element, NdMapping):
     def dimension_values(self, dim):
         if isinstance(dim, Dimension):
             raise Exception('Dimension to be specified by name')
-        if dim in self.dimensions('value', label=True):
+        if self._columns is not None and dim in self.dimensions(label=True):
+            return self._columns[dim]
+        elif dim in self.dimensions('value', label=True):
             if len(self.value_dimensions) == 1: return self.values()
             index = [v.name for v in self.value_dimensions].index(dim)
             return [v[index] for v in self.values()]
@@ -390,6 +670,8 @@ class Table(Element, NdMapping):
         except ImportError:
             raise Exception("Cannot build a DataFrame without the pandas library.")
         labels = [d.name for d in self.dimensions()]
+        if self._columns is not None:
+            return pandas.DataFrame(self._columns, columns=labels)
         return pandas.DataFrame(
             [dict(zip(labels, np.concatenate([np.array(k),v])))
              for (k, v) in self.data.items()])
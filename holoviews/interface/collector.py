@@ -351,6 +351,12 @@ class Collect(object):
         will add a Image to a HoloMap or merge two ViewMaps.
         """
         if isinstance(val, ViewableElement):
+            if isinstance(current_val, HoloMap):
+                try:
+                    current_val.append(time, val)
+                    return current_val
+                except ValueError:
+                    pass
             current_val[time] = val
         elif (isinstance(current_val, UniformNdMapping) and 'Time' not in
               [d.name for d in current_val.key_dimensions]):
@@ -547,8 +553,13 @@ class Collector(AttrTree):
         return task
 
 
-    def __call__(self, attrtree=Layout(), times=[], strict=False):
-
+    def __call__(self, attrtree=Layout(), times=[], strict=False, archive=None):
+        """
+        Run the scheduled tasks at the supplied times, collecting the
+        results into the given Layout. If an Archive is supplied, the
+        frames collected at each time are also appended to it as they
+        are generated.
+        """
         current_time = self.time_fn()
         if times != sorted(times):
             raise Exception("Please supply the list of times in ascending order")
@@ -580,17 +591,55 @@ class Collector(AttrTree):
             # An empty attrtree buffer stops analysis repeatedly
             # computing results over the entire accumulated map
             attrtree_buffer = Layout()
+            mapwise_paths = []
             for task in self._scheduled_tasks:
                 if isinstance(task, Analyze) and task.mapwise:
                     task(attrtree, self.time_fn(), times)
+                    mapwise_paths.append(task.path)
                 else:
                     task(attrtree_buffer, self.time_fn(), times)
                     attrtree.update(attrtree_buffer)
+            if archive is not None:
+                items = list(attrtree_buffer.data.items())
+                items += [(p, attrtree.data[p]) for p in mapwise_paths if p in attrtree.data]
+                self._archive(archive, items)
 
         (self.fixed, attrtree.fixed) = (True, True)
         return attrtree
 
 
+    def _archive(self, archive, items):
+        """
+        Appends the frames of the supplied (path, HoloMap) items that
+        are not yet in the archive, skipping any frames that cannot be
+        archived with a warning.
+        """
+        layout = Layout()
+        for path, hmap in items:
+            name = '.'.join(path)
+            if not isinstance(hmap, HoloMap):
+                param.main.warning("%s at path %s cannot be archived as it is "
+                                   "not a HoloMap." % (type(hmap).__name__, name))
+                continue
+            try:
+                archived = set(archive.keys(path))
+            except KeyError:
+                archived = set()
+            frames = []
+            for key, element in hmap.data.items():
+                if key in archived:
+                    continue
+                elif not archive.archivable(element):
+                    param.main.warning("Frame %r of %s at path %s cannot be archived "
+                                       "and was skipped." % (key, type(element).__name__, name))
+                else:
+                    frames.append((key, element))
+            if frames:
+                layout.set_path(path, hmap.clone(frames))
+        if layout.data:
+            archive.update(layout)
+
+
     def verify_times(self, times, strict=False):
         """
         Given a set of times this method checks that all
@@ -0,0 +1,183 @@
+"""
+A content-addressed cache of rendered output, allowing the display
+hooks and widgets to reuse previously encoded figures when neither
+the displayed data nor the applicable options have changed.
+"""
+
+import os
+import pickle
+import threading
+from hashlib import sha256
+
+import numpy as np
+
+import param
+
+from ..core import OrderedDict
+from ..core.dimension import LabelledData
+from ..core.element import Element
+from ..core.options import Store
+
+
+class RenderCache(param.Parameterized):
+    """
+    RenderCache is a least recently used cache of rendered HTML
+    output. Entries are keyed by a SHA256 digest computed from the
+    data, structure and plot and style options of the displayed
+    object along with any additional display settings (e.g. size,
+    dpi and figure format) that affect the rendered output.
+
+    The cache is bounded both in the number of entries and in the
+    total size of the cached output. If a cache directory is
+    supplied, entries are also persisted to disk so that they may be
+    reused across sessions.
+
+    The cache may be accessed concurrently, e.g. by the threads
+    rendering the frames of a widget in the background.
+    """
+
+    enabled = param.Boolean(default=True, doc="""
+        Whether rendered output is cached and reused.""")
+
+    max_entries = param.Integer(default=1000, bounds=(0, None), doc="""
+        The maximum number of entries held by the cache.""")
+
+    max_size = param.Integer(default=256*1024**2, bounds=(0, None), doc="""
+        The maximum total size of the cached output in bytes.""")
+
+    cache_dir = param.String(default=None, allow_None=True, doc="""
+        Optional directory in which cached entries are persisted.""")
+
+    def __init__(self, **params):
+        super(RenderCache, self).__init__(**params)
+        self._entries = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+
+    def digest(self, obj, *settings):
+        """
+        Returns a hex digest identifying the rendered output of the
+        supplied object given the additional display settings.
+        Returns None if the object cannot be hashed.
+        """
+        if not self.enabled:
+            return None
+        hashfn = sha256()
+        try:
+            hashfn.update(repr(settings).encode('utf-8'))
+            for item in obj.traverse(lambda x: x):
+                self._hash_item(hashfn, item)
+        except Exception:
+            return None
+        return hashfn.hexdigest()
+
+
+    def _hash_item(self, hashfn, item):
+        "Updates the digest with the contents of a single LabelledData item"
+        options = [sorted(Store.lookup_options(item, group).kwargs.items())
+                   for group in ['plot', 'style']]
+        dimensions = [sorted(d.get_param_values())
+                      for d in getattr(item, 'dimensions', lambda: [])()]
+        callback = getattr(item, 'callback', None)
+        if callback is not None:
+            callback = (getattr(callback, '__module__', None),
+                        getattr(callback, '__qualname__',
+                                getattr(callback, '__name__', None)))
+        hashfn.update(repr((type(item).__name__, item.group, item.label,
+                            dimensions, options, callback)).encode('utf-8'))
+        if isinstance(item, Element):
+            columns = getattr(item, '_columns', None)
+            self._hash_data(hashfn, item.data if columns is None else columns)
+        elif isinstance(item, LabelledData) and hasattr(item, 'keys'):
+            hashfn.update(repr(list(item.keys())).encode('utf-8'))
+
+
+    def _hash_data(self, hashfn, data):
+        "Updates the digest with the supplied element data"
+        if isinstance(data, np.ndarray) and not data.dtype.hasobject:
+            hashfn.update(repr((data.dtype.descr, data.shape)).encode('utf-8'))
+            hashfn.update(np.ascontiguousarray(data).view(np.uint8))
+        else:
+            hashfn.update(pickle.dumps(data, protocol=2))
+
+
+    def _path(self, key):
+        return os.path.join(self.cache_dir, '%s.html' % key)
+
+
+    def get(self, key):
+        """
+        Returns the cached output for the supplied key or None if it
+        is not available.
+        """
+        if key is None or not self.enabled:
+            return None
+        with self._lock:
+            if key in self._entries:
+                value = self._entries.pop(key)
+                self._entries[key] = value
+                return value
+            if self.cache_dir and os.path.isfile(self._path(key)):
+                with open(self._path(key), 'rb') as f:
+                    value = f.read().decode('utf-8')
+                self._insert(key, value)
+                return value
+        return None
+
+
+    def set(self, key, value):
+        """
+        Caches the supplied output under the given key, evicting the
+        least recently used entries to satisfy the size bounds.
+        """
+        if key is None or not self.enabled:
+            return value
+        with self._lock:
+            if self.cache_dir:
+                if not os.path.isdir(self.cache_dir):
+                    os.makedirs(self.cache_dir)
+                with open(self._path(key), 'wb') as f:
+                    f.write(value.encode('utf-8'))
+            self._insert(key, value)
+        return value
+
+
+    def _insert(self, key, value):
+        "Inserts an entry, evicting entries as required (requires lock)"
+        if key in self._entries:
+            self._size -= len(self._entries.pop(key))
+        self._entries[key] = value
+        self._size += len(value)
+        while self._entries and (len(self._entries) > self.max_entries
+                                 or self._size > self.max_size):
+            self._evict()
+
+
+    def _evict(self):
+        "Evicts the least recently used entry (requires lock)"
+        key, value = self._entries.popitem(last=False)
+        self._size -= len(value)
+        if self.cache_dir and os.path.isfile(self._path(key)):
+            os.remove(self._path(key))
+
+
+    def clear(self):
+        "Removes all entries from the cache"
+        with self._lock:
+            while self._entries:
+                self._evict()
+
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
+
+
+    def __contains__(self, key):
+        with self._lock:
+            return key in self._entries
+
+
+# The RenderCache instance used by the display hooks and widgets
+render_cache = RenderCache()
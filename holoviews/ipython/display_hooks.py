@@ -4,15 +4,19 @@ Definition and registration of display hooks for the IPython Notebook.
 
 import matplotlib as mpl
 import matplotlib.pyplot as plt
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 
 try:    from matplotlib import animation
 except: animation = None
 
-from IPython.core.pylabtools import print_figure
-
-from tempfile import NamedTemporaryFile
+from tempfile import NamedTemporaryFile, TemporaryFile
 from functools import wraps
-import sys, traceback, base64
+import sys, traceback, base64, io, subprocess, threading
+
+try:
+    from PIL import Image as PILImage
+except ImportError:
+    PILImage = None
 
 try:
     import mpld3
@@ -28,12 +32,16 @@ from ..core import Element, ViewableElement, HoloMap, AdjointLayout, NdLayout,\
 from ..core.traversal import unique_dimkeys, bijective
 from ..element import Raster
 from ..plotting import LayoutPlot, GridPlot, RasterGridPlot, Plot
+from .cache import render_cache
 from .magics import ViewMagic, OptsMagic
 from .widgets import IPySelectionWidget, SelectionWidget, ScrubberWidget
 
 # To assist with debugging of display hooks
 ENABLE_TRACEBACKS=True
 
+# The size of the chunks in which encoded animations are streamed
+CHUNK_SIZE = 2**16
+
 #==================#
 # Helper functions #
 #==================#
@@ -50,28 +58,110 @@ def get_plot_size(size):
 
 
 def animate(anim, dpi, writer, mime_type, anim_kwargs, extra_args, tag):
+    """
+    Encodes a matplotlib animation with the given writer, saving it
+    if a filename is set on ViewMagic and returning the HTML tag
+    displaying it. The animation is only encoded once, with the
+    resulting file streamed to the save file and the base64 encoder.
+    """
     if extra_args != []:
         anim_kwargs = dict(anim_kwargs, extra_args=extra_args)
-    ViewMagic.save_anim(anim, mime_type, writer, dpi=dpi, **anim_kwargs)
-
-    if not hasattr(anim, '_encoded_video'):
+    sink = ViewMagic.figure_sink(mime_type)
+    stream = FigureStream(sink)
+    try:
         with NamedTemporaryFile(suffix='.%s' % mime_type) as f:
             anim.save(f.name, writer=writer, dpi=dpi, **anim_kwargs)
-            video = open(f.name, "rb").read()
-        anim._encoded_video = base64.b64encode(video).decode("utf-8")
-    return tag.format(b64=anim._encoded_video,
-                      mime_type=mime_type)
+            with open(f.name, 'rb') as video:
+                for chunk in iter(lambda: video.read(CHUNK_SIZE), b''):
+                    stream.write(chunk)
+    finally:
+        if sink is not None:
+            sink.close()
+    return tag.format(b64=stream.b64, mime_type=mime_type)
+
+
+def stream_video(plot, fileobj, fps, dpi, mime_type, anim_kwargs, extra_args, step=1):
+    """
+    Encodes the frames of a plot as a video using a single ffmpeg
+    process. Each frame is rendered with update_frame and its raw
+    RGBA buffer piped into ffmpeg, while the encoded output is
+    written to the supplied file object as it is produced.
+    """
+    fig = plot()
+    canvas = FigureCanvasAgg(fig)
+    fig.set_dpi(dpi)
+    width, height = canvas.get_width_height()
+    cmd = [mpl.rcParams['animation.ffmpeg_path'], '-y',
+           '-f', 'rawvideo', '-vcodec', 'rawvideo', '-pix_fmt', 'rgba',
+           '-s', '%dx%d' % (width, height), '-r', str(anim_kwargs.get('fps', fps)),
+           '-i', 'pipe:0']
+    if 'codec' in anim_kwargs:
+        cmd += ['-vcodec', anim_kwargs['codec']]
+    # Most codecs require even frame dimensions
+    cmd += list(extra_args) + ['-vf', 'pad=ceil(iw/2)*2:ceil(ih/2)*2']
+    if mime_type == 'mp4':
+        # MP4 output is only streamable as fragments
+        cmd += ['-movflags', 'frag_keyframe+empty_moov']
+    cmd += ['-f', mime_type, 'pipe:1']
+
+    errors = TemporaryFile()
+    try:
+        proc = subprocess.Popen(cmd, stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                                stderr=errors)
+        def read_output():
+            for chunk in iter(lambda: proc.stdout.read(CHUNK_SIZE), b''):
+                fileobj.write(chunk)
+        reader = threading.Thread(target=read_output)
+        reader.start()
+        try:
+            for key in plot.keys[::step]:
+                plot.update_frame(key)
+                canvas.draw()
+                proc.stdin.write(canvas.buffer_rgba())
+        except IOError:
+            pass
+        finally:
+            proc.stdin.close()
+            reader.join()
+            proc.wait()
+        if proc.returncode != 0:
+            errors.seek(0)
+            message = errors.read().decode('utf-8', 'replace').strip().splitlines()
+            raise IOError("ffmpeg failed to encode the animation: %s"
+                          % (message[-1] if message else proc.returncode))
+    finally:
+        errors.close()
+        plt.close(fig)
+
+
+def animate_plot(plot, dpi, writer, mime_type, anim_kwargs, extra_args, tag):
+    """
+    Animates the plot in the given format, streaming the frames into
+    a single encoder process if the ffmpeg writer is used. Every nth
+    frame is rendered according to the frame_step option of ViewMagic.
+    """
+    fps, step = ViewMagic.options['fps'], ViewMagic.options['frame_step']
+    if writer != 'ffmpeg':
+        return animate(plot.anim(fps=fps, step=step), dpi, writer,
+                       mime_type, anim_kwargs, extra_args, tag)
+    sink = ViewMagic.figure_sink(mime_type)
+    stream = FigureStream(sink)
+    try:
+        stream_video(plot, stream, fps, dpi, mime_type, anim_kwargs, extra_args, step)
+    finally:
+        if sink is not None:
+            sink.close()
+    return tag.format(b64=stream.b64, mime_type=mime_type)
 
 
 def HTML_video(plot):
     dpi = ViewMagic.options['dpi']
-    anim = plot.anim(fps=ViewMagic.options['fps'])
     writers = animation.writers.avail
     current_format = ViewMagic.options['holomap']
     for fmt in [current_format] + list(ViewMagic.ANIMATION_OPTS.keys()):
         if ViewMagic.ANIMATION_OPTS[fmt][0] in writers:
             try:
-                return animate(anim, dpi, *ViewMagic.ANIMATION_OPTS[fmt])
+                return animate_plot(plot, dpi, *ViewMagic.ANIMATION_OPTS[fmt])
             except: pass
     msg = "<b>Could not generate %s animation</b>" % current_format
     if sys.version_info[0] == 3 and mpl.__version__[:-2] in ['1.2', '1.3']:
@@ -110,6 +200,27 @@ def process_cell_magics(obj):
     ViewMagic.register_object(obj)
 
 
+def cache_key(obj, *args):
+    """
+    Returns the render cache key of an object given the current
+    display options and any additional arguments. Caching is disabled
+    while figures are being saved or digested and for the d3 backend,
+    as its output embeds figure ids that must be unique on the page.
+    """
+    if (ViewMagic._generate_SHA or ViewMagic.options['filename'] is not None
+        or ViewMagic.options['backend'] == 'd3'):
+        return None
+    return render_cache.digest(obj, list(ViewMagic.options.items()), args)
+
+
+def cached_display(key, render_fn):
+    "Returns the cached output for the key, rendering it if unavailable"
+    html = render_cache.get(key)
+    if html is None:
+        html = render_cache.set(key, render_fn())
+    return html
+
+
 def render(plot):
     try:
         return render_anim(plot)
@@ -117,7 +228,7 @@ def render(plot):
         return str(e)+'<br/>'+display_figure(plot())
 
 
-def display_widgets(plot):
+def display_widgets(plot, key=None):
     "Display widgets applicable to the specified view"
     widget_mode = ViewMagic.options['widgets']
     widget_format = ViewMagic.options['holomap']
@@ -134,13 +245,95 @@ def display_widgets(plot):
         widget_format = 'scrubber' if islinear or not isuniform else 'widgets'
 
     if widget_format == 'scrubber':
-        return ScrubberWidget(plot)()
+        return ScrubberWidget(plot, cache_key=key)()
     if widget_mode == 'embed':
-        return SelectionWidget(plot)()
+        return SelectionWidget(plot, cache_key=key)()
     elif widget_mode == 'cached':
-        return IPySelectionWidget(plot, cached=True)()
+        return IPySelectionWidget(plot, cached=True, cache_key=key)()
+    elif widget_mode == 'prefetch':
+        return IPySelectionWidget(plot, cached=False, cache_key=key)()
     else:
-        return IPySelectionWidget(plot, cached=False)()
+        return IPySelectionWidget(plot, cached=False, prefetch=0, cache_key=key)()
+
+
+class FigureStream(io.RawIOBase):
+    """
+    A write-only file object passing the bytes of a figure on to an
+    optional sink (e.g. the file the figure is saved to) as they are
+    rendered, while base64 encoding them incrementally. This allows a
+    figure to be rasterized once and encoded for display without
+    holding multiple copies of the output.
+    """
+
+    def __init__(self, sink=None):
+        super(FigureStream, self).__init__()
+        self.sink = sink
+        self._remainder = b''
+        self._encoded = []
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        data = bytes(data)
+        if self.sink is not None:
+            self.sink.write(data)
+        # Only complete 3-byte groups may be encoded independently
+        buffered = self._remainder + data
+        split = len(buffered) - len(buffered) % 3
+        self._encoded.append(base64.b64encode(buffered[:split]).decode('utf-8'))
+        self._remainder = buffered[split:]
+        return len(data)
+
+    @property
+    def b64(self):
+        "The base64 encoding of all the data written so far"
+        return ''.join(self._encoded) + base64.b64encode(self._remainder).decode('utf-8')
+
+
+def render_figure(fig, fileobj, figure_format, dpi):
+    """
+    Renders the figure in the given format to the supplied file
+    object, applying the compression and colors options of ViewMagic
+    to PNG output.
+    """
+    kwargs = dict(format=figure_format, dpi=dpi, bbox_inches='tight',
+                  facecolor=fig.get_facecolor(), edgecolor=fig.get_edgecolor())
+    compression = ViewMagic.options.get('compression', None)
+    colors = ViewMagic.options.get('colors', None)
+    if figure_format != 'png' or (compression is None and colors is None):
+        fig.canvas.print_figure(fileobj, **kwargs)
+    elif PILImage is None:
+        param.main.warning("Compressing or quantizing PNG output requires "
+                           "PIL, ignoring the compression and colors options.")
+        fig.canvas.print_figure(fileobj, **kwargs)
+    else:
+        # The rasterized image is reencoded by PIL, as the compression
+        # level cannot be passed to all versions of matplotlib
+        buf = io.BytesIO()
+        fig.canvas.print_figure(buf, **kwargs)
+        buf.seek(0)
+        image = PILImage.open(buf)
+        if colors is not None:
+            image = image.convert('RGBA').quantize(colors)
+        image.save(fileobj, 'png', compress_level=6 if compression is None else compression)
+
+
+def encode_figure(fig, figure_format, dpi):
+    """
+    Renders the figure once, returning it as a base64 encoded data
+    URI while saving it to file (or computing its digest) as it is
+    rendered if a filename is set on ViewMagic.
+    """
+    sink = ViewMagic.figure_sink(figure_format)
+    stream = FigureStream(sink)
+    try:
+        render_figure(fig, stream, figure_format, dpi)
+    finally:
+        if sink is not None:
+            sink.close()
+    mime_type = 'svg+xml' if figure_format == 'svg' else 'png'
+    return 'data:image/%s;base64,%s' % (mime_type, stream.b64)
 
 
 def display_figure(fig, message=None, max_width='100%'):
@@ -154,15 +347,7 @@ def display_figure(fig, message=None, max_width='100%'):
         mpld3.plugins.connect(fig, mpld3.plugins.MousePosition(fontsize=14))
         html = "<center>" + mpld3.fig_to_html(fig) + "<center/>"
     else:
-        ViewMagic.save_fig(fig, figure_format, dpi=dpi)
-        figdata = print_figure(fig, figure_format, dpi=dpi)
-        if figure_format=='svg':
-            mime_type = 'svg+xml'
-            figdata = figdata.encode("utf-8")
-        else:
-            mime_type = 'png'
-        prefix = 'data:image/%s;base64,' % mime_type
-        b64 = prefix + base64.b64encode(figdata).decode("utf-8")
+        b64 = encode_figure(fig, figure_format, dpi)
         html = "<center><img src='%s' style='max-width:%s'/><center/>" % (b64, max_width)
     plt.close(fig)
     return html if (message is None) else '<b>%s</b></br>%s' % (message, html)
@@ -211,9 +396,11 @@ def view_display(view, size, **kwargs):
     magic_info = process_cell_magics(view)
     if magic_info: return magic_info
     if view.__class__ not in Store.defaults: return None
-    fig = Store.defaults[view.__class__](view,
-                                         **opts(view, get_plot_size(size)))()
-    return display_figure(fig)
+    def render_view():
+        fig = Store.defaults[view.__class__](view,
+                                             **opts(view, get_plot_size(size)))()
+        return display_figure(fig)
+    return cached_display(cache_key(view, size), render_view)
 
 
 @display_hook
@@ -222,6 +409,7 @@ def map_display(vmap, size, map_format, max_frames, widget_mode, **kwargs):
     magic_info = process_cell_magics(vmap)
     if magic_info: return magic_info
     if vmap.type not in Store.defaults:  return None
+    key = cache_key(vmap, size, widget_mode)
     mapplot = Store.defaults[vmap.type](vmap,
                                         **opts(vmap.last, get_plot_size(size)))
     if len(mapplot) == 0:
@@ -230,12 +418,11 @@ def map_display(vmap, size, map_format, max_frames, widget_mode, **kwargs):
         max_frame_warning(max_frames)
         return sanitized_repr(vmap)
     elif len(mapplot) == 1:
-        fig = mapplot()
-        return display_figure(fig)
+        return cached_display(key, lambda: display_figure(mapplot()))
     elif widget_mode is not None:
-        return display_widgets(mapplot)
+        return display_widgets(mapplot, key)
     else:
-        return render(mapplot)
+        return cached_display(key, lambda: render(mapplot))
 
 
 @display_hook
@@ -260,13 +447,13 @@ def layout_display(layout, size, map_format, max_frames, max_branches, widget_mo
                 max_frame_warning(max_frames)
                 return '<tt>'+ sanitized_repr(layout) + '</tt>'
 
+    key = cache_key(layout, size, widget_mode)
     if nframes == 1:
-        fig = layoutplot()
-        return display_figure(fig)
+        return cached_display(key, lambda: display_figure(layoutplot()))
     elif widget_mode is not None:
-        return display_widgets(layoutplot)
+        return display_widgets(layoutplot, key)
     else:
-        return render(layoutplot)
+        return cached_display(key, lambda: render(layoutplot))
 
 
 @display_hook
@@ -295,13 +482,13 @@ def grid_display(grid, size, map_format, max_frames, max_branches, widget_mode,
     if len(gridplot) > max_frames:
         max_frame_warning(max_frames)
         return sanitized_repr(grid)
-    elif len(gridplot) == 1:
-        fig = gridplot()
-        return display_figure(fig)
+    key = cache_key(grid, size, widget_mode)
+    if len(gridplot) == 1:
+        return cached_display(key, lambda: display_figure(gridplot()))
     if widget_mode is not None:
-        return display_widgets(gridplot)
+        return display_widgets(gridplot, key)
     else:
-        return render(gridplot)
+        return cached_display(key, lambda: render(gridplot))
 
 
 # HTML_video output by default, but may be set to first_frame,
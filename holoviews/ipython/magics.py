@@ -4,7 +4,6 @@ import os
 from hashlib import sha256
 try:
     from IPython.core.magic import Magics, magics_class, cell_magic, line_magic, line_cell_magic
-    from IPython.core.pylabtools import print_figure
 except:
     from unittest import SkipTest
     raise SkipTest("IPython extension requires IPython >= 0.13")
@@ -69,26 +68,32 @@ class ViewMagic(Magics):
     allowed = {'backend'     : ['mpl','d3'],
                'fig'         : ['svg', 'png'],
                'holomap'     : inbuilt_formats,
-               'widgets'     : ['embed', 'live', 'cached'],
+               'widgets'     : ['embed', 'live', 'prefetch', 'cached'],
                'fps'         : (0, float('inf')),
+               'frame_step'  : (1, float('inf')),
                'max_frames'  : (0, float('inf')),
                'max_branches': (0, float('inf')),
                'size'        : (0, float('inf')),
                'dpi'         : (1, float('inf')),
                'charwidth'   : (0, float('inf')),
-               'filename'   : {None, '{type}-{group}-{label}'}}
+               'filename'   : {None, '{type}-{group}-{label}'},
+               'compression' : (0, 9),
+               'colors'      : (2, 256)}
 
     defaults = OrderedDict([('backend'     , 'mpl'),
                             ('fig'         , 'png'),
                             ('holomap'     , 'auto'),
                             ('widgets'     , 'embed'),
                             ('fps'         , 20),
+                            ('frame_step'  , 1),
                             ('max_frames'  , 500),
                             ('max_branches', 2),
                             ('size'        , 100),
                             ('dpi'         , 72),
                             ('charwidth'   , 80),
-                            ('filename'    , None)])
+                            ('filename'    , None),
+                            ('compression' , None),
+                            ('colors'      , None)])
 
     options = OrderedDict(defaults.items())
 
@@ -133,6 +138,8 @@ class ViewMagic(Magics):
         widgets = "widgets      : The widget mode for widgets %r" % cls.allowed['widgets']
         fps =    ("fps          : The frames per second for animations (default %r)"
                   % cls.defaults['widgets'])
+        step =   ("frame_step   : Render every nth frame of animations (default %r)"
+                  % cls.defaults['frame_step'])
         frames=  ("max_frames   : The max number of frames rendered (default %r)"
                   % cls.defaults['max_frames'])
         branches=("max_branches : The max number of Layout branches rendered (default %r)"
@@ -145,7 +152,12 @@ class ViewMagic(Magics):
                   % cls.defaults['charwidth'])
         fname =  ("filename    : The filename of the saved output, if any (default %r)"
                   % cls.defaults['filename'])
-        descriptions = [backend, fig, holomap, widgets, fps, frames, branches, size, dpi, chars, fname]
+        compression = ("compression  : The zlib compression level of PNG output (default %r)"
+                       % cls.defaults['compression'])
+        colors = ("colors       : The number of colors PNG output is quantized to (default %r)"
+                  % cls.defaults['colors'])
+        descriptions = [backend, fig, holomap, widgets, fps, step, frames, branches, size, dpi, chars, fname,
+                        compression, colors]
         return '\n'.join(intro + descriptions)
 
 
@@ -186,7 +198,7 @@ class ViewMagic(Magics):
         valid_fields = ['type', 'group', 'label']
         try:
             parse = list(string.Formatter().parse(filename))
-            fields = [f for f in zip(*parse)[1] if f is not None]
+            fields = [f for f in list(zip(*parse))[1] if f is not None]
         except:
             raise SyntaxError("Could not parse filename string formatter")
         if any(f not in valid_fields for f in fields):
@@ -325,29 +337,35 @@ class ViewMagic(Magics):
         return filename
 
     @classmethod
-    def _digest(cls, data):
-        if cls._generate_SHA:
-            hashfn = sha256()
-            hashfn.update(data)
-            cls._SHA  = hashfn.hexdigest()
-            return True
-        else:
-            return False
-
-    @classmethod
-    def save_fig(cls, fig, figure_format, dpi):
+    def figure_sink(cls, figure_format):
+        """
+        Returns a file-like object the rendered figure may be written
+        to in order to save it under the configured filename (or to
+        compute its digest when testing), or None if figures are not
+        being saved.
+        """
         filename = cls._save_filename(figure_format)
-        if filename is None: return
-        figure_data = print_figure(fig, figure_format, dpi=dpi)
-        if cls._digest(figure_data): return
-        with open(filename, 'w') as f:
-            f.write(figure_data)
+        if filename is None: return None
+        return DigestSink(cls) if cls._generate_SHA else open(filename, 'wb')
 
-    @classmethod
-    def save_anim(cls, anim, mime_type, writer, dpi, **anim_kwargs):
-        filename = cls._save_filename(mime_type)
-        if filename is None: return
-        anim.save(filename, writer=writer, dpi=dpi, **anim_kwargs)
+
+
+class DigestSink(object):
+    """
+    File-like object computing the SHA256 digest of the data written
+    to it, which is stored on the supplied ViewMagic class when the
+    sink is closed.
+    """
+
+    def __init__(self, magic):
+        self.magic = magic
+        self.hashfn = sha256()
+
+    def write(self, data):
+        self.hashfn.update(data)
+
+    def close(self):
+        self.magic._SHA = self.hashfn.hexdigest()
 
 
 
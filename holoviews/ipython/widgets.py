@@ -1,8 +1,15 @@
 import os, sys, math, time, uuid, json
+import multiprocessing
+import threading
 from unittest import SkipTest
 
 import numpy as np
 
+try:
+    import asyncio
+except ImportError:
+    asyncio = None
+
 try:
     import IPython
     from IPython.core.display import clear_output
@@ -24,6 +31,7 @@ import param
 
 from ..core import OrderedDict, NdMapping
 from ..plotting import Plot
+from .cache import render_cache
 from .magics import ViewMagic
 
 
@@ -31,6 +39,10 @@ class ProgressBar(param.Parameterized):
     """
     A simple text progress bar suitable for both the IPython notebook
     and the IPython interactive prompt.
+
+    Updates are coalesced to at most refresh_rate displays per second
+    and displayed from a background thread, so that frequent updates
+    add little overhead to the process being monitored.
     """
 
     display = param.ObjectSelector(default='stdout',
@@ -66,20 +78,99 @@ class ProgressBar(param.Parameterized):
         If enabled, the progress bar will disappear and display the
         total elapsed time once 100% completion is reached.""")
 
+    refresh_rate = param.Number(default=10, bounds=(0, None), doc="""
+        The maximum number of times per second the progress is
+        displayed or broadcast. Updates arriving in between are
+        coalesced, only displaying the latest percentage. If zero,
+        every update is displayed immediately.""")
+
+    background = param.Boolean(default=True, doc="""
+        Whether coalesced updates are displayed from a background
+        thread, rather than by the caller once the refresh interval
+        has elapsed.""")
+
     cache = {}
 
     def __init__(self, **params):
         self.start_time = None
+        self._lock = threading.Lock()
+        self._pending = None
+        self._thread = None
+        self._last_display = 0
         super(ProgressBar,self).__init__(**params)
 
     def __call__(self, percentage):
         " Update the progress bar within the specified percent_range"
         if self.start_time is None: self.start_time = time.time()
-        span = (self.percent_range[1]-self.percent_range[0])
-        percentage = self.percent_range[0] + ((percentage/100.0) * span)
+        start, end = self.percent_range
+        percentage = start + ((percentage/100.0) * (end - start))
+
+        if self._thread is not None and percentage != 100:
+            # Coalesced with the update pending on the background thread
+            self._pending = percentage
+            return
+        elif self.display == 'disabled': return
+        elif percentage == 100 or not self.refresh_rate:
+            # Pending updates are superseded by the final update
+            self._pending = None
+            self.flush()
+            self._display(percentage)
+        elif self.background:
+            self._pending = percentage
+            if self._thread is None:
+                self._start_thread()
+        else:
+            now = time.time()
+            if now - self._last_display >= 1.0 / self.refresh_rate:
+                self._last_display = now
+                self._display(percentage)
+
+
+    def flush(self):
+        """
+        Waits for the background thread to display any pending update
+        and exit.
+        """
+        thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+
 
-        if self.display == 'disabled': return
-        elif self.display == 'stdout':
+    def _start_thread(self):
+        "Starts the background thread unless it is already running"
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._display_pending)
+                self._thread.daemon = True
+                self._thread.start()
+
+
+    def _display_pending(self):
+        """
+        Displays the latest pending update at most refresh_rate times
+        per second, exiting once no update has arrived within an
+        interval.
+        """
+        while True:
+            percentage, self._pending = self._pending, None
+            if percentage is None:
+                with self._lock:
+                    self._thread = None
+                # An update may have arrived while the thread exited,
+                # in which case the thread resumes unless replaced
+                if self._pending is None:
+                    return
+                with self._lock:
+                    if self._thread is not None:
+                        return
+                    self._thread = threading.current_thread()
+                continue
+            self._display(percentage)
+            time.sleep(1.0 / self.refresh_rate)
+
+
+    def _display(self, percentage):
+        if self.display == 'stdout':
             if percentage==100 and self.elapsed_time:
                 elapsed = time.time() -  self.start_time
                 if clear_output and not ipython2: clear_output()
@@ -87,7 +178,6 @@ class ProgressBar(param.Parameterized):
                 sys.stdout.write('\r' + '100%% %s %02d:%02d:%02d'
                                  % (self.label.lower(), elapsed//3600,
                                     elapsed//60, elapsed%60))
-                return
             else:
                 self._stdout_display(percentage)
             return
@@ -96,7 +186,7 @@ class ProgressBar(param.Parameterized):
             self.cache['socket'] = self._get_socket()
 
         if self.cache['socket'] is not None:
-            self.cache['socket'].send('%s|%s' % (percentage, self.label))
+            self.cache['socket'].send(('%s|%s' % (percentage, self.label)).encode('utf-8'))
 
 
     def _stdout_display(self, percentage):
@@ -112,7 +202,6 @@ class ProgressBar(param.Parameterized):
                             ' '*len(self.fill_char) * blank_count,
                             percentage))
         sys.stdout.flush()
-        time.sleep(0.0001)
 
     def _get_socket(self, min_port=8080, max_port=8100, max_tries=20):
         import zmq
@@ -134,6 +223,10 @@ class RemoteProgress(ProgressBar):
     """
     Connect to a progress bar in a separate process with output_mode
     set to 'broadcast' in order to display the results (to stdout).
+
+    Calling a RemoteProgress blocks while displaying the progress,
+    whereas attach displays it from an asyncio event loop, e.g. the
+    one running the IPython kernel, without blocking.
     """
 
     hostname=param.String(default='localhost', doc="""
@@ -144,29 +237,65 @@ class RemoteProgress(ProgressBar):
 
     def __init__(self, port, **params):
         super(RemoteProgress, self).__init__(port=port, **params)
+        self.percent = None
 
-    def __call__(self):
+    def _connect(self):
         import zmq
         context = zmq.Context()
         sock = context.socket(zmq.SUB)
-        sock.setsockopt(zmq.SUBSCRIBE, '')
+        sock.setsockopt(zmq.SUBSCRIBE, b'')
         sock.connect('tcp://' + self.hostname +':'+str(self.port))
+        return sock
+
+    def _receive(self, message):
+        "Displays the progress contained in a broadcast message"
+        try:
+            [percent_str, label] = message.decode('utf-8').split('|')
+            self.percent = float(percent_str)
+            self.label = label
+            super(RemoteProgress, self).__call__(self.percent)
+        except Exception:
+            self.message("Could not process socket message: %r"
+                         % message)
+
+    def __call__(self):
+        sock = self._connect()
         # Get progress via socket
-        percent = None
         while True:
             try:
-                message= sock.recv()
-                [percent_str, label] = message.split('|')
-                percent = float(percent_str)
-                self.label = label
-                super(RemoteProgress, self).__call__(percent)
+                self._receive(sock.recv())
             except KeyboardInterrupt:
-                if percent is not None:
-                    self.message("Exited at %.3f%% completion" % percent)
+                if self.percent is not None:
+                    self.message("Exited at %.3f%% completion" % self.percent)
                 break
-            except:
-                self.message("Could not process socket message: %r"
-                             % message)
+        sock.close()
+
+    def attach(self, loop=None):
+        """
+        Displays the broadcast progress from the supplied asyncio
+        event loop (by default the current event loop) as messages
+        arrive. Returns a function which detaches the consumer from
+        the event loop again.
+        """
+        if asyncio is None:
+            raise ImportError("RemoteProgress.attach requires asyncio.")
+        import zmq
+        loop = asyncio.get_event_loop() if loop is None else loop
+        sock = self._connect()
+
+        def receive():
+            # The socket file descriptor is edge-triggered, so all
+            # queued messages have to be consumed on each event
+            while sock.getsockopt(zmq.EVENTS) & zmq.POLLIN:
+                self._receive(sock.recv(zmq.NOBLOCK))
+
+        def detach():
+            loop.remove_reader(sock.getsockopt(zmq.FD))
+            sock.close()
+
+        loop.add_reader(sock.getsockopt(zmq.FD), receive)
+        loop.call_soon(receive)
+        return detach
 
 
 class RunProgress(ProgressBar):
@@ -260,6 +389,38 @@ def get_plot_size():
             Plot.figure_size[1] * factor)
 
 
+def _render_pool(processes, widget):
+    """
+    Returns a multiprocessing Pool using forked workers, which inherit
+    the widget being rendered along with its plot and matplotlib
+    figure. Returns None where forking is not supported.
+    """
+    if sys.platform == 'win32':
+        return None
+    args = (processes, _init_render_worker, (widget,))
+    if hasattr(multiprocessing, 'get_context'):
+        try:
+            return multiprocessing.get_context('fork').Pool(*args)
+        except ValueError:
+            return None
+    return multiprocessing.Pool(*args)
+
+
+# The widget rendered by a worker process of a render pool
+_worker_widget = None
+
+def _init_render_worker(widget):
+    "Sets the widget rendered by a worker process"
+    global _worker_widget
+    _worker_widget = widget
+
+
+def _render_frame(idx):
+    "Renders a single frame of the widget inherited by a worker process"
+    return idx, _worker_widget._plot_figure(idx)
+
+
+
 class NdWidget(param.Parameterized):
     """
     NdWidget is an abstract base class implementing a method to
@@ -268,6 +429,16 @@ class NdWidget(param.Parameterized):
     and keys.
     """
 
+    processes = param.Integer(default=None, allow_None=True, bounds=(1, None), doc="""
+        The number of worker processes used to render the frames. Each
+        worker renders frames using its own copy of the plot and
+        figure. By default all frames are rendered sequentially.""")
+
+    cache_key = param.String(default=None, allow_None=True, doc="""
+        The render cache key of the displayed object. If supplied, the
+        rendered frames are stored in and retrieved from the render
+        cache.""")
+
     def __init__(self, plot, **params):
         super(NdWidget, self).__init__(**params)
         self.plot = plot
@@ -276,6 +447,30 @@ class NdWidget(param.Parameterized):
         # Create mock NdMapping to hold the common dimensions and keys
         self.mock_obj = NdMapping([(k, None) for k in self.keys],
                                   key_dimensions=self.dimensions)
+        self._key_index = {k: i for i, k in enumerate(self.keys)}
+        self._dim_values = [sorted(set(k[i] for k in self.keys))
+                            for i in range(len(self.dimensions))]
+        self._dim_positions = [{v: i for i, v in enumerate(vals)}
+                               for vals in self._dim_values]
+
+
+    def _neighbours(self, idx, distance):
+        """
+        Returns the indices of the keys within the given number of
+        steps of the key at the supplied index along each dimension,
+        ordered from the closest to the furthest.
+        """
+        key = self.keys[idx]
+        neighbours = []
+        for step in range(1, distance+1):
+            for didx, vals in enumerate(self._dim_values):
+                pos = self._dim_positions[didx][key[didx]]
+                for npos in [pos+step, pos-step]:
+                    if not 0 <= npos < len(vals): continue
+                    nkey = key[:didx] + (vals[npos],) + key[didx+1:]
+                    if nkey in self._key_index:
+                        neighbours.append(self._key_index[nkey])
+        return neighbours
 
 
     def _plot_figure(self, idx):
@@ -288,6 +483,218 @@ class NdWidget(param.Parameterized):
         return display_figure(fig)
 
 
+    def _frame_key(self, idx):
+        "Returns the render cache key of the frame at the supplied index"
+        if self.cache_key is None or ViewMagic.options['backend'] == 'd3':
+            return None
+        return '%s-%d' % (self.cache_key, idx)
+
+
+    def _get_frame(self, idx):
+        "Returns the frame at the supplied index, using the render cache"
+        frame = render_cache.get(self._frame_key(idx))
+        if frame is None:
+            frame = self._plot_figure(idx)
+            render_cache.set(self._frame_key(idx), frame)
+        return frame
+
+
+    def _render_frames(self):
+        """
+        Returns a generator yielding (index, frame) tuples for all the
+        frames of the plot. The first frame is always rendered
+        immediately in the current process, the remaining frames are
+        rendered by a pool of worker processes (if enabled) and are
+        yielded in the order in which they complete. Frames available
+        in the render cache are not rendered again.
+
+        The pool is created by the calling thread, so the returned
+        generator may safely be consumed by another thread.
+        """
+        frames = [(0, self._get_frame(0))]
+        indices = []
+        for idx in range(1, len(self.plot)):
+            frame = render_cache.get(self._frame_key(idx))
+            if frame is None:
+                indices.append(idx)
+            else:
+                frames.append((idx, frame))
+        pool = _render_pool(self.processes, self) if self.processes and indices else None
+        return self._yield_frames(frames, indices, pool)
+
+
+    def _yield_frames(self, frames, indices, pool):
+        """
+        Yields the supplied frames followed by the frames left to
+        render, terminating and joining the pool (if any) once the
+        generator is exhausted or closed.
+        """
+        try:
+            for idx, frame in frames:
+                yield idx, frame
+            if pool is None:
+                for idx in indices:
+                    yield idx, self._get_frame(idx)
+                return
+            for idx, frame in pool.imap_unordered(_render_frame, indices):
+                render_cache.set(self._frame_key(idx), frame)
+                yield idx, frame
+        finally:
+            if pool is not None:
+                pool.terminate()
+                pool.join()
+
+
+
+class FramePrefetcher(object):
+    """
+    FramePrefetcher renders the frames of a widget on demand, holding
+    them in a least recently used cache. Requested frames that are
+    not cached are rendered later, after which the neighbouring frames
+    of the requested frame are prefetched.
+
+    Only the most recent request is rendered and passed on to the
+    callback, so requests superseded before a frame is rendered (e.g.
+    when dragging a slider) are never rendered, and pending prefetches
+    are replaced on every request.
+
+    If a schedule function is supplied, it is called with a callable
+    rendering the next pending frame, which it should call later on
+    the thread owning the figures being rendered, as matplotlib
+    figures may not be drawn from other threads. Otherwise the frames
+    are rendered by a background thread.
+    """
+
+    def __init__(self, render_fn, callback, neighbours_fn=None, cache_size=100,
+                 schedule=None):
+        self.render_fn = render_fn
+        self.callback = callback
+        self.neighbours_fn = neighbours_fn
+        self.cache_size = cache_size
+        self.schedule = schedule
+        self.frames = OrderedDict()
+        self._lock = threading.Lock()
+        self._render_lock = threading.Lock()
+        self._requested = None
+        self._prefetch = []
+        self._pending = False
+        self._thread = None
+
+
+    def _cached(self, idx):
+        "Returns a cached frame marking it as recently used (requires lock)"
+        frame = self.frames.pop(idx, None)
+        if frame is not None:
+            self.frames[idx] = frame
+        return frame
+
+
+    def _store(self, idx, frame):
+        "Caches a frame, evicting the least recently used (requires lock)"
+        self.frames.pop(idx, None)
+        self.frames[idx] = frame
+        while len(self.frames) > self.cache_size:
+            self.frames.popitem(last=False)
+
+
+    def __getitem__(self, idx):
+        "Returns the frame at the supplied index, rendering it if required"
+        with self._lock:
+            frame = self._cached(idx)
+        if frame is None:
+            with self._render_lock:
+                frame = self.render_fn(idx)
+            with self._lock:
+                self._store(idx, frame)
+        return frame
+
+
+    def request(self, idx):
+        """
+        Requests the frame at the supplied index, returning it if it is
+        cached. Otherwise None is returned and the frame is passed to
+        the callback once it has been rendered, unless another frame
+        has been requested in the meantime.
+        """
+        with self._lock:
+            frame = self._cached(idx)
+            self._requested = None if frame is not None else idx
+            neighbours = self.neighbours_fn(idx) if self.neighbours_fn else []
+            self._prefetch = [n for n in neighbours[:self.cache_size-1]
+                              if n not in self.frames]
+            start = (self._requested is not None or self._prefetch) and not self._pending
+            if start:
+                self._pending = True
+                if self.schedule is None:
+                    self._thread = threading.Thread(target=self._render_pending)
+                    self._thread.daemon = True
+                    self._thread.start()
+        if start and self.schedule is not None:
+            self.schedule(self._render_scheduled)
+        return frame
+
+
+    def flush(self):
+        "Waits for the background thread to render all pending frames"
+        thread = self._thread
+        if thread is not None:
+            thread.join()
+
+
+    def _render_next(self):
+        """
+        Renders the requested frame or else the next frame to be
+        prefetched, returning whether there was a frame to render.
+        """
+        with self._lock:
+            if self._requested is not None:
+                idx, self._requested, requested = self._requested, None, True
+            elif self._prefetch:
+                idx, requested = self._prefetch.pop(0), False
+            else:
+                self._pending = False
+                return False
+            frame = self._cached(idx)
+        if frame is None:
+            try:
+                with self._render_lock:
+                    frame = self.render_fn(idx)
+            except Exception as e:
+                param.main.warning("Could not render frame %d: %s" % (idx, e))
+                return True
+        with self._lock:
+            self._store(idx, frame)
+            # Only deliver the frame if it has not been superseded
+            deliver = requested and self._requested is None
+        if deliver:
+            self.callback(idx, frame)
+        return True
+
+
+    def _render_scheduled(self):
+        "Renders a single frame, scheduling the next one if any remain"
+        if self._render_next():
+            self.schedule(self._render_scheduled)
+
+
+    def _render_pending(self):
+        "Renders frames in the background until none are left to render"
+        while self._render_next():
+            pass
+
+
+
+def _kernel_scheduler():
+    """
+    Returns a function scheduling a callable on the event loop of the
+    running IPython kernel, or None if there is no such event loop.
+    """
+    try:
+        return IPython.get_ipython().kernel.io_loop.add_callback
+    except AttributeError:
+        return None
+
+
 
 class IPySelectionWidget(NdWidget):
     """
@@ -299,7 +706,17 @@ class IPySelectionWidget(NdWidget):
     """
 
     cached = param.Boolean(default=True, doc="""
-        Whether to cache the ViewableElement plots when initializing the object.""")
+        Whether to cache the ViewableElement plots when initializing the object.
+        Otherwise frames are rendered on demand in the background.""")
+
+    cache_size = param.Integer(default=100, bounds=(1, None), doc="""
+        The maximum number of frames retained when rendering frames
+        on demand.""")
+
+    prefetch = param.Integer(default=2, bounds=(0, None), doc="""
+        When rendering frames on demand, the number of neighbouring
+        keys along each dimension that are rendered in the background
+        after a frame is displayed.""")
 
     css = param.Dict(default={'margin-left': 'auto',
                               'margin-right': 'auto'}, doc="""
@@ -311,12 +728,25 @@ class IPySelectionWidget(NdWidget):
         if widgets is None:
             raise ImportError('ViewSelector requires IPython >= 2.0.')
 
+        self._dim_vals_cache = {}
         self._initialize_widgets()
         self.refresh = True
+        self.frames = {}
+        if not self.cached:
+            # Frames are rendered on the kernel event loop between
+            # widget events, or when requested if there is no loop
+            schedule = _kernel_scheduler()
+            neighbours = lambda idx: self._neighbours(idx, self.prefetch)
+            self._prefetcher = FramePrefetcher(self._get_frame, self._display_frame,
+                                               neighbours if schedule else None,
+                                               cache_size=self.cache_size,
+                                               schedule=schedule or (lambda fn: fn()))
 
-        if self.cached:
-            self.frames = OrderedDict((k, self._plot_figure(idx))
-                                      for idx, k in enumerate(self.keys))
+
+    def _cache_frames(self, frames):
+        "Stores the frames yielded by the supplied generator as they complete"
+        for idx, frame in frames:
+            self.frames[self.keys[idx]] = frame
 
 
     def _initialize_widgets(self):
@@ -351,9 +781,20 @@ class IPySelectionWidget(NdWidget):
             self.image_widget = widgets.ImageWidget()
 
         if self.cached:
-            self.image_widget.value = list(self.frames.values())[0]
+            # Display the first frame, caching the remaining frames in
+            # the background if they are rendered by worker processes
+            frames = self._render_frames()
+            self._cache_frames([next(frames)])
+            if self.processes:
+                thread = threading.Thread(target=self._cache_frames, args=(frames,))
+                thread.daemon = True
+                thread.start()
+            else:
+                self._cache_frames(frames)
+            self.image_widget.value = self.frames[self.keys[0]]
         else:
-            self.image_widget.value = self._plot_figure(0)
+            self.image_widget.value = self._prefetcher[0]
+            self._prefetcher.request(0)
         self.image_widget.set_css(self.css)
 
         # Initialize interactive widgets
@@ -367,15 +808,23 @@ class IPySelectionWidget(NdWidget):
         return '' # Suppresses outputting ViewableElement repr when called through hook
 
 
+    def _display_frame(self, idx, frame):
+        "Displays a frame rendered in the background"
+        self.image_widget.value = frame
+
+
     def _get_dim_vals(self, indices, idx):
         """
         Get the dimension values along the supplied dimension,
         computed from the supplied indices into the mock_obj.
         """
         indices[idx] = slice(None)
-        vals = [k[idx] if isinstance(k, tuple) else k
-                for k in self.mock_obj[tuple(indices)].keys()]
-        return vals
+        cache_key = (idx, tuple(None if isinstance(i, slice) else i for i in indices))
+        if cache_key not in self._dim_vals_cache:
+            vals = [k[idx] if isinstance(k, tuple) else k
+                    for k in self.mock_obj[tuple(indices)].keys()]
+            self._dim_vals_cache[cache_key] = vals
+        return self._dim_vals_cache[cache_key]
 
 
     def update_widgets(self, **kwargs):
@@ -411,10 +860,14 @@ class IPySelectionWidget(NdWidget):
 
         # Update frame
         checked = tuple(checked)
-        if self.cached:
+        if self.cached and checked in self.frames:
             self.image_widget.value = self.frames[checked]
+        elif self.cached:
+            self.image_widget.value = self._get_frame(self._key_index[checked])
         else:
-            self.image_widget.value = self._plot_figure(self.keys.index(checked))
+            frame = self._prefetcher.request(self._key_index[checked])
+            if frame is not None:
+                self.image_widget.value = frame
 
 
 
@@ -459,7 +912,8 @@ class ScrubberWidget(NdWidget):
 
     def __init__(self, plot, **params):
         super(ScrubberWidget, self).__init__(plot, **params)
-        self.frames = OrderedDict((idx, self._plot_figure(idx))
+        frames = dict(self._render_frames())
+        self.frames = OrderedDict((idx, frames[idx])
                                   for idx in range(len(self.plot)))
 
 
@@ -536,7 +990,8 @@ class SelectionWidget(ScrubberWidget):
 
     def __init__(self, plot, **params):
         NdWidget.__init__(self, plot, **params)
-        self.frames = OrderedDict((k, self._plot_figure(idx))
+        frames = dict(self._render_frames())
+        self.frames = OrderedDict((k, frames[idx])
                                   for idx, k in enumerate(self.keys))
 
 
@@ -550,16 +550,12 @@ class vectorfield(ElementOperation):
         X, Y = np.meshgrid(np.linspace(l, r, self.p.cols+2)[1:-1],
                            np.linspace(b, t, self.p.rows+2)[1:-1])
 
-        vector_data = []
-        for x, y in zip(X.flat, Y.flat):
-            components = (x,y, radians[x,y])
-            if lengths is not None:
-                components += (lengths[x,y],)
+        xs, ys = X.flatten(), Y.flatten()
+        magnitudes = np.ones(len(xs)) if lengths is None else lengths.sample_points(xs, ys)
+        vector_data = np.column_stack([xs, ys, radians.sample_points(xs, ys), magnitudes])
 
-            vector_data.append(components)
-
-        value_dimensions = [Dimension('Magnitude'),
-                            Dimension('Angle', cyclic=True, range=cyclic_dim.range)]
+        value_dimensions = [Dimension('Angle', cyclic=True, range=cyclic_dim.range),
+                            Dimension('Magnitude')]
         return VectorField(vector_data, label=radians.label, group=self.p.group,
                            value_dimensions=value_dimensions)
 
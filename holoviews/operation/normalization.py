@@ -13,11 +13,13 @@ normalizations result in transformations to the stored data within
 each element.
 """
 
+import numpy as np
+
 import param
 from ..core.operation import ElementOperation
 from ..element import Raster
 from ..core import Overlay
-from ..core.util import valid_identifier
+from ..core.util import valid_identifier, array_chunks, empty_array
 
 
 
@@ -166,20 +168,26 @@ class raster_normalization(Normalization):
 
 
     def _normalize_raster(self, raster, key):
+        """
+        Normalizes the raster data one chunk of rows at a time, so that
+        data which is not held in memory (e.g. an np.memmap) is
+        streamed into a memory mapped output array.
+        """
         if not isinstance(raster, Raster): return raster
-        norm_raster = raster.clone(raster.data.copy())
         ranges = self.get_ranges(raster, key)
-
-        for depth, name in enumerate(d.name for d in raster.value_dimensions):
-            depth_range = ranges.get(name, (None, None))
-            if None in depth_range:  continue
-            if depth_range and len(norm_raster.data.shape) == 2:
-                depth_range = ranges[name]
-                norm_raster.data[:,:] -= depth_range[0]
-                norm_raster.data[:,:] /= (depth_range[1] - depth_range[0])
-            elif depth_range:
-                norm_raster.data[:,:,depth] -= depth_range[0]
-                norm_raster.data[:,:,depth] /= (depth_range[1] - depth_range[0])
-        return norm_raster
+        depth_ranges = [ranges.get(d.name, (None, None)) for d in raster.value_dimensions]
+
+        data = raster.data
+        dtype = data.dtype if np.issubdtype(data.dtype, np.floating) else np.float64
+        norm_data = empty_array(data, data.shape, dtype)
+        for rows in array_chunks(data, itemsize=np.dtype(dtype).itemsize):
+            chunk = np.array(data[rows], dtype=dtype)
+            for depth, depth_range in enumerate(depth_ranges):
+                if None in depth_range:  continue
+                channel = chunk if chunk.ndim == 2 else chunk[:,:,depth]
+                channel -= depth_range[0]
+                channel /= (depth_range[1] - depth_range[0])
+            norm_data[rows] = chunk
+        return raster.clone(norm_data)
 
 
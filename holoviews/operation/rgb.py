@@ -7,20 +7,17 @@ define operations that should automatically process data or generate
 visualization upon display.
 """
 
-import colorsys
-
 import numpy as np
 
 import param
 
 from ..core.operation import ElementOperation
+from ..core.util import rgb_to_hsv, hsv_to_rgb # pyflakes:ignore (API import)
+from ..core.util import array_chunks, empty_array
 from ..element import Image, RGB
 from .normalization import raster_normalization
 from .element import split_raster
 
-rgb_to_hsv = np.vectorize(colorsys.rgb_to_hsv)
-hsv_to_rgb = np.vectorize(colorsys.hsv_to_rgb)
-
 
 class toRGB(ElementOperation):
     """
@@ -128,7 +125,9 @@ class toHCS(ElementOperation):
         if self.p.flipSC:
             (h,s,v) = (h,v,s.clip(0,1.0))
 
-        return RGB(np.dstack(hsv_to_rgb(h,s,v)),
+        rgb = np.empty(h.shape + (3,), dtype=np.result_type(h, s, v, np.float32))
+        hsv_to_rgb(h, s, v, out=rgb)
+        return RGB(rgb,
                    bounds = self.get_overlay_extents(overlay),
                    label =  self.get_overlay_label(overlay),
                    group =  self.p.group)
@@ -162,7 +161,14 @@ class colormap(ElementOperation):
             raise Exception("Can only apply colour maps to Image"
                             " with single value dimension.")
 
-        return RGB(matplotlib.cm.get_cmap(self.p.cmap)(matrix.data),
+        # Apply the colormap in chunks to avoid loading the whole array
+        cmap = matplotlib.cm.get_cmap(self.p.cmap)
+        data = matrix.data
+        rgba = empty_array(data, data.shape + (4,), np.float64)
+        for rows in array_chunks(data, itemsize=rgba.itemsize*4):
+            rgba[rows] = cmap(np.asarray(data[rows]))
+
+        return RGB(rgba,
                    bounds = matrix.bounds,
                    label = matrix.label,
                    group=self.p.group)
@@ -9,6 +9,7 @@ import param
 
 from ..core.options import Store
 from ..core import ViewableElement, CompositeOverlay, HoloMap
+from ..core.util import min_distance
 from ..element import Scatter, Curve, Histogram, Bars, Points, Raster, VectorField
 from .element import ElementPlot
 from .plot import Plot
@@ -66,8 +67,8 @@ class ChartPlot(ElementPlot):
         x_values.append(x_values[0]+self.cyclic_range)
         y_values.append(y_values[0])
 
-        curveview.data = np.vstack([x_values, y_values]).T
         self.xvalues = x_values
+        return curveview.clone(np.vstack([x_values, y_values]).T)
 
 
     def get_extents(self, element, ranges):
@@ -136,7 +137,7 @@ class CurvePlot(ChartPlot):
         if self.cyclic_range is not None:
             if self.center_cyclic:
                 self.peak_argmax = np.argmax(curveview.data[:, 1])
-            self._cyclic_curves(curveview)
+            curveview = self._cyclic_curves(curveview)
             xticks = self._cyclic_reduce_ticks(self.xvalues)
 
         # Create line segments and apply style
@@ -151,7 +152,7 @@ class CurvePlot(ChartPlot):
 
     def update_handles(self, axis, view, key, ranges=None):
         if self.cyclic_range is not None:
-            self._cyclic_curves(view)
+            view = self._cyclic_curves(view)
         self.handles['line_segment'].set_xdata(view.data[:, 0])
         self.handles['line_segment'].set_ydata(view.data[:, 1])
 
@@ -573,6 +574,7 @@ class VectorFieldPlot(ElementPlot):
 
     def __init__(self, *args, **params):
         super(VectorFieldPlot, self).__init__(*args, **params)
+        self._min_dists = {}
         self._min_dist, self._max_magnitude = self._get_map_info(self.map)
 
 
@@ -609,13 +611,16 @@ class VectorFieldPlot(ElementPlot):
 
 
     def _get_min_dist(self, vfield):
-        "Get the minimum sampling distance."
-        xys = np.array([complex(x,y) for x,y in zip(vfield.data[:,0],
-                                                    vfield.data[:,1])])
-        m, n = np.meshgrid(xys, xys)
-        distances = abs(m-n)
-        np.fill_diagonal(distances, np.inf)
-        return  distances.min()
+        """
+        Get the minimum sampling distance, caching the result for
+        each frame so it is only computed once per vector field.
+        """
+        data = vfield.data
+        cached = self._min_dists.get(id(data))
+        if cached is None or cached[0] is not data:
+            cached = (data, min_distance(data[:, 0], data[:, 1]))
+            self._min_dists[id(data)] = cached
+        return cached[1]
 
 
     def __call__(self, ranges=None):
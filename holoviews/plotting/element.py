@@ -83,9 +83,42 @@ class ElementPlot(Plot):
         plot_opts = Store.lookup_options(self.map.last, 'plot').options
         super(ElementPlot, self).__init__(keys=keys, dimensions=dimensions,
                                           **dict(params, **plot_opts))
+        self._map_keys = list(self.map.data.keys())
+        self._key_indices = self._index_keys()
+
+
+    def _index_keys(self):
+        """
+        Returns the positions of the key dimensions of the map in the
+        plot keys, allowing frames to be resolved by a hash lookup in
+        the map data. Returns None if the frames have to be resolved
+        by selection instead.
+        """
+        map_dims = [d.name for d in self.map.key_dimensions]
+        if not self.uniform:
+            return list(range(len(map_dims)))
+        dimensions = [d.name for d in self.dimensions]
+        if map_dims == ['Frame'] and map_dims != dimensions:
+            return None
+        elif all(d in dimensions for d in map_dims):
+            return [dimensions.index(d) for d in map_dims]
+        return None
 
 
     def _get_frame(self, key):
+        if isinstance(key, int) and not self.uniform:
+            return self.map.data[self._map_keys[min([key, len(self._map_keys)-1])]]
+        indices = self._key_indices
+        if indices is not None:
+            if not isinstance(key, tuple): key = (key,)
+            if all(i < len(key) for i in indices):
+                key = tuple(key[i] for i in indices)
+                return self.map.data[key] if key in self.map.data else None
+        return self._select_frame(key)
+
+
+    def _select_frame(self, key):
+        "Resolves a frame by selecting it from the map by key"
         if self.uniform:
             if not isinstance(key, tuple): key = (key,)
             dimensions = [d.name for d in self.dimensions]
@@ -95,8 +128,6 @@ class ElementPlot(Plot):
             else:
                 select = {d.name: key[self.dimensions.index(d)]
                           for d in self.map.key_dimensions}
-        elif isinstance(key, int):
-            return self.map.values()[min([key, len(self.map)-1])]
         else:
             select = dict(zip(self.map.dimensions('key', label=True), key))
         try:
@@ -371,6 +402,21 @@ class ElementPlot(Plot):
         raise NotImplementedError
 
 
+    def stream(self, key, element):
+        """
+        Adds a newly appended element to the plotted HoloMap and
+        updates the plot to display it, without processing the rest
+        of the HoloMap again. May be registered as a subscriber of a
+        HoloMap to follow a stream of elements.
+        """
+        if not isinstance(key, tuple): key = (key,)
+        element = element.map(Compositor.collapse_element, [CompositeOverlay])
+        self.map.append(key, element)
+        self._map_keys = list(self.map.data.keys())
+        self.keys = (list(self.keys) + [key])[-len(self.map):]
+        self.update_frame(key)
+
+
 class OverlayPlot(ElementPlot):
     """
     OverlayPlot supports compositors processing of Overlays across maps.
@@ -266,14 +266,15 @@ class Plot(param.Parameterized):
         return self.handles['fig']
 
 
-    def anim(self, start=0, stop=None, fps=30):
+    def anim(self, start=0, stop=None, fps=30, step=1):
         """
         Method to return a matplotlib animation. The start and stop
-        frames may be specified as well as the fps.
+        frames may be specified as well as the fps and a step to
+        skip frames of long animations.
         """
         figure = self()
         anim = animation.FuncAnimation(figure, self.update_frame,
-                                       frames=self.keys,
+                                       frames=self.keys[start:stop:step],
                                        interval = 1000.0/fps)
         # Close the figure handle
         plt.close(figure)
@@ -193,6 +193,14 @@ class RasterGridPlot(GridPlot, OverlayPlot):
         return GridPlot._get_frame(self, key)
 
 
+    def _get_pane(self, vmap, key):
+        "Looks up the frame of a grid cell by key, returning None if missing"
+        if vmap is None:
+            return None
+        key = key if isinstance(key, tuple) else (key,)
+        return vmap.data[key] if key in vmap.data else None
+
+
     def __call__(self, ranges=None):
         width, height, b_w, b_h, widths, heights = self._compute_borders()
 
@@ -208,7 +216,7 @@ class RasterGridPlot(GridPlot, OverlayPlot):
                     vmap = self.layout.get((xkey, ykey), None)
                 else:
                     vmap = self.layout.get(xkey, None)
-                pane = vmap.get(key, None) if vmap else None
+                pane = self._get_pane(vmap, key)
                 if pane:
                     if issubclass(vmap.type, CompositeOverlay): pane = pane.values()[-1]
                     data = pane.data if pane else None
@@ -220,7 +228,7 @@ class RasterGridPlot(GridPlot, OverlayPlot):
                 plot = self.handles['axis'].imshow(data, extent=(x,x+w, y, y+h), **opts)
                 valrange = self.match_range(pane, ranges)[pane.value_dimensions[0].name]
                 plot.set_clim(valrange)
-                if key not in vmap:
+                if self._get_pane(vmap, key) is None:
                     plot.set_visible(False)
                 self.handles['projs'].append(plot)
                 y += h + b_h
@@ -247,7 +255,7 @@ class RasterGridPlot(GridPlot, OverlayPlot):
         grid_values = self.layout.values()
         ranges = self.compute_ranges(self.layout, key, ranges)
         for i, plot in enumerate(self.handles['projs']):
-            view = grid_values[i].get(key, None)
+            view = self._get_pane(grid_values[i], key)
             if view:
                 plot.set_visible(True)
                 data = view.values()[0].data if isinstance(view, CompositeOverlay) else view.data
@@ -0,0 +1,120 @@
+"""
+Unit tests of the Archive container format.
+"""
+
+import os
+import shutil
+import tempfile
+
+import numpy as np
+
+from holoviews import HoloMap, Image, Curve, Layout, Table, HeatMap
+from holoviews.core import Dimension
+from holoviews.core.element import DynamicMap
+from holoviews.core.io import Archive
+from holoviews.core.options import Store, Options, OptionTree
+from holoviews.element.comparison import ComparisonTestCase
+
+
+class ArchiveTest(ComparisonTestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmpdir, 'archive')
+        rs = np.random.RandomState(42)
+        self.hmap = HoloMap([(i, Image(rs.rand(4, 4), bounds=(0, 0, 2, 2),
+                                       group='Foo', label='Bar'))
+                             for i in range(3)],
+                            key_dimensions=[Dimension('Time', unit='s')])
+
+    def tearDown(self):
+        Store.custom_options = {}
+        shutil.rmtree(self.tmpdir)
+
+    def test_archive_holomap_roundtrip(self):
+        loaded = Archive.save(self.hmap, self.path).load()
+        self.assertEqual(loaded, self.hmap)
+        self.assertEqual(loaded.last.group, 'Foo')
+        self.assertEqual(loaded.key_dimensions, self.hmap.key_dimensions)
+
+    def test_archive_memory_mapped(self):
+        loaded = Archive.save(self.hmap, self.path).load()
+        self.assertEqual(isinstance(loaded.last.data, np.memmap), True)
+
+    def test_archive_in_memory(self):
+        Archive.save(self.hmap, self.path)
+        loaded = Archive(self.path, mmap_mode=None).load()
+        self.assertEqual(isinstance(loaded.last.data, np.memmap), False)
+
+    def test_archive_heatmap_roundtrip(self):
+        heatmaps = HoloMap([(i, HeatMap({(x, y): x*y+i for x in range(3) for y in range(2)},
+                                        key_dimensions=['x', 'y'], value_dimensions=['z']))
+                            for i in range(2)], key_dimensions=['Time'])
+        loaded = Archive.save(heatmaps, self.path).load()
+        self.assertEqual(loaded, heatmaps)
+        self.assertEqual(loaded[1].key_dimensions, heatmaps[1].key_dimensions)
+        self.assertEqual(loaded[1]._data.keys(), heatmaps[1]._data.keys())
+
+    def test_archive_heatmap_categorical(self):
+        heatmap = HeatMap({('a', 0): 1, ('b', 0): 2, ('b', 1): 3})
+        loaded = Archive.save(HoloMap([(0, heatmap)]), self.path).frame(0)
+        self.assertEqual(loaded, heatmap)
+
+    def test_archive_frame(self):
+        archive = Archive.save(self.hmap, self.path)
+        self.assertEqual(archive.frame(1), self.hmap[1])
+
+    def test_archive_lazy(self):
+        loaded = Archive.save(self.hmap, self.path).load(lazy=True)
+        self.assertEqual(isinstance(loaded, DynamicMap), True)
+        self.assertEqual(loaded.keys(), [0, 1, 2])
+        self.assertEqual(len(loaded.data._cache), 0)
+        self.assertEqual(loaded[2], self.hmap[2])
+
+    def test_archive_append(self):
+        Archive.save(self.hmap, self.path)
+        Archive(self.path).append(3, Image(np.ones((4, 4)), bounds=(0, 0, 2, 2)))
+        loaded = Archive(self.path).load()
+        self.assertEqual(loaded.keys(), [0, 1, 2, 3])
+        self.assertEqual(np.asarray(loaded[3].data), np.ones((4, 4)))
+
+    def test_archive_append_duplicate(self):
+        archive = Archive.save(self.hmap, self.path)
+        with self.assertRaises(KeyError):
+            archive.append(0, self.hmap[0])
+
+    def test_archive_existing(self):
+        Archive.save(self.hmap, self.path)
+        with self.assertRaises(IOError):
+            Archive.save(self.hmap, self.path)
+
+    def test_archive_layout(self):
+        curves = HoloMap([(i, Curve(np.random.rand(5, 2))) for i in range(2)])
+        layout = self.hmap + curves
+        loaded = Archive.save(layout, self.path).load()
+        self.assertEqual(isinstance(loaded, Layout), True)
+        self.assertEqual(loaded.keys(), layout.keys())
+        self.assertEqual(loaded.Foo.Bar, self.hmap)
+
+    def test_archive_unsupported_element(self):
+        hmap = HoloMap([(0, Table({(0,): 1}))])
+        with self.assertRaises(ValueError):
+            Archive.save(hmap, self.path)
+
+    def test_archive_options(self):
+        image = Image(np.zeros((2, 2)))
+        tree = OptionTree(items=Store.options.data.items(), groups=Store.options.groups)
+        tree.Image = Options('style', cmap='hot')
+        custom_id = max(list(Store.custom_options.keys()) + [-1]) + 1
+        Store.custom_options[custom_id] = tree
+        image.id = custom_id
+        Archive.save(HoloMap([(0, image)]), self.path)
+        loaded = Archive(self.path).frame(0)
+        self.assertEqual(Store.lookup_options(loaded, 'style').kwargs['cmap'], 'hot')
+
+
+
+if __name__ == "__main__":
+    import sys
+    import nose
+    nose.runmodule(argv=[sys.argv[0], "--logging-level", "ERROR"])
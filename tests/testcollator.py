@@ -0,0 +1,69 @@
+"""
+Unit tests of the Collator, in particular of collating data loaded
+by the worker threads and processes of the parallel backends.
+"""
+
+import os
+import pickle
+import shutil
+import tempfile
+
+import numpy as np
+
+from holoviews import Image, Curve
+from holoviews.core.element import Collator
+from holoviews.element.comparison import ComparisonTestCase
+
+
+def load_pickle(path):
+    with open(path, 'rb') as f:
+        return pickle.load(f)
+
+
+class CollatorBackendTest(ComparisonTestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.paths = {}
+        for i in range(6):
+            path = os.path.join(self.tmpdir, '%d.pkl' % i)
+            with open(path, 'wb') as f:
+                pickle.dump(Image(np.full((3, 3), i)) + Curve([(0, i), (1, i)]), f)
+            self.paths[i] = path
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def collate(self, **params):
+        return Collator(self.paths, key_dimensions=['seed'],
+                        loader=load_pickle, **params)()
+
+    def check_collated(self, layout):
+        self.assertEqual(layout.Image.I.keys(), list(range(6)))
+        for i in range(6):
+            self.assertEqual(layout.Image.I[i].data, np.full((3, 3), i))
+
+    def test_collator_serial(self):
+        self.check_collated(self.collate())
+
+    def test_collator_threads(self):
+        self.check_collated(self.collate(backend='threads', processes=2, max_pending=2))
+
+    def test_collator_processes(self):
+        self.check_collated(self.collate(backend='processes', processes=2, max_pending=3))
+
+    def test_collator_progress(self):
+        progress = []
+        self.collate(backend='threads', processes=3, progress_bar=progress.append)
+        self.assertEqual(progress, [(i+1)/6.*100 for i in range(6)])
+
+    def test_collator_loader_error(self):
+        os.remove(self.paths[3])
+        with self.assertRaises(IOError):
+            self.collate(backend='processes', processes=2)
+
+
+if __name__ == "__main__":
+    import sys
+    import nose
+    nose.runmodule(argv=[sys.argv[0], "--logging-level", "ERROR"])
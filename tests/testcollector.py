@@ -1,11 +1,16 @@
+import os
 import pickle
+import shutil
+import tempfile
 from collections import OrderedDict
 
 import numpy as np
+import param
 
-from holoviews import Image, Layout
+from holoviews import Image, Layout, Table
+from holoviews.core.io import Archive
 from holoviews.element.comparison import ComparisonTestCase
-from holoviews.interface.collector import ViewRef
+from holoviews.interface.collector import ViewRef, Collector
 
 
 class LayoutTest(ComparisonTestCase):
@@ -138,6 +143,67 @@ class ViewRefTest(ComparisonTestCase):
 
 
 
+class ArraySource(object):
+    "Collected object returning an Image of its current value"
+
+    def __init__(self, value=0):
+        self.value = value
+
+
+class TableSource(object):
+    "Collected object returning an unarchivable Table"
+
+
+def mean_image(hmap):
+    return Image(np.mean([im.data for im in hmap.values()], axis=0))
+
+
+class CollectorArchiveTest(ComparisonTestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.archive = Archive(os.path.join(self.tmpdir, 'archive'))
+        self.time_fn, self.interval_hook = Collector.time_fn, Collector.interval_hook
+        Collector.time_fn = param.Time()
+        Collector.interval_hook = Collector.time_fn.advance
+        self.source = ArraySource()
+        Collector.for_type(ArraySource, self.collect_array)
+        Collector.for_type(TableSource, lambda source: Table({(0,): 1}))
+
+    def tearDown(self):
+        Collector.time_fn, Collector.interval_hook = self.time_fn, self.interval_hook
+        Collector.type_hooks.pop(ArraySource)
+        Collector.type_hooks.pop(TableSource)
+        shutil.rmtree(self.tmpdir)
+
+    def collect_array(self, source):
+        source.value += 1
+        return Image(np.full((2, 2), source.value, dtype=float))
+
+    def test_collector_archive(self):
+        c = Collector()
+        c.Data.Frames = c.collect(self.source)
+        data = c(times=[1, 2, 3], archive=self.archive)
+        self.assertEqual(self.archive.keys(('Data', 'Frames')), [(1,), (2,), (3,)])
+        self.assertEqual(self.archive.load().Data.Frames, data.Data.Frames)
+
+    def test_collector_archive_skips_unarchivable(self):
+        c = Collector()
+        c.Data.Frames = c.collect(self.source)
+        c.Data.Table = c.collect(TableSource())
+        data = c(times=[1, 2], archive=self.archive)
+        self.assertEqual(self.archive.paths(), [('Data', 'Frames')])
+        self.assertEqual(len(data.Data.Table), 2)
+
+    def test_collector_archive_mapwise(self):
+        c = Collector()
+        c.Data.Frames = c.collect(self.source)
+        c.Data.Mean = c.analyze(c.ref.Data.Frames, mean_image, mapwise=True)
+        data = c(times=[1, 2, 3], archive=self.archive)
+        self.assertEqual(self.archive.keys(('Data', 'Mean')), [(3,)])
+        self.assertEqual(self.archive.frame(3, ('Data', 'Mean')), data.Data.Mean.last)
+
+
 
 if __name__ == "__main__":
     import sys
@@ -0,0 +1,187 @@
+"""
+Unit tests of the figure encoding used by the IPython display hooks.
+"""
+
+import base64
+import io
+import os
+import shutil
+import stat
+import sys
+import tempfile
+from unittest import SkipTest
+
+import numpy as np
+import matplotlib
+matplotlib.use('agg')
+import matplotlib.pyplot as plt
+from matplotlib import animation
+
+from holoviews import HoloMap, Image
+from holoviews.core import OrderedDict
+from holoviews.core.options import Store
+from holoviews.ipython.display_hooks import (FigureStream, encode_figure, animate, cache_key,
+                                            animate_plot, stream_video, PILImage)
+from holoviews.ipython.magics import ViewMagic
+from holoviews.element.comparison import ComparisonTestCase
+
+
+class FigureStreamTest(ComparisonTestCase):
+
+    def test_figure_stream_chunks(self):
+        data = bytes(bytearray(range(256))) * 3
+        stream = FigureStream()
+        for i in range(0, len(data), 7):
+            stream.write(data[i:i+7])
+        self.assertEqual(stream.b64, base64.b64encode(data).decode('utf-8'))
+
+    def test_figure_stream_sink(self):
+        sink = io.BytesIO()
+        stream = FigureStream(sink)
+        stream.write(b'abcd')
+        stream.write(b'ef')
+        self.assertEqual(sink.getvalue(), b'abcdef')
+        self.assertEqual(stream.b64, 'YWJjZGVm')
+
+
+class EncodeFigureTest(ComparisonTestCase):
+
+    def setUp(self):
+        self.fig = plt.figure()
+        plt.imshow([[0, 1], [2, 3]])
+
+    def tearDown(self):
+        plt.close(self.fig)
+        ViewMagic.options = OrderedDict(ViewMagic.defaults.items())
+
+    def _decode(self, uri):
+        return base64.b64decode(uri.split(',', 1)[1].encode('utf-8'))
+
+    def test_encode_figure_png(self):
+        uri = encode_figure(self.fig, 'png', 72)
+        self.assertEqual(uri.startswith('data:image/png;base64,'), True)
+        self.assertEqual(self._decode(uri)[1:4], b'PNG')
+
+    def test_encode_figure_svg(self):
+        uri = encode_figure(self.fig, 'svg', 72)
+        self.assertEqual(uri.startswith('data:image/svg+xml;base64,'), True)
+        self.assertEqual(b'<svg' in self._decode(uri), True)
+
+    def test_encode_figure_compression(self):
+        ViewMagic.options = dict(ViewMagic.defaults, compression=9)
+        compressed = self._decode(encode_figure(self.fig, 'png', 72))
+        ViewMagic.options = dict(ViewMagic.defaults, compression=0)
+        uncompressed = self._decode(encode_figure(self.fig, 'png', 72))
+        self.assertEqual(len(compressed) < len(uncompressed), True)
+
+    def test_encode_figure_compression_reencoded(self):
+        if PILImage is None:
+            raise SkipTest("Reencoding PNG output requires PIL")
+        ViewMagic.options = dict(ViewMagic.defaults, compression=1)
+        compressed = self._decode(encode_figure(self.fig, 'png', 72))
+        reencoded = io.BytesIO()
+        PILImage.open(io.BytesIO(compressed)).save(reencoded, 'png', compress_level=1)
+        self.assertEqual(compressed, reencoded.getvalue())
+
+
+
+class CacheKeyTest(ComparisonTestCase):
+
+    def setUp(self):
+        self.image = Image(np.random.rand(4, 4))
+
+    def tearDown(self):
+        ViewMagic.options = OrderedDict(ViewMagic.defaults.items())
+
+    def test_cache_key(self):
+        self.assertEqual(cache_key(self.image), cache_key(self.image))
+        self.assertEqual(cache_key(self.image) is None, False)
+
+    def test_cache_key_d3(self):
+        ViewMagic.options = OrderedDict(ViewMagic.defaults, backend='d3')
+        self.assertEqual(cache_key(self.image), None)
+
+
+
+class AnimateTest(ComparisonTestCase):
+
+    def setUp(self):
+        hmap = HoloMap([(i, Image(np.random.rand(4, 4))) for i in range(10)])
+        self.plot = Store.defaults[Image](hmap)
+
+    def test_anim_step(self):
+        anim = self.plot.anim(step=3)
+        self.assertEqual(list(anim.new_frame_seq()), [(0,), (3,), (6,), (9,)])
+
+    def test_animate_gif(self):
+        try:
+            animation.writers['pillow']
+        except (KeyError, RuntimeError):
+            raise SkipTest("Pillow animation writer not available")
+        tag = "{mime_type}:{b64}"
+        html = animate(self.plot.anim(step=5), 72, 'pillow', 'gif', {'fps': 5}, [], tag)
+        self.assertEqual(base64.b64decode(html.split(':', 1)[1])[:3], b'GIF')
+
+
+
+# Stub ffmpeg reporting the number of bytes piped into it
+STUB_FFMPEG = """#!%s
+import sys
+data = getattr(sys.stdin, 'buffer', sys.stdin).read()
+if '-vcodec' in sys.argv[sys.argv.index('pipe:0'):]:
+    sys.stderr.write('Unknown encoder\\n')
+    sys.exit(1)
+getattr(sys.stdout, 'buffer', sys.stdout).write(('FAKE %%d' %% len(data)).encode('utf-8'))
+"""
+
+class StreamVideoTest(ComparisonTestCase):
+
+    def setUp(self):
+        if sys.platform == 'win32':
+            raise SkipTest("Stub ffmpeg requires a POSIX shebang")
+        self.tmpdir = tempfile.mkdtemp()
+        ffmpeg = os.path.join(self.tmpdir, 'ffmpeg')
+        with open(ffmpeg, 'w') as f:
+            f.write(STUB_FFMPEG % sys.executable)
+        os.chmod(ffmpeg, os.stat(ffmpeg).st_mode | stat.S_IEXEC)
+        self.ffmpeg_path = matplotlib.rcParams['animation.ffmpeg_path']
+        matplotlib.rcParams['animation.ffmpeg_path'] = ffmpeg
+        hmap = HoloMap([(i, Image(np.random.rand(4, 4))) for i in range(6)])
+        self.plot = Store.defaults[Image](hmap)
+
+    def tearDown(self):
+        matplotlib.rcParams['animation.ffmpeg_path'] = self.ffmpeg_path
+        ViewMagic.options = OrderedDict(ViewMagic.defaults.items())
+        shutil.rmtree(self.tmpdir)
+
+    def _frame_bytes(self, dpi):
+        fig = self.plot()
+        fig.set_dpi(dpi)
+        width, height = fig.canvas.get_width_height()
+        plt.close(fig)
+        return width * height * 4
+
+    def test_stream_video(self):
+        stream = FigureStream()
+        stream_video(self.plot, stream, 5, 72, 'webm', {}, [], step=2)
+        self.assertEqual(base64.b64decode(stream.b64),
+                         ('FAKE %d' % (3 * self._frame_bytes(72))).encode('utf-8'))
+
+    def test_stream_video_error(self):
+        with self.assertRaisesRegexp(IOError, 'Unknown encoder'):
+            stream_video(self.plot, FigureStream(), 5, 72, 'webm', {'codec': 'foo'}, [])
+
+    def test_animate_plot_ffmpeg(self):
+        ViewMagic.options = OrderedDict(ViewMagic.defaults, frame_step=3)
+        html = animate_plot(self.plot, 72, 'ffmpeg', 'webm', {}, [], '{mime_type}:{b64}')
+        mime_type, b64 = html.split(':', 1)
+        self.assertEqual(mime_type, 'webm')
+        self.assertEqual(base64.b64decode(b64),
+                         ('FAKE %d' % (2 * self._frame_bytes(72))).encode('utf-8'))
+
+
+
+if __name__ == "__main__":
+    import sys
+    import nose
+    nose.runmodule(argv=[sys.argv[0], "--logging-level", "ERROR"])
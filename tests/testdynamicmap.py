@@ -0,0 +1,110 @@
+"""
+Unit tests of DynamicMap, which generates its elements on demand.
+"""
+
+import copy
+import pickle
+
+import numpy as np
+
+from holoviews import Curve, Dimension, DynamicMap, HoloMap
+from holoviews.element.comparison import ComparisonTestCase
+
+
+def line(a, b):
+    return Curve([(0, a), (1, b)])
+
+
+class DynamicMapTest(ComparisonTestCase):
+
+    def setUp(self):
+        self.calls = []
+        self.dimensions = [Dimension('a', values=[1, 2, 3]),
+                           Dimension('b', values=[0.1, 0.2])]
+
+    def callback(self, a, b):
+        self.calls.append((a, b))
+        return Curve([(0, a), (1, b)])
+
+    def dynamic_map(self, **params):
+        return DynamicMap(callback=self.callback,
+                          key_dimensions=self.dimensions, **params)
+
+    def test_dynamic_map_keys(self):
+        dmap = self.dynamic_map()
+        self.assertEqual(dmap.keys(), [(1, 0.1), (1, 0.2), (2, 0.1),
+                                       (2, 0.2), (3, 0.1), (3, 0.2)])
+        self.assertEqual(self.calls, [])
+
+    def test_dynamic_map_getitem(self):
+        dmap = self.dynamic_map()
+        self.assertEqual(dmap[2, 0.2].data, np.array([[0, 2], [1, 0.2]]))
+        self.assertEqual(dmap[2, 0.2].data, np.array([[0, 2], [1, 0.2]]))
+        self.assertEqual(self.calls, [(2, 0.2)])
+
+    def test_dynamic_map_select(self):
+        dmap = self.dynamic_map()
+        dmap.select(a=3, b=0.1)
+        # The first element is generated to look up the dimensions
+        self.assertEqual(self.calls, [(1, 0.1), (3, 0.1)])
+
+    def test_dynamic_map_slice(self):
+        sliced = self.dynamic_map()[1:, 0.2]
+        self.assertEqual(isinstance(sliced, DynamicMap), True)
+        self.assertEqual(sliced.keys(), [(2, 0.2), (3, 0.2)])
+        self.assertEqual(self.calls, [(2, 0.2), (3, 0.2)])
+
+    def test_dynamic_map_cache_size(self):
+        dmap = self.dynamic_map(cache_size=2)
+        for key in [(1, 0.1), (1, 0.2), (2, 0.1), (1, 0.1)]:
+            dmap[key]
+        self.assertEqual(len(self.calls), 4)
+        self.assertEqual(len(dmap.data.cached_values()), 2)
+
+    def test_dynamic_map_range(self):
+        dmap = self.dynamic_map()
+        dmap[3, 0.1]
+        self.assertEqual(dmap.range('y'), (0.1, 3))
+        self.assertEqual(self.calls, [(3, 0.1)])
+
+    def test_dynamic_map_map(self):
+        dmap = self.dynamic_map()
+        mapped = dmap.map(lambda x: x.clone(x.data * 2), ['Curve'])
+        self.assertEqual(self.calls, [])
+        self.assertEqual(mapped[1, 0.1].data, np.array([[0, 2], [2, 0.2]]))
+
+    def test_dynamic_map_items(self):
+        dmap = DynamicMap([(1, Curve([(0, 1)]))], callback=lambda a: Curve([(0, a)]))
+        self.assertEqual(dmap.keys(), [1])
+        self.assertEqual(dmap.type, Curve)
+
+    def test_dynamic_map_requires_values(self):
+        with self.assertRaises(ValueError):
+            DynamicMap(callback=self.callback, key_dimensions=['a', 'b'])
+
+    def test_dynamic_map_matches_holomap(self):
+        dmap = self.dynamic_map()
+        hmap = HoloMap(dmap.items(), key_dimensions=self.dimensions)
+        self.assertEqual(hmap.keys(), dmap.keys())
+
+    def test_dynamic_map_pickle(self):
+        dmap = DynamicMap(callback=line, key_dimensions=self.dimensions)
+        dmap[1, 0.1]
+        unpickled = pickle.loads(pickle.dumps(dmap))
+        self.assertEqual(unpickled.keys(), dmap.keys())
+        self.assertEqual(len(unpickled.data._cache), 0)
+        self.assertIs(unpickled.data._dmap, unpickled)
+        self.assertEqual(unpickled[2, 0.2], line(2, 0.2))
+
+    def test_dynamic_map_deepcopy(self):
+        dmap = DynamicMap(callback=line, key_dimensions=self.dimensions)
+        copied = copy.deepcopy(dmap)
+        self.assertEqual(copied.keys(), dmap.keys())
+        self.assertIs(copied.data._dmap, copied)
+        self.assertEqual(copied[3, 0.1], dmap[3, 0.1])
+
+
+if __name__ == "__main__":
+    import sys
+    import nose
+    nose.runmodule(argv=[sys.argv[0], "--logging-level", "ERROR"])
@@ -0,0 +1,167 @@
+"""
+Unit tests of the streaming and stacking APIs of HoloMaps.
+"""
+
+import pickle
+import tempfile
+
+import numpy as np
+
+from holoviews import HoloMap, Image, Curve, RGB
+from holoviews.element.comparison import ComparisonTestCase
+
+
+class HoloMapStreamTest(ComparisonTestCase):
+
+    def setUp(self):
+        self.image = Image(np.zeros((2, 2)))
+
+    def test_holomap_append(self):
+        hmap = HoloMap(key_dimensions=['Time'])
+        for t in range(3):
+            hmap.append(t, self.image)
+        self.assertEqual(hmap.keys(), [0, 1, 2])
+
+    def test_holomap_append_out_of_order(self):
+        hmap = HoloMap([(1, self.image)], key_dimensions=['Time'])
+        with self.assertRaises(ValueError):
+            hmap.append(0, self.image)
+
+    def test_holomap_max_length(self):
+        hmap = HoloMap(key_dimensions=['Time'], max_length=2)
+        for t in range(4):
+            hmap.append(t, self.image)
+        self.assertEqual(hmap.keys(), [2, 3])
+
+    def test_holomap_max_length_setitem(self):
+        hmap = HoloMap([(t, self.image) for t in [3, 1, 2]],
+                       key_dimensions=['Time'], max_length=2)
+        self.assertEqual(hmap.keys(), [2, 3])
+
+    def test_holomap_window(self):
+        hmap = HoloMap(key_dimensions=['Time'], window=2)
+        for t in [0, 1, 2.5, 3, 4.5]:
+            hmap.append(t, self.image)
+        self.assertEqual(hmap.keys(), [2.5, 3, 4.5])
+
+    def test_holomap_subscribe(self):
+        hmap = HoloMap(key_dimensions=['Time'])
+        appended = []
+        callback = lambda key, element: appended.append(key)
+        hmap.subscribe(callback)
+        hmap.append(0, self.image)
+        hmap.unsubscribe(callback)
+        hmap.append(1, self.image)
+        self.assertEqual(appended, [(0,)])
+
+    def test_holomap_pickle_subscribers(self):
+        hmap = HoloMap([(0, self.image)], key_dimensions=['Time'])
+        hmap.subscribe(lambda key, element: None)
+        unpickled = pickle.loads(pickle.dumps(hmap))
+        self.assertEqual(unpickled._subscribers, [])
+        self.assertEqual(unpickled.keys(), [0])
+
+
+class HoloMapStackTest(ComparisonTestCase):
+
+    def setUp(self):
+        rs = np.random.RandomState(42)
+        self.arrays = [rs.rand(4, 5) for i in range(3)]
+        self.hmap = HoloMap([(i, Image(arr)) for i, arr in enumerate(self.arrays)],
+                            key_dimensions=['t'])
+
+    def test_holomap_stack(self):
+        self.assertEqual(self.hmap.stack(), np.array(self.arrays))
+
+    def test_holomap_stack_preserves_data(self):
+        self.hmap.collapse(function=np.mean)
+        for arr, image in zip(self.arrays, self.hmap.values()):
+            self.assertIs(image.data, arr)
+
+    def test_holomap_stack_memmap(self):
+        memmap = np.memmap(tempfile.TemporaryFile(), dtype=np.float64,
+                           mode='w+', shape=(4, 5))
+        memmap[:] = self.arrays[0]
+        hmap = HoloMap([(0, Image(memmap)), (1, Image(self.arrays[1]))])
+        self.assertEqual(hmap._stackable(), False)
+        collapsed = hmap.collapse(function=np.mean)
+        self.assertEqual(collapsed.data, np.mean(self.arrays[:2], axis=0))
+        self.assertEqual(isinstance(hmap[0].data, np.memmap), True)
+
+    def test_holomap_stack_view(self):
+        arr = np.random.rand(3, 4, 5)
+        hmap = HoloMap([(i, Image(arr[i])) for i in range(3)])
+        stacked = hmap.stack()
+        self.assertEqual(stacked, arr)
+        self.assertEqual(np.may_share_memory(stacked, arr), True)
+        self.assertEqual(stacked.flags.writeable, False)
+
+    def test_holomap_stack_copies_separate_arrays(self):
+        stacked = self.hmap.stack()
+        self.assertEqual(any(np.may_share_memory(stacked, arr) for arr in self.arrays), False)
+
+    def test_holomap_stack_invalidated(self):
+        stacked = self.hmap.stack()
+        self.hmap[3] = Image(np.zeros((4, 5)))
+        self.assertEqual(self.hmap.stack().shape, (4, 4, 5))
+        self.assertEqual(stacked.shape, (3, 4, 5))
+
+    def test_holomap_stack_mismatched_shapes(self):
+        self.hmap[3] = Image(np.zeros((2, 2)))
+        with self.assertRaises(ValueError):
+            self.hmap.stack()
+
+    def test_holomap_collapse_stacked(self):
+        collapsed = self.hmap.collapse(['t'], np.mean)
+        self.assertEqual(collapsed.data, np.mean(self.arrays, axis=0))
+
+    def test_holomap_collapse_stacked_groups(self):
+        hmap = HoloMap([((i, j), Image(arr*j)) for i, arr in enumerate(self.arrays)
+                        for j in range(2)], key_dimensions=['t', 'u'])
+        collapsed = hmap.collapse(['t'], np.sum)
+        self.assertEqual(collapsed[1].data, np.sum(self.arrays, axis=0))
+
+    def test_holomap_collapse_rgb(self):
+        hmap = HoloMap([(i, RGB(np.dstack([arr]*3))) for i, arr in enumerate(self.arrays)])
+        self.assertEqual(hmap.collapse(function=np.max).data[:, :, 0],
+                         np.max(self.arrays, axis=0))
+
+    def test_holomap_collapse_curves(self):
+        hmap = HoloMap([(i, Curve(np.column_stack([np.arange(5.), arr[0]])))
+                        for i, arr in enumerate(self.arrays)])
+        collapsed = hmap.collapse(function=np.mean)
+        self.assertEqual(collapsed.data, np.column_stack([np.arange(5.),
+                                                          np.mean(self.arrays, axis=0)[0]]))
+
+    def test_holomap_collapse_rgb_memmap(self):
+        rgbs = [np.dstack([arr]*3) for arr in self.arrays]
+        memmaps = []
+        for rgb in rgbs:
+            memmap = np.memmap(tempfile.TemporaryFile(), dtype=np.float64,
+                               mode='w+', shape=rgb.shape)
+            memmap[:] = rgb
+            memmaps.append(memmap)
+        in_memory = HoloMap([(i, RGB(rgb)) for i, rgb in enumerate(rgbs)])
+        mapped = HoloMap([(i, RGB(m)) for i, m in enumerate(memmaps)])
+        self.assertEqual(mapped._stackable(), False)
+        self.assertEqual(np.asarray(mapped.collapse(function=np.max).data),
+                         in_memory.collapse(function=np.max).data)
+
+    def test_holomap_collapse_curves_unstacked(self):
+        curves = [np.column_stack([np.arange(5.), arr[0]]) for arr in self.arrays]
+        hmap = HoloMap([(i, Curve(c.astype(np.float32 if i else np.float64)))
+                        for i, c in enumerate(curves)])
+        self.assertEqual(hmap._stackable(), False)
+        self.assertEqual(hmap.collapse(function=np.mean).data,
+                         np.column_stack([np.arange(5.), np.mean(self.arrays, axis=0)[0]]))
+
+    def test_holomap_stack_pickle(self):
+        self.hmap.stack()
+        unpickled = pickle.loads(pickle.dumps(self.hmap))
+        self.assertEqual(unpickled.stack(), np.array(self.arrays))
+
+
+if __name__ == "__main__":
+    import sys
+    import nose
+    nose.runmodule(argv=[sys.argv[0], "--logging-level", "ERROR"])
@@ -107,6 +107,15 @@ class TestViewMagic(ExtensionTestCase):
         self.line_magic('view', "size=-50")
         self.assertEqual(ipython.ViewMagic.options.get('size', None), 100)
 
+    def test_view_png_compression(self):
+        self.line_magic('view', "compression=1 colors=64")
+        self.assertEqual(ipython.ViewMagic.options.get('compression', None), 1)
+        self.assertEqual(ipython.ViewMagic.options.get('colors', None), 64)
+
+    def test_view_invalid_compression(self):
+        self.line_magic('view', "compression=10")
+        self.assertEqual(ipython.ViewMagic.options.get('compression', None), None)
+
 
 class TestCompositorMagic(ExtensionTestCase):
 
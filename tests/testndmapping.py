@@ -1,7 +1,9 @@
 from collections import OrderedDict
 
 from holoviews.core import Dimension
-from holoviews.core.ndmapping import MultiDimensionalMapping
+from holoviews.core.ndmapping import MultiDimensionalMapping, NdMapping
+from holoviews.core import HoloMap
+from holoviews.element import Curve
 from holoviews.element.comparison import ComparisonTestCase
 
 
@@ -109,6 +111,97 @@ class NdIndexableMappingTest(ComparisonTestCase):
 
         self.assertEqual(list(ndmap.keys()), [0, 1])
 
+    def test_idxmapping_unordered_insert(self):
+        ndmap = MultiDimensionalMapping(key_dimensions=[self.dim1])
+        for k in [3, 1, 4, 0, 2]:
+            ndmap[k] = str(k)
+        self.assertEqual(list(ndmap.keys()), [0, 1, 2, 3, 4])
+        self.assertEqual(ndmap.last, '4')
+        self.assertEqual(ndmap.last_key, 4)
+
+    def test_idxmapping_ordered_insert(self):
+        ndmap = MultiDimensionalMapping(key_dimensions=[self.dim1, self.dim2])
+        for k in range(5):
+            ndmap[(k, 0.5)] = k
+        self.assertEqual(ndmap._sort_pending, False)
+        self.assertEqual(ndmap.last_key, (4, 0.5))
+
+    def test_idxmapping_categorical_insert(self):
+        dim = Dimension('cat', values=['c', 'a', 'b'])
+        ndmap = MultiDimensionalMapping([('b', 1), ('a', 2), ('c', 3)],
+                                        key_dimensions=[dim])
+        self.assertEqual(list(ndmap.keys()), ['c', 'a', 'b'])
+
+    def test_idxmapping_replace_item_order(self):
+        ndmap = MultiDimensionalMapping(self.init_items_1D_list, key_dimensions=[self.dim1])
+        ndmap[1] = 'c'
+        self.assertEqual(list(ndmap.items()), [(1, 'c'), (5, 'b')])
+
+
+
+class NdMappingTest(ComparisonTestCase):
+
+    def setUp(self):
+        self.dim1 = Dimension('intdim', type=int)
+        self.dim2 = Dimension('strdim', type=str)
+        self.items = [((i, s), i) for i in range(10) for s in 'abc']
+        self.ndmap = NdMapping(self.items, key_dimensions=[self.dim1, self.dim2])
+
+    def test_ndmapping_slice_range(self):
+        self.assertEqual(self.ndmap[2:4, 'b'].keys(), [(2, 'b'), (3, 'b')])
+
+    def test_ndmapping_slice_values(self):
+        self.assertEqual(self.ndmap[[1, 8], ['a', 'c']].keys(),
+                         [(1, 'a'), (1, 'c'), (8, 'a'), (8, 'c')])
+
+    def test_ndmapping_slice_step(self):
+        self.assertEqual(self.ndmap[::4, 'a'].keys(), [(0, 'a'), (4, 'a'), (8, 'a')])
+
+    def test_ndmapping_slice_after_insert(self):
+        self.ndmap[(-1, 'a')] = -1
+        self.assertEqual(self.ndmap[:1, 'a'].keys(), [(-1, 'a'), (0, 'a')])
+
+    def test_ndmapping_select(self):
+        selection = self.ndmap.select(intdim=(7, 9), strdim=['c'])
+        self.assertEqual(selection.keys(), [(7, 'c'), (8, 'c')])
+
+    def test_ndmapping_groupby(self):
+        grouped = self.ndmap.groupby(['strdim'])
+        self.assertEqual(grouped.keys(), ['a', 'b', 'c'])
+        self.assertEqual(grouped['b'].keys(), list(range(10)))
+        self.assertEqual(list(grouped['b'].constant_dimensions.values()), ['b'])
+
+    def test_ndmapping_reindex_constant(self):
+        reindexed = self.ndmap[:, 'a'].reindex()
+        self.assertEqual([d.name for d in reindexed.key_dimensions], ['intdim'])
+
+
+class RangeCacheTest(ComparisonTestCase):
+
+    def setUp(self):
+        self.hmap = HoloMap({i: Curve([(0, i), (1, i*2)]) for i in range(1, 4)})
+
+    def test_element_range_cached(self):
+        curve = self.hmap.last
+        self.assertEqual(curve.range('y'), (3, 6))
+        self.assertEqual(curve._ranges, {'y': (3, 6)})
+
+    def test_holomap_range_aggregated(self):
+        self.assertEqual(self.hmap.range('y'), (1, 6))
+        self.assertEqual(self.hmap.range('Default'), (1, 3))
+
+    def test_holomap_range_invalidated(self):
+        self.assertEqual(self.hmap.range('y'), (1, 6))
+        self.hmap[4] = Curve([(0, -1), (1, 8)])
+        self.assertEqual(self.hmap.range('y'), (-1, 8))
+        self.hmap.pop(4)
+        self.assertEqual(self.hmap.range('y'), (1, 6))
+
+    def test_dimension_range_overrides_cache(self):
+        curve = Curve([(0, 1), (1, 2)], value_dimensions=[Dimension('y', range=(0, 10))])
+        self.assertEqual(curve.range('y'), (0, 10))
+        self.assertEqual(curve._ranges, {})
+
 
 if __name__ == "__main__":
     import sys
@@ -0,0 +1,56 @@
+"""
+Unit tests of ElementOperations applied to HoloMaps.
+"""
+
+import numpy as np
+
+from holoviews import HoloMap, Image, Dimension
+from holoviews.operation.element import threshold, vectorfield
+from holoviews.element.comparison import ComparisonTestCase
+
+
+class ElementOperationBackendTest(ComparisonTestCase):
+
+    def setUp(self):
+        self.hmap = HoloMap([(i, Image(np.random.rand(4, 4)))
+                             for i in range(4)])
+
+    def test_operation_sequential(self):
+        processed = threshold(self.hmap, level=0.5)
+        self.assertEqual(processed.keys(), [0, 1, 2, 3])
+        self.assertEqual(processed[3].data, (self.hmap[3].data > 0.5).astype(float))
+
+    def test_operation_threads(self):
+        processed = threshold(self.hmap, level=0.5, backend='threads', processes=2)
+        self.assertEqual(processed, threshold(self.hmap, level=0.5))
+
+    def test_operation_processes(self):
+        processed = threshold(self.hmap, level=0.5, backend='processes', processes=2)
+        self.assertEqual(processed.keys(), [0, 1, 2, 3])
+        self.assertEqual(processed, threshold(self.hmap, level=0.5))
+
+
+class VectorFieldOperationTest(ComparisonTestCase):
+
+    def setUp(self):
+        rs = np.random.RandomState(42)
+        self.radians = Image(rs.rand(20, 20), value_dimensions=[Dimension('a', cyclic=True)])
+        self.lengths = Image(rs.rand(20, 20))
+
+    def test_vectorfield_angles(self):
+        vfield = vectorfield(self.radians, rows=4, cols=5)
+        self.assertEqual(vfield.data.shape, (20, 4))
+        self.assertEqual(vfield.data[:, 2], np.array([self.radians[x, y] for x, y
+                                                      in vfield.data[:, :2]]))
+        self.assertEqual(vfield.data[:, 3], np.ones(20))
+
+    def test_vectorfield_lengths(self):
+        vfield = vectorfield(self.radians * self.lengths, rows=4, cols=5)
+        self.assertEqual(vfield.data[:, 3], np.array([self.lengths[x, y] for x, y
+                                                      in vfield.data[:, :2]]))
+
+
+if __name__ == "__main__":
+    import sys
+    import nose
+    nose.runmodule(argv=[sys.argv[0], "--logging-level", "ERROR"])
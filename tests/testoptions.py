@@ -1,4 +1,7 @@
+import numpy as np
+
 from holoviews.core.options import OptionError, Cycle, Options, OptionTree, Store
+from holoviews.element import Image
 from holoviews.element.comparison import ComparisonTestCase
 
 
@@ -212,6 +215,38 @@ class TestOptionTreeFind(ComparisonTestCase):
         self.assertEqual(self.options.find('Baz.Baz').options('group').options, dict())
 
 
+class TestOptionTreeClosest(ComparisonTestCase):
+
+    def setUp(self):
+        options = OptionTree(groups={'group':  Options()})
+        options.Image = Options('group', kw1='value1')
+        options.Image.Foo = Options('group', kw2='value2')
+        self.options = options
+
+    def test_optiontree_closest(self):
+        closest = self.options.closest(Image(np.zeros((2, 2)), group='Foo'), 'group')
+        self.assertEqual(closest.options, dict(kw1='value1', kw2='value2'))
+
+    def test_optiontree_closest_cached(self):
+        image = Image(np.zeros((2, 2)))
+        closest = self.options.closest(image, 'group')
+        self.assertIs(self.options.closest(image, 'group'), closest)
+
+    def test_optiontree_closest_invalidated(self):
+        image = Image(np.zeros((2, 2)), group='Foo')
+        self.options.closest(image, 'group')
+        self.options.Image.Foo = Options('group', kw3='value3')
+        self.assertEqual(self.options.closest(image, 'group').options,
+                         dict(kw1='value1', kw2='value2', kw3='value3'))
+
+    def test_optiontree_closest_invalidated_new_node(self):
+        image = Image(np.zeros((2, 2)), group='Bar')
+        self.options.closest(image, 'group')
+        self.options.Image.Bar = Options('group', kw4='value4')
+        self.assertEqual(self.options.closest(image, 'group').options,
+                         dict(kw1='value1', kw4='value4'))
+
+
 
 if __name__ == "__main__":
     import sys
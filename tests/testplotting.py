@@ -0,0 +1,45 @@
+"""
+Unit tests of the frame lookups and streaming of ElementPlots.
+"""
+
+import numpy as np
+
+from holoviews import HoloMap, Image
+from holoviews.core.options import Store
+from holoviews.element.comparison import ComparisonTestCase
+
+
+class ElementPlotStreamTest(ComparisonTestCase):
+
+    def setUp(self):
+        self.images = [Image(np.full((2, 2), i, dtype=float)) for i in range(4)]
+        self.hmap = HoloMap([(i, self.images[i]) for i in range(2)],
+                            key_dimensions=['Time'])
+
+    def test_stream_index_frame(self):
+        plot = Store.defaults[Image](self.hmap, uniform=False)
+        plot()
+        plot.stream(2, self.images[2])
+        self.assertEqual(plot._get_frame(2).data, self.images[2].data)
+
+    def test_stream_index_frame_max_length(self):
+        self.hmap.max_length = 2
+        plot = Store.defaults[Image](self.hmap, uniform=False)
+        plot()
+        for i in [2, 3]:
+            plot.stream(i, self.images[i])
+        self.assertEqual(plot._get_frame(0).data, self.images[2].data)
+        self.assertEqual(plot._get_frame(1).data, self.images[3].data)
+
+    def test_stream_key_frame(self):
+        plot = Store.defaults[Image](self.hmap)
+        plot()
+        plot.stream(2, self.images[2])
+        self.assertEqual(plot._get_frame((2,)).data, self.images[2].data)
+
+
+
+if __name__ == "__main__":
+    import sys
+    import nose
+    nose.runmodule(argv=[sys.argv[0], "--logging-level", "ERROR"])
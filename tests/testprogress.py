@@ -0,0 +1,74 @@
+"""
+Unit tests of the rate limited ProgressBar.
+"""
+
+from holoviews.ipython.widgets import ProgressBar, RunProgress
+from holoviews.element.comparison import ComparisonTestCase
+
+
+class RecordingProgressBar(ProgressBar):
+
+    def __init__(self, **params):
+        super(RecordingProgressBar, self).__init__(**params)
+        self.displayed = []
+
+    def _display(self, percentage):
+        self.displayed.append(percentage)
+
+
+class ProgressBarTest(ComparisonTestCase):
+
+    def test_progress_coalesced(self):
+        progress = RecordingProgressBar(refresh_rate=5)
+        for i in range(10000):
+            progress(i / 100.)
+        progress(100)
+        self.assertEqual(len(progress.displayed) < 100, True)
+        self.assertEqual(progress.displayed[-1], 100)
+
+    def test_progress_background_displays_pending(self):
+        progress = RecordingProgressBar(refresh_rate=100)
+        progress(10)
+        progress(20)
+        progress.flush()
+        self.assertEqual(progress.displayed[-1], 20)
+        self.assertEqual(progress._thread, None)
+
+    def test_progress_synchronous(self):
+        progress = RecordingProgressBar(background=False, refresh_rate=1)
+        for i in range(100):
+            progress(i)
+        self.assertEqual(progress.displayed, [0])
+
+    def test_progress_unlimited(self):
+        progress = RecordingProgressBar(refresh_rate=0)
+        for i in range(0, 100, 10):
+            progress(i)
+        self.assertEqual(len(progress.displayed), 10)
+
+    def test_progress_percent_range(self):
+        progress = RecordingProgressBar(refresh_rate=0, percent_range=(50, 100))
+        progress(50)
+        self.assertEqual(progress.displayed, [75])
+
+    def test_progress_disabled(self):
+        progress = RecordingProgressBar(display='disabled')
+        progress(50)
+        progress(100)
+        self.assertEqual(progress.displayed, [])
+
+
+class RunProgressTest(ComparisonTestCase):
+
+    def test_run_progress(self):
+        steps = []
+        progress = RunProgress(run_hook=steps.append, interval=1, display='disabled')
+        progress(2.5)
+        self.assertEqual(steps, [1, 1, 0.5])
+
+
+
+if __name__ == "__main__":
+    import sys
+    import nose
+    nose.runmodule(argv=[sys.argv[0], "--logging-level", "ERROR"])
@@ -0,0 +1,173 @@
+"""
+Unit tests of Raster elements and their subclasses.
+"""
+
+import shutil
+import tempfile
+
+import numpy as np
+
+from holoviews import HeatMap, HSV, RGB, Image, Raster, HoloMap
+from holoviews.core import Dimension
+from holoviews.core.util import array_chunks
+from holoviews.operation import colormap
+from holoviews.operation.normalization import raster_normalization
+from holoviews.element.comparison import ComparisonTestCase
+
+
+class HeatMapTest(ComparisonTestCase):
+
+    def setUp(self):
+        self.items = {(i, j): i*10+j for i in range(3) for j in [0.5, 1.5]}
+
+    def test_heatmap_dense_array(self):
+        heatmap = HeatMap(self.items)
+        self.assertEqual(heatmap.data, np.array([[1.5, 11.5, 21.5],
+                                                 [0.5, 10.5, 20.5]]))
+
+    def test_heatmap_dense_keys(self):
+        heatmap = HeatMap(self.items)
+        self.assertEqual(heatmap.dense_keys(), ([0, 1, 2], [0.5, 1.5]))
+
+    def test_heatmap_sparse_missing(self):
+        heatmap = HeatMap({(0, 0): 1, (1, 1): 2})
+        self.assertEqual(heatmap.data, np.array([[np.NaN, 2], [1, np.NaN]]))
+
+    def test_heatmap_columnar(self):
+        xs, ys = np.array([0, 1, 2, 0]), np.array([0.5, 0.5, 1.5, 1.5])
+        heatmap = HeatMap((xs, ys, np.arange(4.)))
+        self.assertEqual(heatmap.data, np.array([[3, np.NaN, 2], [0, 1, np.NaN]]))
+
+    def test_heatmap_columnar_matches_dict(self):
+        keys, values = zip(*sorted(self.items.items()))
+        xs, ys = zip(*keys)
+        columnar = HeatMap((np.array(xs), np.array(ys), np.array(values, dtype=float)))
+        self.assertEqual(columnar.data, HeatMap(self.items).data)
+
+    def test_heatmap_categorical(self):
+        dim = Dimension('Category', values=['b', 'a'])
+        heatmap = HeatMap({('b', 1): 1, ('a', 2): 2}, key_dimensions=[dim, 'y'])
+        self.assertEqual(heatmap.dense_keys(), (['b', 'a'], [1, 2]))
+
+
+class RasterSampleTest(ComparisonTestCase):
+
+    def setUp(self):
+        rs = np.random.RandomState(42)
+        self.image = Image(rs.rand(20, 20), bounds=(-1, -2, 2, 1))
+        self.raster = Raster(rs.rand(7, 9))
+        self.xs, self.ys = rs.uniform(-0.999, 1.999, 50), rs.uniform(-1.999, 0.999, 50)
+
+    def test_image_sample_points(self):
+        self.assertEqual(self.image.sample_points(self.xs, self.ys),
+                         np.array([self.image[x, y] for x, y in zip(self.xs, self.ys)]))
+
+    def test_raster_sample_points(self):
+        xs, ys = self.xs * 4, self.ys * 4
+        self.assertEqual(self.raster.sample_points(xs, ys),
+                         np.array([self.raster.data[self.raster._coord2matrix((x, y))]
+                                   for x, y in zip(xs, ys)]))
+
+    def test_image_closest_list(self):
+        coords = list(zip(self.xs, self.ys))
+        self.assertEqual(self.image.closest(coords),
+                         [self.image.closest(c) for c in coords])
+
+    def test_image_sample(self):
+        table = self.image.sample([(0, 0), (1, -1)])
+        self.assertEqual(table.keys(), [(0, 0), (1, -1)])
+        self.assertEqual(table.values()[1], self.image[1, -1])
+
+    def test_image_sample_bilinear(self):
+        image = Image(np.arange(16.).reshape(4, 4), bounds=(0, 0, 4, 4))
+        values = image.sample_points([0.5, 1, 1.5, 1, 0], [3.5, 3.5, 3.5, 3, 4],
+                                     method='bilinear')
+        self.assertEqual(values, np.array([0, 0.5, 1, 2.5, 0]))
+
+    def test_raster_sample_bilinear(self):
+        raster = Raster(np.arange(6.).reshape(3, 2), extents=(0, 0, 2, 1))
+        self.assertEqual(raster.sample_points([0, 0.5, 2], [0.5, 0, 1], method='bilinear'),
+                         np.array([0.5, 1, 5]))
+
+    def test_rgb_sample_bilinear(self):
+        rgb = RGB(np.random.rand(4, 4, 3))
+        self.assertEqual(rgb.sample_points([0.1, 0.2], [0.1, 0.2], method='bilinear').shape,
+                         (2, 3))
+
+    def test_sample_invalid_method(self):
+        with self.assertRaises(ValueError):
+            self.image.sample_points(self.xs, self.ys, method='cubic')
+
+    def test_holomap_sample(self):
+        hmap = HoloMap([(i, self.image.clone(self.image.data * i)) for i in range(3)])
+        table = hmap.sample((2, 2))
+        self.assertEqual(len(table), 12)
+
+    def test_holomap_sample_shared(self):
+        hmap = HoloMap([(i, self.image.clone(self.image.data * i)) for i in range(3)])
+        samples = [(0, 0), (1, -1)]
+        table = hmap.sample(samples)
+        self.assertEqual(table.data, hmap.clone([(k, v.sample(samples)) for k, v in
+                                                 hmap.items()]).table().reindex().data)
+
+
+class MemmapRasterTest(ComparisonTestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.array = np.random.RandomState(42).rand(40, 40) * 4
+        self.memmap = np.memmap(tempfile.mktemp(dir=self.tmpdir), dtype=np.float64,
+                                mode='w+', shape=self.array.shape)
+        self.memmap[:] = self.array
+        self.image = Image(self.memmap)
+
+    def tearDown(self):
+        del self.memmap, self.image
+        shutil.rmtree(self.tmpdir)
+
+    def test_array_chunks(self):
+        chunks = list(array_chunks(self.array, chunk_bytes=40*8*16))
+        self.assertEqual([(c.start, c.stop) for c in chunks], [(0, 16), (16, 32), (32, 40)])
+
+    def test_array_chunks_output_itemsize(self):
+        data = self.array.astype(np.uint8)
+        chunks = list(array_chunks(data, chunk_bytes=40*32*10, itemsize=32))
+        self.assertEqual([(c.start, c.stop) for c in chunks], [(0, 10), (10, 20), (20, 30), (30, 40)])
+
+    def test_memmap_image_slice(self):
+        self.assertEqual(isinstance(self.image[-0.25:0.25, -0.25:0.25].data, np.memmap), True)
+
+    def test_memmap_image_range(self):
+        self.assertEqual(self.image.range('z'), (self.array.min(), self.array.max()))
+
+    def test_rgb_channel_range(self):
+        rgb = RGB(np.random.rand(4, 4, 3) * 2, value_dimensions=['R', 'G', 'B'])
+        self.assertEqual(rgb.range('G'), (rgb.data[:, :, 1].min(), rgb.data[:, :, 1].max()))
+
+    def test_memmap_normalization(self):
+        normalized = raster_normalization(self.image, ranges={'z': (0, 4)})
+        self.assertEqual(isinstance(normalized.data, np.memmap), True)
+        self.assertEqual(np.asarray(normalized.data), self.array / 4.)
+
+    def test_memmap_colormap(self):
+        rgb = colormap(raster_normalization(self.image, ranges={'z': (0, 4)}))
+        self.assertEqual(isinstance(rgb.data, np.memmap), True)
+        self.assertEqual(np.asarray(rgb.data),
+                         colormap(Image(self.array / 4.)).data)
+
+
+class HSVTest(ComparisonTestCase):
+
+    def test_hsv_rgb_conversion(self):
+        hsv = HSV(np.array([[[0, 1, 1], [1/3., 1, 0.5], [0.5, 0, 1]]]))
+        self.assertEqual(hsv.rgb.data, np.array([[[1, 0, 0], [0, 0.5, 0], [1, 1, 1]]]))
+
+    def test_hsv_rgb_conversion_alpha(self):
+        data = np.random.rand(4, 5, 4)
+        self.assertEqual(HSV(data).rgb.data[:, :, 3], data[:, :, 3])
+
+
+if __name__ == "__main__":
+    import sys
+    import nose
+    nose.runmodule(argv=[sys.argv[0], "--logging-level", "ERROR"])
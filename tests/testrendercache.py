@@ -0,0 +1,86 @@
+"""
+Unit tests of the RenderCache used by the IPython display hooks.
+"""
+
+import shutil
+import tempfile
+import threading
+
+import numpy as np
+
+from holoviews import Image, HoloMap, Curve
+from holoviews.ipython.cache import RenderCache
+from holoviews.element.comparison import ComparisonTestCase
+
+
+class RenderCacheTest(ComparisonTestCase):
+
+    def setUp(self):
+        self.cache = RenderCache()
+        self.image = Image(np.arange(9.).reshape(3, 3))
+
+    def test_digest_deterministic(self):
+        self.assertEqual(self.cache.digest(self.image, 72),
+                         self.cache.digest(self.image.clone(), 72))
+
+    def test_digest_data_changed(self):
+        modified = self.image.clone(self.image.data * 2)
+        self.assertNotEqual(self.cache.digest(self.image),
+                            self.cache.digest(modified))
+
+    def test_digest_settings_changed(self):
+        self.assertNotEqual(self.cache.digest(self.image, 72),
+                            self.cache.digest(self.image, 144))
+
+    def test_digest_holomap_keys(self):
+        hmap1 = HoloMap({0: Curve([(0, 1)]), 1: Curve([(0, 2)])})
+        hmap2 = HoloMap({0: Curve([(0, 1)]), 2: Curve([(0, 2)])})
+        self.assertNotEqual(self.cache.digest(hmap1), self.cache.digest(hmap2))
+
+    def test_cache_lru_eviction(self):
+        self.cache.max_entries = 2
+        self.cache.set('a', 'A')
+        self.cache.set('b', 'B')
+        self.assertEqual(self.cache.get('a'), 'A')
+        self.cache.set('c', 'C')
+        self.assertEqual('b' in self.cache, False)
+        self.assertEqual(len(self.cache), 2)
+
+    def test_cache_size_bound(self):
+        self.cache.max_size = 5
+        self.cache.set('a', 'AAA')
+        self.cache.set('b', 'BBB')
+        self.assertEqual(self.cache.get('a'), None)
+        self.assertEqual(self.cache.get('b'), 'BBB')
+
+    def test_cache_concurrent(self):
+        self.cache.max_entries = 10
+        def fill(prefix):
+            for i in range(2000):
+                self.cache.set('%s%d' % (prefix, i), 'X' * (i % 7 + 1))
+                self.cache.get('%s%d' % (prefix, i // 2))
+        threads = [threading.Thread(target=fill, args=(p,)) for p in 'abcd']
+        for thread in threads: thread.start()
+        for thread in threads: thread.join()
+        self.assertEqual(len(self.cache), 10)
+        self.assertEqual(self.cache._size, sum(len(v) for v in self.cache._entries.values()))
+
+    def test_cache_disabled(self):
+        self.cache.enabled = False
+        self.cache.set('a', 'A')
+        self.assertEqual(self.cache.digest(self.image), None)
+        self.assertEqual(self.cache.get('a'), None)
+
+    def test_cache_directory(self):
+        cache_dir = tempfile.mkdtemp()
+        try:
+            RenderCache(cache_dir=cache_dir).set('a', 'A')
+            self.assertEqual(RenderCache(cache_dir=cache_dir).get('a'), 'A')
+        finally:
+            shutil.rmtree(cache_dir)
+
+
+if __name__ == "__main__":
+    import sys
+    import nose
+    nose.runmodule(argv=[sys.argv[0], "--logging-level", "ERROR"])
@@ -0,0 +1,98 @@
+"""
+Unit tests of Table elements, in particular the columnar storage
+of Tables constructed from NumPy structured arrays.
+"""
+
+import numpy as np
+
+from holoviews import Table, ItemTable, HoloMap, Curve
+from holoviews.element.comparison import ComparisonTestCase
+
+
+class ColumnarTableTest(ComparisonTestCase):
+
+    def setUp(self):
+        xs, ys = np.arange(12) % 4, np.arange(12) // 4
+        self.columns = np.rec.fromarrays([xs, ys, xs*1.5, ys*2.0],
+                                         names=['x', 'y', 'v1', 'v2'])
+        self.table = Table(self.columns[::-1], key_dimensions=['x', 'y'],
+                           value_dimensions=['v1', 'v2'])
+
+    def test_columnar_table_sorted(self):
+        self.assertEqual(self.table.keys()[:3], [(0, 0), (0, 1), (0, 2)])
+        self.assertEqual(len(self.table), 12)
+
+    def test_columnar_table_duplicate_keys(self):
+        columns = np.rec.fromarrays([[1, 0, 1], [1., 2., 3.]], names=['x', 'y'])
+        table = Table(columns)
+        self.assertEqual(table.keys(), [0, 1])
+        self.assertEqual(list(table.dimension_values('y')), [2., 3.])
+
+    def test_columnar_table_infer_dimensions(self):
+        columns = np.rec.fromarrays([[0, 1], [1., 2.]], names=['a', 'b'])
+        table = Table(columns)
+        self.assertEqual(table._cached_index_names, ['a'])
+        self.assertEqual(table._cached_value_names, ['b'])
+
+    def test_columnar_table_dimension_values(self):
+        self.assertEqual(self.table.dimension_values('v2')[:3], np.array([0., 2., 4.]))
+
+    def test_columnar_table_index(self):
+        self.assertEqual(self.table[2, 1, 'v1'].data['v1'], 3.)
+
+    def test_columnar_table_select(self):
+        selection = self.table.select(x=[1, 3], y=(1, 3))
+        self.assertEqual(selection.keys(), [(1, 1), (1, 2), (3, 1), (3, 2)])
+        self.assertEqual(selection._columns is None, False)
+
+    def test_columnar_table_value_select(self):
+        selection = self.table.select(value='v2')
+        self.assertEqual(selection._cached_value_names, ['v2'])
+        self.assertEqual(selection.values()[1], np.array([2.]))
+
+    def test_columnar_table_sample(self):
+        sampled = self.table.sample([(3, 2), (0, 1)])
+        self.assertEqual(sampled.keys(), [(0, 1), (3, 2)])
+
+    def test_columnar_table_reduce(self):
+        reduced = self.table.reduce(['y'], np.mean)
+        self.assertEqual(reduced.keys(), [0, 1, 2, 3])
+        self.assertEqual(reduced.values()[1], np.array([1.5, 2.]))
+
+    def test_columnar_table_reduce_all(self):
+        reduced = self.table.reduce(['x', 'y'], np.sum)
+        self.assertEqual(isinstance(reduced, ItemTable), True)
+        self.assertEqual(reduced.data['v1'], 27.)
+
+    def test_columnar_table_curve_conversion(self):
+        curves = self.table.to.curve('x', 'v1')
+        self.assertEqual(isinstance(curves, HoloMap), True)
+        self.assertEqual(isinstance(curves.last, Curve), True)
+        self.assertEqual(curves.last.data, np.array([[0, 0.], [1, 1.5], [2, 3.], [3, 4.5]]))
+
+    def test_columnar_table_setitem(self):
+        self.table[(5, 5)] = (1., 2.)
+        self.assertEqual(self.table._columns, None)
+        self.assertEqual(self.table.last_key, (5, 5))
+        self.assertEqual(len(self.table), 13)
+
+    def test_columnar_table_matches_items(self):
+        items = Table(list(self.table.data.items()), key_dimensions=['x', 'y'],
+                      value_dimensions=['v1', 'v2'])
+        self.assertEqual(items, self.table)
+
+
+class ItemTableReduceTest(ComparisonTestCase):
+
+    def test_table_reduce(self):
+        table = Table([((i, j), i*j) for i in range(3) for j in range(2)],
+                      key_dimensions=['i', 'j'])
+        reduced = table.reduce(['j'], np.sum)
+        self.assertEqual(reduced.keys(), [0, 1, 2])
+        self.assertEqual(list(reduced.dimension_values('Data')), [0, 1, 2])
+
+
+if __name__ == "__main__":
+    import sys
+    import nose
+    nose.runmodule(argv=[sys.argv[0], "--logging-level", "ERROR"])
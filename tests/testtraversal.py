@@ -0,0 +1,50 @@
+"""
+Unit tests of the traversal utilities for composite objects.
+"""
+
+import numpy as np
+
+from holoviews import HoloMap, Image, Dimension
+from holoviews.core.traversal import unique_dimkeys, bijective
+from holoviews.element.comparison import ComparisonTestCase
+
+
+class UniqueDimkeysTest(ComparisonTestCase):
+
+    def setUp(self):
+        self.image = Image(np.zeros((2, 2)))
+
+    def test_unique_dimkeys_union(self):
+        hmap1 = HoloMap([(k, self.image) for k in [2, 0]], key_dimensions=['a'])
+        hmap2 = HoloMap([(k, self.image) for k in [1, 2]], key_dimensions=['a'])
+        dims, keys = unique_dimkeys(hmap1 + hmap2)
+        self.assertEqual([d.name for d in dims], ['a'])
+        self.assertEqual(keys, [(0,), (1,), (2,)])
+
+    def test_unique_dimkeys_partial_dimensions(self):
+        hmap1 = HoloMap([((a, b), self.image) for a in range(2) for b in range(2)],
+                        key_dimensions=['a', 'b'])
+        hmap2 = HoloMap([(a, self.image) for a in range(3)], key_dimensions=['a'])
+        dims, keys = unique_dimkeys(hmap1 + hmap2)
+        self.assertEqual([d.name for d in dims], ['a', 'b'])
+        self.assertEqual(keys, [(0, 0), (0, 1), (1, 0), (1, 1), (2, None)])
+
+    def test_unique_dimkeys_categorical(self):
+        dim = Dimension('a', values=['z', 'y'])
+        hmap = HoloMap([(k, self.image) for k in ['y', 'z']], key_dimensions=[dim])
+        self.assertEqual(unique_dimkeys(hmap)[1], [('z',), ('y',)])
+
+    def test_unique_dimkeys_element(self):
+        dims, keys = unique_dimkeys(self.image)
+        self.assertEqual([d.name for d in dims], ['Frame'])
+        self.assertEqual(keys, [(0,)])
+
+    def test_bijective(self):
+        self.assertEqual(bijective([(0, 0), (1, 1)]), True)
+        self.assertEqual(bijective([(0, 0), (0, 1)]), False)
+
+
+if __name__ == "__main__":
+    import sys
+    import nose
+    nose.runmodule(argv=[sys.argv[0], "--logging-level", "ERROR"])
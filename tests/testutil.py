@@ -0,0 +1,97 @@
+"""
+Unit tests of the utility functions in holoviews.core.util.
+"""
+
+import colorsys
+
+import numpy as np
+
+from holoviews.core.util import min_distance, hsv_to_rgb, rgb_to_hsv
+from holoviews.element.comparison import ComparisonTestCase
+
+
+class MinDistanceTest(ComparisonTestCase):
+
+    def pairwise_min(self, xs, ys):
+        points = xs + 1j*ys
+        distances = abs(points[:, np.newaxis] - points[np.newaxis, :])
+        np.fill_diagonal(distances, np.inf)
+        return distances.min()
+
+    def test_min_distance_single_point(self):
+        self.assertEqual(min_distance([0], [0]), np.inf)
+
+    def test_min_distance_duplicate_points(self):
+        self.assertEqual(min_distance([0, 1, 0], [0, 1, 0]), 0)
+
+    def test_min_distance_regular_grid(self):
+        xs, ys = np.meshgrid(np.linspace(0, 5, 11), np.linspace(0, 4, 5))
+        self.assertEqual(min_distance(xs.flat, ys.flat), 0.5)
+
+    def test_min_distance_irregular_grid(self):
+        xs, ys = np.meshgrid([0, 1, 1.25, 3], [0, 0.5, 2])
+        self.assertEqual(min_distance(xs.flat, ys.flat), 0.25)
+
+    def test_min_distance_random(self):
+        xs, ys = np.random.RandomState(42).rand(2, 500)
+        self.assertEqual(min_distance(xs, ys), self.pairwise_min(xs, ys))
+
+    def test_min_distance_clustered(self):
+        xs, ys = np.random.RandomState(42).rand(2, 100)**4
+        xs, ys = np.append(xs, 100), np.append(ys, -100)
+        self.assertEqual(min_distance(xs, ys), self.pairwise_min(xs, ys))
+
+    def test_min_distance_cluster_outlier(self):
+        xs, ys = np.random.RandomState(42).randn(2, 2000) * 1e-3
+        xs, ys = np.append(xs, 1e3), np.append(ys, 1e3)
+        self.assertEqual(min_distance(xs, ys), self.pairwise_min(xs, ys))
+
+    def test_min_distance_shared_columns(self):
+        rs = np.random.RandomState(42)
+        xs, ys = rs.randint(0, 3, 1000).astype(float), rs.rand(1000)
+        self.assertEqual(min_distance(xs, ys), self.pairwise_min(xs, ys))
+
+
+class ColorConversionTest(ComparisonTestCase):
+
+    def setUp(self):
+        channels = np.random.RandomState(42).rand(3, 20, 30)
+        channels[:, :5] = channels[:, :5].round(1)
+        channels[1, :2] = 0
+        channels[:, -1] = channels[0, -1]
+        self.channels = channels
+
+    def colorsys_convert(self, fn):
+        return np.dstack(np.vectorize(fn)(*self.channels))
+
+    def test_hsv_to_rgb_colorsys_parity(self):
+        self.assertEqual(np.dstack(hsv_to_rgb(*self.channels)),
+                         self.colorsys_convert(colorsys.hsv_to_rgb))
+
+    def test_rgb_to_hsv_colorsys_parity(self):
+        self.assertEqual(np.dstack(rgb_to_hsv(*self.channels)),
+                         self.colorsys_convert(colorsys.rgb_to_hsv))
+
+    def test_hsv_to_rgb_float32(self):
+        rgb = hsv_to_rgb(*self.channels.astype(np.float32))
+        self.assertEqual(rgb[0].dtype, np.dtype(np.float32))
+
+    def test_hsv_to_rgb_inplace(self):
+        data = np.dstack(self.channels)
+        hsv_to_rgb(data[..., 0], data[..., 1], data[..., 2], out=data)
+        self.assertEqual(data, self.colorsys_convert(colorsys.hsv_to_rgb))
+
+    def test_rgb_to_hsv_round_trip(self):
+        rgb = np.dstack(hsv_to_rgb(*self.channels))
+        hsv = np.dstack(rgb_to_hsv(rgb[..., 0], rgb[..., 1], rgb[..., 2]))
+        self.assertEqual(np.dstack(hsv_to_rgb(hsv[..., 0], hsv[..., 1], hsv[..., 2])), rgb)
+
+    def test_hsv_to_rgb_invalid_out(self):
+        with self.assertRaises(ValueError):
+            hsv_to_rgb(*self.channels, out=np.empty((20, 30, 2)))
+
+
+if __name__ == "__main__":
+    import sys
+    import nose
+    nose.runmodule(argv=[sys.argv[0], "--logging-level", "ERROR"])
@@ -0,0 +1,136 @@
+"""
+Unit tests of the frame lookups and on demand rendering used by the
+IPython widgets.
+"""
+
+import multiprocessing
+import threading
+
+import numpy as np
+
+from holoviews import HoloMap, Image
+from holoviews.core.options import Store
+from holoviews.ipython.widgets import NdWidget, FramePrefetcher
+from holoviews.element.comparison import ComparisonTestCase
+
+
+class NdWidgetTest(ComparisonTestCase):
+
+    def setUp(self):
+        hmap = HoloMap([((a, b), Image(np.random.rand(2, 2)))
+                        for a in range(4) for b in 'xyz'],
+                       key_dimensions=['A', 'B'])
+        self.widget = NdWidget(Store.defaults[Image](hmap))
+
+    def test_key_index(self):
+        keys = self.widget.keys
+        self.assertEqual([self.widget._key_index[k] for k in keys],
+                         list(range(len(keys))))
+
+    def test_neighbours(self):
+        idx = self.widget._key_index[(1, 'y')]
+        neighbours = [self.widget.keys[i] for i in self.widget._neighbours(idx, 2)]
+        self.assertEqual(neighbours, [(2, 'y'), (0, 'y'), (1, 'z'), (1, 'x'), (3, 'y')])
+
+    def test_render_frames_sequential(self):
+        frames = dict(self.widget._render_frames())
+        self.assertEqual(sorted(frames), list(range(len(self.widget.keys))))
+
+    def test_render_frames_consumed_by_thread(self):
+        self.widget.processes = 2
+        frames, rendered = self.widget._render_frames(), {}
+        thread = threading.Thread(target=lambda: rendered.update(frames))
+        thread.start()
+        thread.join(60)
+        self.assertEqual(sorted(rendered), list(range(len(self.widget.keys))))
+        self.assertEqual(rendered[3], self.widget._plot_figure(3))
+
+    def test_render_frames_reaps_workers(self):
+        self.widget.processes = 2
+        frames = self.widget._render_frames()
+        next(frames)
+        frames.close()
+        self.assertEqual(multiprocessing.active_children(), [])
+
+
+class FramePrefetcherTest(ComparisonTestCase):
+
+    def setUp(self):
+        self.rendered = []
+        self.displayed = []
+        self.done = threading.Event()
+
+    def render(self, idx):
+        self.rendered.append(idx)
+        return 'frame%d' % idx
+
+    def callback(self, idx, frame):
+        self.displayed.append((idx, frame))
+        self.done.set()
+
+    def test_prefetcher_getitem(self):
+        prefetcher = FramePrefetcher(self.render, self.callback)
+        self.assertEqual(prefetcher[3], 'frame3')
+        self.assertEqual(prefetcher[3], 'frame3')
+        self.assertEqual(self.rendered, [3])
+
+    def test_prefetcher_request(self):
+        prefetcher = FramePrefetcher(self.render, self.callback)
+        self.assertEqual(prefetcher.request(1), None)
+        self.done.wait(5)
+        self.assertEqual(self.displayed, [(1, 'frame1')])
+        self.assertEqual(prefetcher.request(1), 'frame1')
+
+    def test_prefetcher_neighbours(self):
+        prefetcher = FramePrefetcher(self.render, self.callback,
+                                     lambda idx: [idx+1, idx-1])
+        prefetcher.request(5)
+        self.done.wait(5)
+        prefetcher.flush()
+        self.assertEqual(sorted(prefetcher.frames.keys()), [4, 5, 6])
+
+    def test_prefetcher_lru(self):
+        prefetcher = FramePrefetcher(self.render, self.callback, cache_size=2)
+        for idx in [0, 1, 0, 2]:
+            prefetcher[idx]
+        self.assertEqual(list(prefetcher.frames.keys()), [0, 2])
+
+    def test_prefetcher_superseded(self):
+        started, release = threading.Event(), threading.Event()
+        def render(idx):
+            started.set()
+            release.wait(5)
+            return self.render(idx)
+        prefetcher = FramePrefetcher(render, self.callback)
+        prefetcher.request(0)
+        started.wait(5)
+        for idx in range(1, 10):
+            prefetcher.request(idx)
+        release.set()
+        self.done.wait(5)
+        prefetcher.flush()
+        self.assertEqual(self.rendered, [0, 9])
+        self.assertEqual(self.displayed, [(9, 'frame9')])
+
+    def test_prefetcher_scheduled(self):
+        scheduled, threads = [], []
+        def render(idx):
+            threads.append(threading.current_thread())
+            return self.render(idx)
+        prefetcher = FramePrefetcher(render, self.callback, lambda idx: [idx+1],
+                                     schedule=scheduled.append)
+        prefetcher.request(0)
+        prefetcher.request(3)
+        self.assertEqual(self.rendered, [])
+        while scheduled:
+            scheduled.pop(0)()
+        self.assertEqual(self.rendered, [3, 4])
+        self.assertEqual(self.displayed, [(3, 'frame3')])
+        self.assertEqual(threads, [threading.current_thread()]*2)
+
+
+
+if __name__ == "__main__":
+    import sys
+    import nose
+    nose.runmodule(argv=[sys.argv[0], "--logging-level", "ERROR"])